@@ -4,19 +4,127 @@ This example demonstrates how to interact with the RAGVersion REST API
 using Python's requests library and httpx for async operations.
 
 Requirements:
-    pip install requests httpx
+    pip install requests "urllib3>=2" "httpx[http2]"
+    pip install orjson  # optional, faster JSON encoding/decoding
 
 Usage:
     1. Start the API server: ragversion serve
-    2. Run this script: python api_client_example.py
+    2. Run this script: python api_client_example.py [--yes]
 """
 
+import argparse
 import asyncio
-from typing import List, Dict, Optional
+import random
+import sys
+from concurrent.futures import ThreadPoolExecutor
+from typing import Any, AsyncIterator, Dict, Iterator, List, Optional, Tuple, Union
 from uuid import UUID
 
 import requests
 import httpx
+from requests.adapters import HTTPAdapter
+from urllib3.util.request import ACCEPT_ENCODING
+from urllib3.util.retry import Retry
+
+try:
+    import orjson
+
+    ORJSON_AVAILABLE = True
+except ImportError:
+    import json
+
+    ORJSON_AVAILABLE = False
+
+
+def _dumps(payload: Any) -> bytes:
+    """Serialize a request body, using orjson when it is installed."""
+    if ORJSON_AVAILABLE:
+        return orjson.dumps(payload)
+    return json.dumps(payload).encode("utf-8")
+
+
+def _loads(content: bytes) -> Any:
+    """Parse a response body, using orjson when it is installed.
+
+    Only worth it for list endpoints; single-object responses are small enough
+    that ``response.json()`` is just as fast.
+    """
+    if ORJSON_AVAILABLE:
+        return orjson.loads(content)
+    return json.loads(content)
+
+
+# Status codes worth retrying: rate limiting and transient upstream failures
+RETRY_STATUSES = [429, 502, 503, 504]
+
+# Methods safe to resend after the server may already have acted on them. POSTs
+# (track, restore) are only retried when the connection was never established.
+RETRY_METHODS = Retry.DEFAULT_ALLOWED_METHODS
+
+
+class RAGVersionAPIError(Exception):
+    """Raised when the API responds with an error status."""
+
+    def __init__(self, status_code: int, body: bytes):
+        self.status_code = status_code
+        self.body = body
+        super().__init__(f"HTTP {status_code}: {body[:500].decode('utf-8', 'replace')}")
+
+
+def _handle(response: Any, list_body: bool = False) -> Any:
+    """Check status and decode a ``requests`` or ``httpx`` response in one pass.
+
+    ``list_body`` marks the array-returning endpoints, the only ones parsed
+    with :func:`_loads`.
+    """
+    content = response.content  # read once
+    if response.status_code >= 400:
+        raise RAGVersionAPIError(response.status_code, content)
+    if not content:
+        return None
+    return _loads(content) if list_body else response.json()
+
+
+def _check_stream(response: requests.Response) -> None:
+    """Raise :class:`RAGVersionAPIError` for an error status before streaming.
+
+    Only an error body is read, so successful bodies still stream unbuffered.
+    """
+    if response.status_code >= 400:
+        raise RAGVersionAPIError(response.status_code, response.content[:500])
+
+
+async def _acheck_stream(response: httpx.Response) -> None:
+    """Async counterpart of :func:`_check_stream` for ``httpx`` streams."""
+    if response.status_code >= 400:
+        raise RAGVersionAPIError(response.status_code, (await response.aread())[:500])
+
+
+USER_AGENT = "ragversion-api-client-example/1.0"
+
+
+def _default_headers(api_key: Optional[str] = None) -> Dict[str, str]:
+    """Headers sent with every request, set once on the session/client."""
+    headers = {
+        "User-Agent": USER_AGENT,
+        "Accept": "application/json",
+        "Content-Type": "application/json",
+    }
+    if api_key:
+        headers["X-API-Key"] = api_key
+    return headers
+
+
+IdLike = Union[UUID, str]
+
+
+def _as_id(value: IdLike) -> str:
+    """Return an ID as a string, skipping the conversion when it already is one.
+
+    IDs read back from API responses are already strings, so paging loops
+    can pass them straight through.
+    """
+    return value if isinstance(value, str) else str(value)
 
 
 class RAGVersionClient:
@@ -30,9 +138,62 @@ class RAGVersionClient:
             api_key: Optional API key for authentication
         """
         self.base_url = base_url.rstrip("/")
-        self.headers = {}
-        if api_key:
-            self.headers["X-API-Key"] = api_key
+
+        # Endpoint URLs are built once here rather than formatted on every call
+        self._url_track_file = self.base_url + "/track/file"
+        self._url_track_files = self.base_url + "/track/files"
+        self._url_track_directory = self.base_url + "/track/directory"
+        self._url_documents = self.base_url + "/documents"
+        self._url_documents_search = self.base_url + "/documents/search"
+        self._url_versions = self.base_url + "/versions/"
+        self._url_document_versions = self.base_url + "/versions/document/"
+        self._url_restore = self.base_url + "/versions/restore"
+        self._url_statistics = self.base_url + "/statistics"
+        self._url_document_statistics = self.base_url + "/statistics/document/"
+        self._url_health = self.base_url + "/health"
+
+        # Reuse one session so every call rides a pooled keep-alive connection.
+        # Static headers live on the session, so nothing is merged per request.
+        self._session = requests.Session()
+        self._session.headers.update(_default_headers(api_key))
+        # Only the encodings this urllib3 install can decode (br/zstd need their
+        # extras); an undecodable body would come back as raw compressed bytes
+        self._session.headers["Accept-Encoding"] = ACCEPT_ENCODING
+        # Retry transient failures with exponential backoff + jitter (urllib3 >= 2.0).
+        # Read and status retries apply to RETRY_METHODS only; connect errors are
+        # retried for every method. Once status retries run out the last response
+        # is returned, so _handle raises RAGVersionAPIError rather than RetryError.
+        retry = Retry(
+            total=5,
+            connect=3,
+            read=3,
+            status=5,
+            backoff_factor=0.3,
+            backoff_jitter=0.3,
+            status_forcelist=RETRY_STATUSES,
+            allowed_methods=RETRY_METHODS,
+            raise_on_status=False,
+            respect_retry_after_header=True,
+        )
+        adapter = HTTPAdapter(pool_connections=10, pool_maxsize=20, max_retries=retry)
+        self._session.mount("http://", adapter)
+        self._session.mount("https://", adapter)
+
+    def close(self) -> None:
+        """Close the underlying HTTP session."""
+        self._session.close()
+
+    def __enter__(self) -> "RAGVersionClient":
+        return self
+
+    def __exit__(self, exc_type, exc_val, exc_tb) -> None:
+        self.close()
+
+    def _get(self, url: str, list_body: bool = False, **kwargs: Any) -> Any:
+        return _handle(self._session.get(url, **kwargs), list_body)
+
+    def _post(self, url: str, list_body: bool = False, **kwargs: Any) -> Any:
+        return _handle(self._session.post(url, **kwargs), list_body)
 
     def track_file(self, file_path: str, metadata: Optional[Dict] = None) -> Dict:
         """Track a single file.
@@ -44,13 +205,25 @@ class RAGVersionClient:
         Returns:
             ChangeEvent dictionary
         """
-        response = requests.post(
-            f"{self.base_url}/track/file",
-            json={"file_path": file_path, "metadata": metadata or {}},
-            headers=self.headers,
+        return self._post(
+            self._url_track_file,
+            data=_dumps({"file_path": file_path, "metadata": metadata or {}}),
+        )
+
+    def track_files(self, items: List[Dict]) -> List[Dict]:
+        """Track several files in a single request.
+
+        Args:
+            items: List of {"file_path": ..., "metadata": ...} dictionaries
+
+        Returns:
+            List of per-item results, each with its own ``status`` code
+        """
+        return self._post(
+            self._url_track_files,
+            list_body=True,
+            data=_dumps({"items": items}),
         )
-        response.raise_for_status()
-        return response.json()
 
     def track_directory(
         self,
@@ -72,54 +245,104 @@ class RAGVersionClient:
         Returns:
             BatchResult dictionary
         """
-        response = requests.post(
-            f"{self.base_url}/track/directory",
-            json={
-                "dir_path": dir_path,
-                "patterns": patterns or ["*"],
-                "recursive": recursive,
-                "max_workers": max_workers,
-                "metadata": metadata or {},
-            },
-            headers=self.headers,
+        return self._post(
+            self._url_track_directory,
+            data=_dumps(
+                {
+                    "dir_path": dir_path,
+                    "patterns": patterns or ["*"],
+                    "recursive": recursive,
+                    "max_workers": max_workers,
+                    "metadata": metadata or {},
+                }
+            ),
         )
-        response.raise_for_status()
-        return response.json()
 
-    def list_documents(self, limit: int = 100, offset: int = 0, order_by: str = "updated_at") -> List[Dict]:
+    def track_directory_stream(
+        self,
+        dir_path: str,
+        patterns: Optional[List[str]] = None,
+        recursive: bool = True,
+        max_workers: int = 4,
+        metadata: Optional[Dict] = None,
+    ) -> Iterator[Dict]:
+        """Track a directory, yielding results as the server produces them.
+
+        Unlike :meth:`track_directory`, the full BatchResult is never buffered;
+        memory stays constant however many files the directory holds.
+
+        Yields:
+            ``{"_type": "event", ...}`` per changed file, ``{"_type": "error", ...}``
+            per failed file, and a final ``{"_type": "summary", ...}``
+        """
+        with self._session.post(
+            self._url_track_directory + "/stream",
+            data=_dumps(
+                {
+                    "dir_path": dir_path,
+                    "patterns": patterns or ["*"],
+                    "recursive": recursive,
+                    "max_workers": max_workers,
+                    "metadata": metadata or {},
+                }
+            ),
+            headers={"Accept": "application/x-ndjson"},
+            stream=True,
+        ) as response:
+            _check_stream(response)
+            for line in response.iter_lines():
+                if line:
+                    yield _loads(line)
+
+    def list_documents(
+        self, limit: int = 100, cursor: Optional[str] = None, order_by: str = "updated_at"
+    ) -> Dict:
         """List tracked documents.
 
         Args:
             limit: Number of results
-            offset: Pagination offset
+            cursor: ``next_cursor`` from the previous page
             order_by: Sort field
 
         Returns:
-            List of Document dictionaries
+            Page dictionary with ``items`` and ``next_cursor``
         """
-        response = requests.get(
-            f"{self.base_url}/documents",
-            params={"limit": limit, "offset": offset, "order_by": order_by},
-            headers=self.headers,
-        )
-        response.raise_for_status()
-        return response.json()
+        params = {"limit": limit, "order_by": order_by}
+        if cursor:
+            params["cursor"] = cursor
+        return self._get(self._url_documents, list_body=True, params=params)
 
-    def get_document(self, document_id: UUID) -> Dict:
+    def get_document(self, document_id: IdLike) -> Dict:
         """Get document by ID.
 
         Args:
-            document_id: Document UUID
+            document_id: Document UUID (``UUID`` or string)
 
         Returns:
             Document dictionary
         """
-        response = requests.get(
-            f"{self.base_url}/documents/{document_id}",
-            headers=self.headers,
+        return self._get(self._url_documents + "/" + _as_id(document_id))
+
+    def get_document_with_versions(
+        self,
+        document_id: IdLike,
+        include: Tuple[str, ...] = ("versions", "latest_diff"),
+        version_limit: int = 10,
+    ) -> Dict:
+        """Get a document with its versions and latest diff in one round-trip.
+
+        Args:
+            document_id: Document UUID (``UUID`` or string)
+            include: Extras to include ("versions", "latest_diff")
+            version_limit: Number of versions to include
+
+        Returns:
+            Dictionary with ``document``, ``versions`` and ``latest_diff``
+        """
+        return self._get(
+            self._url_documents + "/" + _as_id(document_id) + "/detail",
+            params={"include": ",".join(include), "version_limit": version_limit},
         )
-        response.raise_for_status()
-        return response.json()
 
     def search_documents(self, file_type: Optional[str] = None, metadata_filter: Optional[Dict] = None) -> List[Dict]:
         """Search documents.
@@ -131,105 +354,108 @@ class RAGVersionClient:
         Returns:
             List of Document dictionaries
         """
-        response = requests.post(
-            f"{self.base_url}/documents/search",
-            json={"file_type": file_type, "metadata_filter": metadata_filter},
-            headers=self.headers,
+        return self._post(
+            self._url_documents_search,
+            list_body=True,
+            data=_dumps({"file_type": file_type, "metadata_filter": metadata_filter}),
         )
-        response.raise_for_status()
-        return response.json()
 
-    def list_versions(self, document_id: UUID, limit: int = 100, offset: int = 0) -> List[Dict]:
+    def list_versions(
+        self, document_id: IdLike, limit: int = 100, cursor: Optional[str] = None
+    ) -> Dict:
         """List versions for a document.
 
         Args:
-            document_id: Document UUID
+            document_id: Document UUID (``UUID`` or string)
             limit: Number of results
-            offset: Pagination offset
+            cursor: ``next_cursor`` from the previous page
 
         Returns:
-            List of Version dictionaries
+            Page dictionary with ``items`` and ``next_cursor``
         """
-        response = requests.get(
-            f"{self.base_url}/versions/document/{document_id}",
-            params={"limit": limit, "offset": offset},
-            headers=self.headers,
+        params = {"limit": limit}
+        if cursor:
+            params["cursor"] = cursor
+        return self._get(
+            self._url_document_versions + _as_id(document_id),
+            list_body=True,
+            params=params,
         )
-        response.raise_for_status()
-        return response.json()
 
-    def get_latest_version(self, document_id: UUID) -> Dict:
+    def get_latest_version(self, document_id: IdLike) -> Dict:
         """Get latest version of a document.
 
         Args:
-            document_id: Document UUID
+            document_id: Document UUID (``UUID`` or string)
 
         Returns:
             Version dictionary
         """
-        response = requests.get(
-            f"{self.base_url}/versions/document/{document_id}/latest",
-            headers=self.headers,
-        )
-        response.raise_for_status()
-        return response.json()
+        return self._get(self._url_document_versions + _as_id(document_id) + "/latest")
 
-    def get_version_content(self, version_id: UUID) -> str:
+    def get_version_content(self, version_id: IdLike) -> str:
         """Get version content.
 
         Args:
-            version_id: Version UUID
+            version_id: Version UUID (``UUID`` or string)
 
         Returns:
             Version content as string
         """
-        response = requests.get(
-            f"{self.base_url}/versions/{version_id}/content",
-            headers=self.headers,
-        )
-        response.raise_for_status()
-        return response.text
+        return b"".join(self.iter_version_content(version_id)).decode("utf-8")
+
+    def iter_version_content(self, version_id: IdLike, chunk_size: int = 65536) -> Iterator[bytes]:
+        """Stream version content without buffering the whole body.
+
+        Args:
+            version_id: Version UUID (``UUID`` or string)
+            chunk_size: Bytes per chunk
+
+        Yields:
+            Raw content chunks
+        """
+        with self._session.get(
+            self._url_versions + _as_id(version_id) + "/content", stream=True
+        ) as response:
+            _check_stream(response)
+            yield from response.iter_content(chunk_size=chunk_size, decode_unicode=False)
 
-    def get_diff(self, document_id: UUID, from_version: int, to_version: int) -> Dict:
+    def get_diff(self, document_id: IdLike, from_version: int, to_version: int) -> Dict:
         """Get diff between two versions.
 
         Args:
-            document_id: Document UUID
+            document_id: Document UUID (``UUID`` or string)
             from_version: Starting version number
             to_version: Ending version number
 
         Returns:
             DiffResult dictionary
         """
-        response = requests.get(
-            f"{self.base_url}/versions/document/{document_id}/diff/{from_version}/{to_version}",
-            headers=self.headers,
+        return self._get(
+            f"{self._url_document_versions}{_as_id(document_id)}/diff/{from_version}/{to_version}"
         )
-        response.raise_for_status()
-        return response.json()
 
-    def restore_version(self, document_id: UUID, version_number: int, target_path: Optional[str] = None) -> Dict:
+    def restore_version(self, document_id: IdLike, version_number: int, target_path: Optional[str] = None) -> Dict:
         """Restore a version.
 
         Args:
-            document_id: Document UUID
+            document_id: Document UUID (``UUID`` or string)
             version_number: Version number to restore
             target_path: Optional target path
 
         Returns:
             ChangeEvent dictionary
         """
-        response = requests.post(
-            f"{self.base_url}/versions/restore",
-            json={
-                "document_id": str(document_id),
-                "version_number": version_number,
-                "target_path": target_path,
-            },
-            headers=self.headers,
+        return self._post(
+            self._url_restore,
+            data=_dumps(
+                {
+                    "document_id": _as_id(document_id),
+                    "version_number": version_number,
+                    "target_path": target_path,
+                }
+            ),
         )
-        response.raise_for_status()
-        return response.json()
 
     def get_statistics(self, days: int = 30) -> Dict:
         """Get storage statistics.
@@ -240,29 +466,21 @@ class RAGVersionClient:
         Returns:
             StorageStatistics dictionary
         """
-        response = requests.get(
-            f"{self.base_url}/statistics",
+        return self._get(
+            self._url_statistics,
             params={"days": days},
-            headers=self.headers,
         )
-        response.raise_for_status()
-        return response.json()
 
-    def get_document_statistics(self, document_id: UUID) -> Dict:
+    def get_document_statistics(self, document_id: IdLike) -> Dict:
         """Get document statistics.
 
         Args:
-            document_id: Document UUID
+            document_id: Document UUID (``UUID`` or string)
 
         Returns:
             DocumentStatistics dictionary
         """
-        response = requests.get(
-            f"{self.base_url}/statistics/document/{document_id}",
-            headers=self.headers,
-        )
-        response.raise_for_status()
-        return response.json()
+        return self._get(self._url_document_statistics + _as_id(document_id))
 
     def health_check(self) -> Dict:
         """Check API health.
@@ -270,14 +488,32 @@ class RAGVersionClient:
         Returns:
             HealthCheck dictionary
         """
-        response = requests.get(f"{self.base_url}/health")
-        response.raise_for_status()
-        return response.json()
+        return self._get(self._url_health)
+
+    # Awaitable wrappers for callers already inside an event loop. They run the
+    # blocking request in a worker thread; use AsyncRAGVersionClient for real
+    # async throughput.
+
+    async def alist_documents(self, **kwargs: Any) -> Dict:
+        """Awaitable :meth:`list_documents` that does not block the event loop."""
+        return await asyncio.to_thread(self.list_documents, **kwargs)
+
+    async def alist_versions(self, document_id: IdLike, **kwargs: Any) -> Dict:
+        """Awaitable :meth:`list_versions` that does not block the event loop."""
+        return await asyncio.to_thread(self.list_versions, document_id, **kwargs)
+
+    async def aget_statistics(self, days: int = 30) -> Dict:
+        """Awaitable :meth:`get_statistics` that does not block the event loop."""
+        return await asyncio.to_thread(self.get_statistics, days)
 
 
 class AsyncRAGVersionClient:
     """Asynchronous client for RAGVersion API."""
 
+    # Keep-alive pool size; also the natural ceiling for concurrent requests
+    MAX_KEEPALIVE = 10
+    MAX_RETRIES = 5
+
     def __init__(self, base_url: str = "http://localhost:6699/api", api_key: Optional[str] = None):
         """Initialize async client.
 
@@ -286,162 +522,275 @@ class AsyncRAGVersionClient:
             api_key: Optional API key for authentication
         """
         self.base_url = base_url.rstrip("/")
-        self.headers = {}
-        if api_key:
-            self.headers["X-API-Key"] = api_key
+
+        # One client for the lifetime of this object keeps the connection pool warm.
+        # httpx's default Accept-Encoding already lists only what it can decode.
+        self._client = httpx.AsyncClient(
+            base_url=self.base_url,
+            headers=_default_headers(api_key),
+            http2=True,
+            limits=httpx.Limits(
+                max_connections=20, max_keepalive_connections=self.MAX_KEEPALIVE
+            ),
+            timeout=httpx.Timeout(30.0, connect=5.0),
+        )
+
+    async def aclose(self) -> None:
+        """Close the underlying HTTP client."""
+        await self._client.aclose()
+
+    async def __aenter__(self) -> "AsyncRAGVersionClient":
+        return self
+
+    async def __aexit__(self, exc_type, exc_val, exc_tb) -> None:
+        await self.aclose()
+
+    async def _request(
+        self, method: str, path: str, list_body: bool = False, **kwargs: Any
+    ) -> Any:
+        """Send a request, retrying transient failures with backoff + jitter.
+
+        Methods outside RETRY_METHODS are only retried when the connection
+        failed, since the server may already have acted on them.
+        """
+        retryable = method in RETRY_METHODS
+        for attempt in range(self.MAX_RETRIES + 1):
+            try:
+                response = await self._client.request(method, path, **kwargs)
+            except (httpx.ConnectError, httpx.ConnectTimeout):
+                if attempt == self.MAX_RETRIES:
+                    raise
+            except httpx.TransportError:
+                if not retryable or attempt == self.MAX_RETRIES:
+                    raise
+            else:
+                if (
+                    not retryable
+                    or response.status_code not in RETRY_STATUSES
+                    or attempt == self.MAX_RETRIES
+                ):
+                    return _handle(response, list_body)
+                retry_after = response.headers.get("Retry-After")
+                if retry_after and retry_after.isdigit():
+                    await asyncio.sleep(int(retry_after))
+                    continue
+            await asyncio.sleep(0.3 * 2**attempt + random.uniform(0, 0.3))
+
+    async def _get(self, path: str, list_body: bool = False, **kwargs: Any) -> Any:
+        return await self._request("GET", path, list_body, **kwargs)
+
+    async def _post(self, path: str, list_body: bool = False, **kwargs: Any) -> Any:
+        return await self._request("POST", path, list_body, **kwargs)
+
+    async def warmup(self, n: int = 4) -> None:
+        """Open ``n`` pooled connections up front with cheap health checks.
+
+        Without this the first concurrent burst serializes behind connection
+        setup; afterwards each request picks up an established connection.
+        """
+        await asyncio.gather(*[self._client.get("/health") for _ in range(n)])
 
     async def track_file(self, file_path: str, metadata: Optional[Dict] = None) -> Dict:
         """Track a single file asynchronously."""
-        async with httpx.AsyncClient() as client:
-            response = await client.post(
-                f"{self.base_url}/track/file",
-                json={"file_path": file_path, "metadata": metadata or {}},
-                headers=self.headers,
-            )
-            response.raise_for_status()
-            return response.json()
-
-    async def list_documents(self, limit: int = 100, offset: int = 0) -> List[Dict]:
-        """List documents asynchronously."""
-        async with httpx.AsyncClient() as client:
-            response = await client.get(
-                f"{self.base_url}/documents",
-                params={"limit": limit, "offset": offset},
-                headers=self.headers,
-            )
-            response.raise_for_status()
-            return response.json()
+        return await self._post(
+            "/track/file",
+            content=_dumps({"file_path": file_path, "metadata": metadata or {}}),
+        )
+
+    async def track_files(self, items: List[Dict]) -> List[Dict]:
+        """Track several files in a single request asynchronously."""
+        return await self._post(
+            "/track/files", list_body=True, content=_dumps({"items": items})
+        )
+
+    async def iter_version_content(
+        self, version_id: IdLike, chunk_size: int = 65536
+    ) -> AsyncIterator[bytes]:
+        """Stream version content asynchronously in fixed-size chunks."""
+        async with self._client.stream(
+            "GET", "/versions/" + _as_id(version_id) + "/content"
+        ) as response:
+            await _acheck_stream(response)
+            async for chunk in response.aiter_bytes(chunk_size):
+                yield chunk
+
+    async def list_documents(self, limit: int = 100, cursor: Optional[str] = None) -> Dict:
+        """List one page of documents asynchronously."""
+        params = {"limit": limit}
+        if cursor:
+            params["cursor"] = cursor
+        return await self._get("/documents", list_body=True, params=params)
 
     async def get_statistics(self, days: int = 30) -> Dict:
         """Get statistics asynchronously."""
-        async with httpx.AsyncClient() as client:
-            response = await client.get(
-                f"{self.base_url}/statistics",
-                params={"days": days},
-                headers=self.headers,
-            )
-            response.raise_for_status()
-            return response.json()
+        return await self._get(
+            "/statistics",
+            params={"days": days},
+        )
 
 
-def example_sync():
-    """Example using synchronous client."""
-    print("=== Synchronous Client Example ===\n")
+async def track_concurrently(
+    client: AsyncRAGVersionClient,
+    file_paths: List[str],
+    metadata: Optional[Dict] = None,
+    concurrency: int = AsyncRAGVersionClient.MAX_KEEPALIVE,
+) -> List[Dict]:
+    """Track files one request each, with at most ``concurrency`` in flight.
 
-    # Initialize client
-    client = RAGVersionClient(base_url="http://localhost:6699/api")
+    The default matches the client's keep-alive pool so every request reuses a
+    warm connection. If any request fails, the remaining ones are cancelled and
+    the error is raised.
+    """
+    sem = asyncio.Semaphore(concurrency)
 
-    # Health check
-    print("1. Health Check")
-    health = client.health_check()
-    print(f"   Status: {health['status']}")
-    print(f"   Version: {health['version']}")
-    print(f"   Storage: {health['storage_backend']}\n")
+    async def _one(path: str) -> Dict:
+        async with sem:
+            return await client.track_file(path, metadata=metadata)
 
-    # Track a file
-    print("2. Track a File")
+    tasks = [asyncio.ensure_future(_one(path)) for path in file_paths]
     try:
-        event = client.track_file(
-            file_path="/path/to/document.pdf",
-            metadata={"author": "John Doe", "category": "technical"},
-        )
-        print(f"   Tracked: {event['file_name']}")
-        print(f"   Change: {event['change_type']}")
-        print(f"   Version: {event['version_number']}\n")
-    except Exception as e:
-        print(f"   Error: {e}\n")
-
-    # List documents
-    print("3. List Documents")
-    documents = client.list_documents(limit=5)
-    print(f"   Found {len(documents)} documents:")
-    for doc in documents[:3]:
-        print(f"   - {doc['file_name']}: {doc['version_count']} versions")
-    print()
-
-    # Get statistics
-    print("4. Get Statistics")
-    stats = client.get_statistics(days=7)
-    print(f"   Total documents: {stats['total_documents']}")
-    print(f"   Total versions: {stats['total_versions']}")
-    print(f"   Recent changes: {stats['recent_changes']}\n")
-
-    # Search documents
-    print("5. Search Documents")
-    results = client.search_documents(
-        file_type="pdf",
-        metadata_filter={"category": "technical"},
-    )
-    print(f"   Found {len(results)} PDF documents in 'technical' category\n")
-
-    # Version history (if we have documents)
-    if documents:
-        print("6. Version History")
-        doc_id = documents[0]["id"]
-        versions = client.list_versions(doc_id, limit=5)
-        print(f"   Versions for {documents[0]['file_name']}:")
-        for v in versions[:3]:
-            print(f"   - v{v['version_number']}: {v['change_type']} ({v['created_at']})")
+        return await asyncio.gather(*tasks)
+    except BaseException:
+        for task in tasks:
+            task.cancel()
+        raise
+
+
+def example_sync():
+    """Example using synchronous client."""
+    print("=== Synchronous Client Example ===\n")
+
+    with RAGVersionClient(base_url="http://localhost:6699/api") as client:
+        # Track a file (a write, so it goes before the reads below)
+        print("1. Track a File")
+        try:
+            event = client.track_file(
+                file_path="/path/to/document.pdf",
+                metadata={"author": "John Doe", "category": "technical"},
+            )
+            print(f"   Tracked: {event['file_name']}")
+            print(f"   Change: {event['change_type']}")
+            print(f"   Version: {event['version_number']}\n")
+        except Exception as e:
+            print(f"   Error: {e}\n")
+
+        # The reads are independent, so issue them together over the shared session
+        with ThreadPoolExecutor(max_workers=4) as pool:
+            f_health = pool.submit(client.health_check)
+            f_docs = pool.submit(client.list_documents, 5)
+            f_stats = pool.submit(client.get_statistics, 7)
+            f_search = pool.submit(client.search_documents, "pdf", {"category": "technical"})
+
+        # Health check
+        print("2. Health Check")
+        health = f_health.result()
+        print(f"   Status: {health['status']}")
+        print(f"   Version: {health['version']}")
+        print(f"   Storage: {health['storage_backend']}\n")
+
+        # List documents
+        print("3. List Documents")
+        documents = f_docs.result()["items"]
+        print(f"   Found {len(documents)} documents:")
+        for doc in documents[:3]:
+            print(f"   - {doc['file_name']}: {doc['version_count']} versions")
         print()
 
-        # Get diff
-        if len(versions) >= 2:
-            print("7. Get Diff")
-            diff = client.get_diff(doc_id, 1, versions[0]["version_number"])
-            print(f"   Additions: {diff['additions']}")
-            print(f"   Deletions: {diff['deletions']}")
-            print(f"   Similarity: {diff['similarity']:.2%}\n")
+        # Get statistics
+        print("4. Get Statistics")
+        stats = f_stats.result()
+        print(f"   Total documents: {stats['total_documents']}")
+        print(f"   Total versions: {stats['total_versions']}")
+        print(f"   Recent changes: {stats['recent_changes']}\n")
+
+        # Search documents
+        print("5. Search Documents")
+        results = f_search.result()
+        print(f"   Found {len(results)} PDF documents in 'technical' category\n")
+
+        # Version history (if we have documents)
+        if documents:
+            print("6. Version History")
+            detail = client.get_document_with_versions(documents[0]["id"], version_limit=5)
+            versions = detail["versions"] or []
+            print(f"   Versions for {detail['document']['file_name']}:")
+            for v in versions[:3]:
+                print(f"   - v{v['version_number']}: {v['change_type']} ({v['created_at']})")
+            print()
+
+            # Diff between the two newest versions (same response, no extra request)
+            diff = detail["latest_diff"]
+            if diff:
+                print("7. Latest Diff")
+                print(f"   Additions: {diff['additions']}")
+                print(f"   Deletions: {diff['deletions']}")
+                if diff.get("similarity") is not None:
+                    print(f"   Similarity: {diff['similarity']:.2%}")
+                print()
 
 
 async def example_async():
     """Example using asynchronous client."""
     print("=== Asynchronous Client Example ===\n")
 
-    # Initialize async client
-    client = AsyncRAGVersionClient(base_url="http://localhost:6699/api")
-
-    # Concurrent requests
-    print("1. Concurrent Requests")
-    results = await asyncio.gather(
-        client.list_documents(limit=10),
-        client.get_statistics(days=7),
-    )
-    documents, stats = results
-
-    print(f"   Documents: {len(documents)}")
-    print(f"   Total versions: {stats['total_versions']}")
-    print(f"   Recent changes: {stats['recent_changes']}\n")
-
-    # Track multiple files concurrently
-    print("2. Track Multiple Files")
-    file_paths = [
-        "/path/to/doc1.pdf",
-        "/path/to/doc2.pdf",
-        "/path/to/doc3.pdf",
-    ]
+    async with AsyncRAGVersionClient(base_url="http://localhost:6699/api") as client:
+        # Warm the pool so the gather below runs on open connections
+        await client.warmup(n=2)
 
-    tasks = [client.track_file(path, metadata={"batch": "example"}) for path in file_paths]
-
-    try:
-        events = await asyncio.gather(*tasks, return_exceptions=True)
-        successful = [e for e in events if not isinstance(e, Exception)]
-        print(f"   Successfully tracked: {len(successful)} files\n")
-    except Exception as e:
-        print(f"   Error: {e}\n")
-
-
-def main():
-    """Main example runner."""
-    print("RAGVersion API Client Examples\n")
-    print("Prerequisites:")
-    print("1. Start the API server: ragversion serve")
-    print("2. Have some documents tracked\n")
-    input("Press Enter to continue...")
-    print()
-
-    # Run synchronous example
+        # Concurrent requests
+        print("1. Concurrent Requests")
+        results = await asyncio.gather(
+            client.list_documents(limit=10),
+            client.get_statistics(days=7),
+        )
+        page, stats = results
+
+        print(f"   Documents: {len(page['items'])}")
+        print(f"   Total versions: {stats['total_versions']}")
+        print(f"   Recent changes: {stats['recent_changes']}\n")
+
+        # Track multiple files concurrently
+        print("2. Track Multiple Files")
+        file_paths = [
+            "/path/to/doc1.pdf",
+            "/path/to/doc2.pdf",
+            "/path/to/doc3.pdf",
+        ]
+
+        try:
+            results = await client.track_files(
+                [{"file_path": path, "metadata": {"batch": "example"}} for path in file_paths]
+            )
+            successful = [r for r in results if r["status"] == 200]
+            print(f"   Successfully tracked: {len(successful)} files\n")
+        except Exception as e:
+            print(f"   Error: {e}\n")
+
+        # One request per file, bounded by the connection pool
+        print("3. Track Files Individually")
+        try:
+            events = await track_concurrently(client, file_paths, metadata={"batch": "example"})
+            print(f"   Tracked: {len(events)} files\n")
+        except Exception as e:
+            print(f"   Error: {e}\n")
+
+        # Walk every page with the cursor
+        print("4. Paginate Documents")
+        total, cursor = 0, None
+        while True:
+            page = await client.list_documents(limit=100, cursor=cursor)
+            total += len(page["items"])
+            cursor = page["next_cursor"]
+            if not cursor:
+                break
+        print(f"   Total documents: {total}\n")
+
+
+async def run_examples() -> None:
+    """Run both examples on a single event loop."""
+    # The sync client blocks, so it runs in a worker thread off the loop
     try:
-        example_sync()
+        await asyncio.to_thread(example_sync)
     except requests.exceptions.ConnectionError:
         print("Error: Could not connect to API server.")
         print("Make sure the server is running: ragversion serve")
@@ -449,13 +798,32 @@ def main():
     except Exception as e:
         print(f"Error: {e}")
 
-    # Run asynchronous example
     print("\n" + "=" * 50 + "\n")
     try:
-        asyncio.run(example_async())
+        await example_async()
     except Exception as e:
         print(f"Error: {e}")
 
 
+def main():
+    """Main example runner."""
+    parser = argparse.ArgumentParser(description="RAGVersion API client examples")
+    parser.add_argument(
+        "--yes", "-y", action="store_true", help="Don't wait for confirmation before running"
+    )
+    args = parser.parse_args()
+
+    print("RAGVersion API Client Examples\n")
+    print("Prerequisites:")
+    print("1. Start the API server: ragversion serve")
+    print("2. Have some documents tracked\n")
+    # Only prompt when a person is at the terminal, so scripted runs don't hang
+    if not args.yes and sys.stdin.isatty():
+        input("Press Enter to continue...")
+        print()
+
+    asyncio.run(run_examples())
+
+
 if __name__ == "__main__":
     main()
@@ -10,7 +10,7 @@ This example shows how to:
 """
 
 import asyncio
-from ragversion import AsyncVersionTracker
+from ragversion import AsyncVersionTracker, FileProcessingError
 
 
 async def main():
@@ -40,18 +40,26 @@ async def main():
 
         # Track a directory (batch processing)
         print("\n=== Tracking directory ===")
-        result = await tracker.track_directory(
+        # Results arrive as each file finishes, so large directories never
+        # have to be held in memory at once
+        total = changed = errors = 0
+        async for item in tracker.track_directory_stream(
             "./documents",
             patterns=["*.pdf", "*.docx", "*.md"],
             recursive=True,
             max_workers=4,
-        )
-
-        print(f"Total files: {result.total_files}")
-        print(f"Changes detected: {result.success_count}")
-        print(f"Errors: {result.failure_count}")
-        print(f"Duration: {result.duration_seconds:.2f}s")
-        print(f"Success rate: {result.success_rate:.1f}%")
+        ):
+            total += 1
+            if isinstance(item, FileProcessingError):
+                errors += 1
+                print(f"  ! {item.file_path}: {item.error}")
+            elif item.changed:
+                changed += 1
+                print(f"  + {item.file_path} (v{item.version_number})")
+
+        print(f"Total files: {total}")
+        print(f"Changes detected: {changed}")
+        print(f"Errors: {errors}")
 
         # List tracked documents
         print("\n=== Tracked documents ===")
@@ -4,103 +4,299 @@ Query Performance Benchmark
 This script benchmarks various query patterns with RAGVersion's optimized SQLite backend.
 
 Usage:
-    python query_benchmark.py [--documents 10000] [--versions-per-doc 5]
+    python query_benchmark.py [--documents 10000] [--versions-per-doc 5] [--db-path bench.db]
+                              [--pragmas journal_mode=WAL,synchronous=NORMAL] [--extra-indexes]
+                              [--readers 4]
 
 Results are saved to query_benchmark_results.json
 """
 
 import asyncio
 import json
+import os
+import statistics
+import sys
 import time
 from datetime import datetime, timedelta
+from itertools import cycle, islice
 from pathlib import Path
-from typing import List
-from uuid import uuid4
+from typing import Dict, Iterator, List, Optional
+from uuid import UUID
 
-from ragversion.models import Document, Version, ChangeType
+from ragversion.models import ChangeType
 from ragversion.storage.sqlite import SQLiteStorage
 
+try:
+    import orjson
+
+    ORJSON_AVAILABLE = True
+except ImportError:
+    ORJSON_AVAILABLE = False
+
+# Sort keys exercised by the list_documents ORDER BY benchmarks
+SORT_COLUMNS = ["updated_at", "file_name", "file_size", "version_count"]
+
+# Applied after SQLiteStorage.initialize() so disk-backed runs measure B-tree work,
+# not fsync latency. Override with --pragmas to explore the safety/speed trade-off.
+DEFAULT_PRAGMAS = [
+    "journal_mode=WAL",
+    "synchronous=NORMAL",
+    "temp_store=MEMORY",
+    "mmap_size=268435456",
+    "cache_size=-65536",
+]
+
 
 class QueryBenchmark:
     """Benchmark various query patterns."""
 
-    def __init__(self, db_path: str = ":memory:"):
+    def __init__(
+        self,
+        db_path: str = ":memory:",
+        pragmas: Optional[List[str]] = None,
+        planner_stats: str = "optimize",
+        extra_indexes: bool = False,
+        readers: int = 0,
+        page_size: int = 8192,
+    ):
         """Initialize benchmark."""
         self.db_path = db_path
+        self.pragmas = DEFAULT_PRAGMAS if pragmas is None else pragmas
+        self.planner_stats = planner_stats
+        self.extra_indexes = extra_indexes
+        self.readers = readers
+        self.page_size = page_size
         self.storage = None
         self.results = {}
 
+    async def apply_page_size(self):
+        """Rebuild the freshly created, still empty database with ``self.page_size``.
+
+        The page size is fixed once tables exist and can't change at all in WAL
+        mode, so leave WAL, VACUUM, then restore the previous journal mode.
+        """
+        db = self.storage.db
+        async with db.execute("PRAGMA page_size") as cursor:
+            current = (await cursor.fetchone())[0]
+        if not self.page_size or current == self.page_size:
+            print(f"  PRAGMA page_size = {current}")
+            return
+
+        async with db.execute("PRAGMA journal_mode") as cursor:
+            journal_mode = (await cursor.fetchone())[0]
+        await db.execute("PRAGMA journal_mode = DELETE")
+        await db.execute(f"PRAGMA page_size = {int(self.page_size)}")
+        await db.execute("VACUUM")
+        await db.execute(f"PRAGMA journal_mode = {journal_mode}")
+
+        async with db.execute("PRAGMA page_size") as cursor:
+            current = (await cursor.fetchone())[0]
+        # In-memory databases keep the page size they were opened with
+        note = "" if current == self.page_size else " (unchanged; use --db-path to apply)"
+        print(f"  PRAGMA page_size = {current}{note}")
+
+    async def apply_pragmas(self):
+        """Apply the configured PRAGMAs and print their effective values."""
+        for pragma in self.pragmas:
+            name, _, value = pragma.partition("=")
+            name, value = name.strip(), value.strip()
+            if not name.isidentifier() or not value.replace("-", "").isalnum():
+                raise ValueError(f"Invalid pragma: {pragma!r} (expected name=value)")
+            await self.storage.db.execute(f"PRAGMA {name} = {value}")
+            async with self.storage.db.execute(f"PRAGMA {name}") as cursor:
+                row = await cursor.fetchone()
+            print(f"  PRAGMA {name} = {row[0] if row else value}")
+
     async def setup(self, num_documents: int = 10000, versions_per_doc: int = 5):
         """Set up test database with sample data."""
         print(f"Setting up test database with {num_documents} documents...")
         self.storage = SQLiteStorage(self.db_path)
         await self.storage.initialize()
+        await self.apply_page_size()
+        await self.apply_pragmas()
 
-        # Generate sample documents
+        # Generate sample rows as columns, skipping per-row Pydantic models
         print("Generating sample documents...")
-        file_types = ["pdf", "docx", "txt", "md", "xlsx"]
-        documents = []
-
-        for i in range(num_documents):
-            file_type = file_types[i % len(file_types)]
-            doc = Document(
-                id=uuid4(),
-                file_path=f"/docs/file_{i}.{file_type}",
-                file_name=f"file_{i}.{file_type}",
-                file_type=file_type,
-                file_size=1024 * (i % 100 + 1),
-                content_hash=f"hash_{i}",
-                created_at=datetime.utcnow() - timedelta(days=num_documents - i),
-                updated_at=datetime.utcnow() - timedelta(days=num_documents - i),
-                version_count=versions_per_doc,
-                current_version=versions_per_doc,
-                metadata={"author": f"user_{i % 100}", "department": f"dept_{i % 10}"},
+        # Document i is created i days after the start and its version v lands
+        # v - 1 days later, so every timestamp is one precomputed daily tick
+        timeline = self._iso_timeline(num_documents + versions_per_doc, end_offset=num_documents)
+        doc_columns = self._generate_documents_soa(num_documents, versions_per_doc, timeline)
+        document_rows = list(zip(*doc_columns.values()))
+
+        print(f"Generating versions ({versions_per_doc} per document)...")
+        version_rows = self._iter_version_rows(doc_columns, versions_per_doc, timeline)
+        num_versions = num_documents * versions_per_doc
+
+        # Insert documents and versions in one explicit transaction so SQLite
+        # journals and syncs once instead of once per batch
+        db = self.storage.db
+        await db.execute("BEGIN IMMEDIATE")
+        try:
+            print(f"Inserting {len(document_rows)} documents...")
+            start = time.time()
+            await self.storage.batch_create_documents_raw(document_rows, commit=False)
+            insert_time = time.time() - start
+            print(f"✓ Inserted in {insert_time:.2f}s ({len(document_rows)/insert_time:.0f} docs/s)")
+
+            print(f"Inserting {num_versions} versions...")
+            start = time.time()
+            await self.storage.batch_create_versions_raw(version_rows, commit=False)
+            insert_time = time.time() - start
+            print(f"✓ Inserted in {insert_time:.2f}s ({num_versions/insert_time:.0f} versions/s)")
+
+            start = time.time()
+            await db.commit()
+            print(f"✓ Committed in {time.time() - start:.2f}s")
+        except Exception:
+            await db.rollback()
+            raise
+
+        if self.extra_indexes:
+            await self._create_benchmark_indexes()
+        await self.collect_planner_stats()
+
+        print(f"✓ Test database ready with {num_documents} documents and {num_versions} versions\n")
+
+    async def _create_benchmark_indexes(self):
+        """Create ``(sort_key DESC, id DESC)`` indexes for the ORDER BY benchmarks.
+
+        ``list_documents`` breaks ties on ``id``, which the single-column schema
+        indexes don't cover, so SQLite falls back to a temp B-tree sort. With the
+        full sort key indexed the scan stops after ``LIMIT`` rows. Built after the
+        bulk load so the insert timings stay comparable.
+        """
+        print("Creating benchmark sort indexes...")
+        for column in SORT_COLUMNS:
+            await self.storage.db.execute(
+                f"CREATE INDEX IF NOT EXISTS idx_bench_{column} "
+                f"ON documents({column} DESC, id DESC)"
             )
-            documents.append(doc)
+        await self.storage.db.commit()
+
+    async def collect_planner_stats(self):
+        """Gather query-planner statistics according to ``self.planner_stats``.
+
+        ``optimize`` uses ``PRAGMA optimize`` with a bounded ``analysis_limit``
+        (SQLite's recommended approach); ``analyze`` runs a full ``ANALYZE``;
+        ``none`` skips statistics so the planner gain can be measured. Histogram
+        (STAT4) data is only collected when SQLite was built with
+        ``-DSQLITE_ENABLE_STAT4``.
+        """
+        db = self.storage.db
+        async with db.execute("SELECT sqlite_version()") as cursor:
+            version = (await cursor.fetchone())[0]
+        async with db.execute("PRAGMA compile_options") as cursor:
+            stat4 = any(row[0] == "ENABLE_STAT4" for row in await cursor.fetchall())
+        print(f"SQLite {version} (STAT4 {'enabled' if stat4 else 'not compiled in'})")
+
+        if self.planner_stats == "none":
+            print("Skipping planner statistics")
+            return
+
+        await db.execute("PRAGMA analysis_limit = 1000")
+        if self.planner_stats == "optimize" and tuple(map(int, version.split("."))) >= (3, 46):
+            # 0x10000 makes optimize consider every table, not just ones queried so far
+            print("Running PRAGMA optimize...")
+            await db.execute("PRAGMA optimize = 0x10002")
+        else:
+            # Older SQLite only optimizes tables this connection has already queried
+            print("Running ANALYZE...")
+            await db.execute("ANALYZE")
+        await db.commit()
+
+    @staticmethod
+    def _iso_timeline(days: int, end_offset: int) -> List[str]:
+        """ISO timestamps one day apart, starting ``end_offset`` days before now."""
+        tick = timedelta(days=1)
+        current = datetime.utcnow() - end_offset * tick
+        timeline = []
+        for _ in range(days):
+            timeline.append(current.isoformat())
+            current += tick
+        return timeline
+
+    @staticmethod
+    def _iter_uuid_strings(block: int = 4096) -> Iterator[str]:
+        """Yield random UUID4 strings, drawing entropy ``block`` ids at a time.
+
+        One ``os.urandom`` call per block replaces a syscall per ``uuid4()``.
+        """
+        while True:
+            raw = os.urandom(16 * block)
+            for offset in range(0, len(raw), 16):
+                yield str(UUID(bytes=raw[offset:offset + 16], version=4))
+
+    @staticmethod
+    def _generate_documents_soa(
+        num_documents: int, versions_per_doc: int, timeline: List[str]
+    ) -> Dict[str, list]:
+        """Generate document columns (struct-of-arrays) in ``documents`` table order."""
+        file_types = ["pdf", "docx", "txt", "md", "xlsx"]
+        n = num_documents
 
-        # Batch insert documents
-        print(f"Inserting {len(documents)} documents...")
-        start = time.time()
-        await self.storage.batch_create_documents(documents)
-        insert_time = time.time() - start
-        print(f"✓ Inserted in {insert_time:.2f}s ({len(documents)/insert_time:.0f} docs/s)")
+        types = (file_types * (n // len(file_types) + 1))[:n]
+        names = [f"file_{i}.{t}" for i, t in enumerate(types)]
+        timestamps = timeline[:n]
 
-        # Generate versions for each document
-        print(f"Generating versions ({versions_per_doc} per document)...")
-        all_versions = []
-        change_types = [ChangeType.CREATED, ChangeType.MODIFIED, ChangeType.MODIFIED, ChangeType.MODIFIED, ChangeType.MODIFIED]
+        # Only 100 distinct metadata values exist (author cycles every 100 docs and
+        # department every 10), so serialize each once and reuse it
+        metadata_json = [
+            json.dumps({"author": f"user_{k}", "department": f"dept_{k % 10}"}) for k in range(100)
+        ]
+
+        return {
+            "id": list(islice(QueryBenchmark._iter_uuid_strings(), n)),
+            "file_path": ["/docs/" + name for name in names],
+            "file_name": names,
+            "file_type": types,
+            "file_size": [1024 * (i % 100 + 1) for i in range(n)],
+            "content_hash": [f"hash_{i}" for i in range(n)],
+            "created_at": timestamps,
+            "updated_at": timestamps,
+            "version_count": [versions_per_doc] * n,
+            "current_version": [versions_per_doc] * n,
+            "metadata": [metadata_json[i % 100] for i in range(n)],
+        }
 
-        for doc in documents:
+    @staticmethod
+    def _iter_version_rows(
+        doc_columns: Dict[str, list], versions_per_doc: int, timeline: List[str]
+    ) -> Iterator[tuple]:
+        """Yield ``versions`` table rows for every generated document.
+
+        Rows are produced lazily so ``executemany`` can consume them without the
+        full version set ever being held in memory.
+        """
+        change_types = [
+            ChangeType.CREATED.value,
+            ChangeType.MODIFIED.value,
+            ChangeType.MODIFIED.value,
+            ChangeType.MODIFIED.value,
+            ChangeType.MODIFIED.value,
+        ]
+        # Same change-type sequence for every document, resolved once
+        per_doc_changes = list(islice(cycle(change_types), versions_per_doc))
+        version_ids = QueryBenchmark._iter_uuid_strings()
+        for i, (doc_id, file_size) in enumerate(zip(doc_columns["id"], doc_columns["file_size"])):
             for ver_num in range(1, versions_per_doc + 1):
-                version = Version(
-                    id=uuid4(),
-                    document_id=doc.id,
-                    version_number=ver_num,
-                    content_hash=f"hash_{doc.id}_{ver_num}",
-                    file_size=doc.file_size,
-                    change_type=change_types[(ver_num - 1) % len(change_types)],
-                    created_at=doc.created_at + timedelta(days=ver_num - 1),
-                    metadata={},
+                yield (
+                    next(version_ids),
+                    doc_id,
+                    ver_num,
+                    f"hash_{doc_id}_{ver_num}",
+                    file_size,
+                    per_doc_changes[ver_num - 1],
+                    timeline[i + ver_num - 1],
+                    None,
+                    "{}",
                 )
-                all_versions.append(version)
-
-        # Batch insert versions
-        print(f"Inserting {len(all_versions)} versions...")
-        start = time.time()
-        await self.storage.batch_create_versions(all_versions)
-        insert_time = time.time() - start
-        print(f"✓ Inserted in {insert_time:.2f}s ({len(all_versions)/insert_time:.0f} versions/s)")
-
-        # Run ANALYZE for query planner
-        print("Running ANALYZE...")
-        await self.storage.db.execute("ANALYZE")
-        await self.storage.db.commit()
 
-        print(f"✓ Test database ready with {num_documents} documents and {len(all_versions)} versions\n")
-
-    async def benchmark_query(self, name: str, query_func, iterations: int = 10):
+    async def benchmark_query(
+        self, name: str, query_func, iterations: int = 10, quiet: bool = False
+    ):
         """Benchmark a single query."""
-        print(f"Benchmarking: {name}")
+        if not quiet:
+            print(f"Benchmarking: {name}")
         times = []
 
         # Warm-up run
@@ -113,18 +309,25 @@ class QueryBenchmark:
             elapsed = (time.perf_counter() - start) * 1000  # Convert to ms
             times.append(elapsed)
 
-        avg_time = sum(times) / len(times)
+        avg_time = statistics.fmean(times)
         min_time = min(times)
         max_time = max(times)
-        p95_time = sorted(times)[int(len(times) * 0.95)]
+        if len(times) > 1:
+            # Linearly interpolated p95 (same as numpy's default), unbiased for small N
+            p95_time = statistics.quantiles(times, n=20, method="inclusive")[18]
+            std_time = statistics.stdev(times)
+        else:
+            p95_time, std_time = max_time, 0.0
 
-        print(f"  Avg: {avg_time:.2f}ms | Min: {min_time:.2f}ms | Max: {max_time:.2f}ms | P95: {p95_time:.2f}ms")
+        if not quiet:
+            print(f"  Avg: {avg_time:.2f}ms | Min: {min_time:.2f}ms | Max: {max_time:.2f}ms | P95: {p95_time:.2f}ms")
 
         self.results[name] = {
             "avg_ms": round(avg_time, 2),
             "min_ms": round(min_time, 2),
             "max_ms": round(max_time, 2),
             "p95_ms": round(p95_time, 2),
+            "std_ms": round(std_time, 2),
             "iterations": iterations,
         }
 
@@ -137,85 +340,97 @@ class QueryBenchmark:
         print("=" * 60)
         print()
 
-        # 1. List recent documents
-        await self.benchmark_query(
-            "List 100 recent documents",
-            lambda: self.storage.list_documents(limit=100, order_by="updated_at"),
-        )
-
-        # 2. List documents by name
-        await self.benchmark_query(
-            "List 100 documents by name",
-            lambda: self.storage.list_documents(limit=100, order_by="file_name"),
-        )
-
-        # 3. List documents by size
-        await self.benchmark_query(
-            "List 100 documents by size",
-            lambda: self.storage.list_documents(limit=100, order_by="file_size"),
-        )
-
-        # 4. List documents by version count
-        await self.benchmark_query(
-            "List 100 documents by version count",
-            lambda: self.storage.list_documents(limit=100, order_by="version_count"),
-        )
-
-        # 5. Search by file type
-        await self.benchmark_query(
-            "Search documents by file type (pdf)",
-            lambda: self.storage.search_documents(file_type="pdf"),
-        )
-
-        # 6. Search by file type + metadata
-        await self.benchmark_query(
-            "Search by type + metadata filter",
-            lambda: self.storage.search_documents(
-                file_type="pdf",
-                metadata_filter={"department": "dept_0"}
-            ),
-        )
-
-        # 7. Get document by path
-        await self.benchmark_query(
-            "Get document by file path",
-            lambda: self.storage.get_document_by_path("/docs/file_100.pdf"),
-        )
+        benchmarks = [
+            # 1. List recent documents
+            ("List 100 recent documents",
+             lambda s: s.list_documents(limit=100, order_by="updated_at")),
+            # 2. List documents by name
+            ("List 100 documents by name",
+             lambda s: s.list_documents(limit=100, order_by="file_name")),
+            # 3. List documents by size
+            ("List 100 documents by size",
+             lambda s: s.list_documents(limit=100, order_by="file_size")),
+            # 4. List documents by version count
+            ("List 100 documents by version count",
+             lambda s: s.list_documents(limit=100, order_by="version_count")),
+            # 5. Search by file type
+            ("Search documents by file type (pdf)",
+             lambda s: s.search_documents(file_type="pdf")),
+            # 6. Search by file type + metadata
+            ("Search by type + metadata filter",
+             lambda s: s.search_documents(
+                 file_type="pdf",
+                 metadata_filter={"department": "dept_0"}
+             )),
+            # 7. Get document by path
+            ("Get document by file path",
+             lambda s: s.get_document_by_path("/docs/file_100.pdf")),
+        ]
 
-        # 8. Get version history (50 versions)
         docs = await self.storage.list_documents(limit=1)
         if docs:
             doc_id = docs[0].id
-            await self.benchmark_query(
-                "Get version history (50 versions)",
-                lambda: self.storage.list_versions(doc_id, limit=50),
-            )
-
-        # 9. Get latest version
-        if docs:
-            doc_id = docs[0].id
-            await self.benchmark_query(
-                "Get latest version",
-                lambda: self.storage.get_latest_version(doc_id),
-            )
-
-        # 10. Get statistics
-        await self.benchmark_query(
-            "Get storage statistics",
-            lambda: self.storage.get_statistics(),
-        )
+            benchmarks += [
+                # 8. Get version history (50 versions)
+                ("Get version history (50 versions)",
+                 lambda s: s.list_versions(doc_id, limit=50)),
+                # 9. Get latest version
+                ("Get latest version",
+                 lambda s: s.get_latest_version(doc_id)),
+            ]
+
+        benchmarks += [
+            # 10. Get statistics
+            ("Get storage statistics",
+             lambda s: s.get_statistics()),
+            # 11. Get top documents
+            ("Get top 10 documents by version count",
+             lambda s: s.get_top_documents(limit=10, order_by="version_count")),
+        ]
 
-        # 11. Get top documents
-        await self.benchmark_query(
-            "Get top 10 documents by version count",
-            lambda: self.storage.get_top_documents(limit=10, order_by="version_count"),
-        )
+        if self.readers > 0 and self.db_path != ":memory:":
+            await self._run_parallel(benchmarks)
+        else:
+            if self.readers > 0:
+                print("In-memory databases can't be shared; running sequentially\n")
+            for name, query in benchmarks:
+                await self.benchmark_query(name, lambda query=query: query(self.storage))
 
         print()
         print("=" * 60)
         print("BENCHMARK COMPLETE")
         print("=" * 60)
 
+    async def _run_parallel(self, benchmarks):
+        """Run independent benchmarks concurrently over a pool of WAL readers.
+
+        Iterations inside a benchmark stay sequential, but benchmarks overlap,
+        so this measures suite throughput; per-query latencies include contention.
+        """
+        pool: asyncio.Queue = asyncio.Queue()
+        readers = [await self.storage.open_reader() for _ in range(self.readers)]
+        for reader in readers:
+            pool.put_nowait(reader)
+        print(f"Running {len(benchmarks)} benchmarks over {len(readers)} readers\n")
+
+        async def run(name, query):
+            reader = await pool.get()
+            try:
+                # Output would interleave; results are reported in the summary
+                await self.benchmark_query(
+                    name, lambda query=query, reader=reader: query(reader), quiet=True
+                )
+            finally:
+                pool.put_nowait(reader)
+
+        start = time.perf_counter()
+        try:
+            await asyncio.gather(*(run(name, query) for name, query in benchmarks))
+        finally:
+            for reader in readers:
+                await reader.close()
+        print(f"\nSuite wall time: {(time.perf_counter() - start) * 1000:.2f}ms")
+
     async def analyze_query_plans(self):
         """Analyze query execution plans."""
         print()
@@ -225,19 +440,38 @@ class QueryBenchmark:
         print()
 
         queries = [
-            ("List recent documents", "SELECT * FROM documents ORDER BY updated_at DESC LIMIT 100"),
+            *(
+                (f"List documents by {column}",
+                 f"SELECT * FROM documents ORDER BY {column} DESC, id DESC LIMIT 100")
+                for column in SORT_COLUMNS
+            ),
             ("Search by file type", "SELECT * FROM documents WHERE file_type = 'pdf'"),
             ("Get version history", "SELECT * FROM versions WHERE document_id = 'test' ORDER BY version_number DESC LIMIT 50"),
             ("Get latest version", "SELECT * FROM versions WHERE document_id = 'test' ORDER BY version_number DESC LIMIT 1"),
         ]
 
-        for name, query in queries:
-            print(f"{name}:")
-            async with self.storage.db.execute(f"EXPLAIN QUERY PLAN {query}") as cursor:
-                plan = await cursor.fetchall()
-                for row in plan:
-                    print(f"  {row}")
-            print()
+        # Plan on a separate query-only connection so nothing from the benchmark
+        # connection's statement cache is reused; in-memory databases can't be shared
+        if self.db_path == ":memory:":
+            diag = None
+            db = self.storage.db
+        else:
+            diag = await self.storage.open_reader()
+            db = diag.db
+
+        try:
+            for name, query in queries:
+                async with db.execute(f"EXPLAIN {query}") as cursor:
+                    opcodes = len(await cursor.fetchall())
+                print(f"{name} ({opcodes} VDBE opcodes):")
+                async with db.execute(f"EXPLAIN QUERY PLAN {query}") as cursor:
+                    plan = await cursor.fetchall()
+                    for row in plan:
+                        print(f"  {row}")
+                print()
+        finally:
+            if diag:
+                await diag.close()
 
     async def print_index_info(self):
         """Print index information."""
@@ -263,30 +497,43 @@ class QueryBenchmark:
 
     async def print_results_summary(self):
         """Print results summary."""
-        print()
-        print("=" * 60)
-        print("RESULTS SUMMARY")
-        print("=" * 60)
-        print()
-
-        print(f"{'Query':<50} {'Avg (ms)':<12} {'P95 (ms)':<12}")
-        print("-" * 74)
-
-        for name, metrics in self.results.items():
-            print(f"{name:<50} {metrics['avg_ms']:<12.2f} {metrics['p95_ms']:<12.2f}")
-
-        print()
+        # Build the table and write it once; stdout is often a pipe in cron runs
+        lines = [
+            "",
+            "=" * 60,
+            "RESULTS SUMMARY",
+            "=" * 60,
+            "",
+            f"{'Query':<50} {'Avg (ms)':<12} {'P95 (ms)':<12}",
+            "-" * 74,
+        ]
+        lines.extend(
+            f"{name:<50} {metrics['avg_ms']:<12.2f} {metrics['p95_ms']:<12.2f}"
+            for name, metrics in self.results.items()
+        )
+        lines.append("")
+        sys.stdout.write("\n".join(lines) + "\n")
 
     async def save_results(self, filename: str = "query_benchmark_results.json"):
         """Save benchmark results to JSON file."""
         results_data = {
-            "timestamp": datetime.utcnow().isoformat(),
+            "timestamp": datetime.utcnow(),
             "database": self.db_path,
+            "pragmas": self.pragmas,
+            "planner_stats": self.planner_stats,
+            "extra_indexes": self.extra_indexes,
+            "readers": self.readers,
+            "page_size": self.page_size,
             "results": self.results,
         }
 
-        with open(filename, "w") as f:
-            json.dump(results_data, f, indent=2)
+        if ORJSON_AVAILABLE:
+            payload = orjson.dumps(results_data, option=orjson.OPT_INDENT_2)
+        else:
+            payload = json.dumps(results_data, indent=2, default=datetime.isoformat).encode()
+
+        with open(filename, "wb") as f:
+            f.write(payload)
 
         print(f"✓ Results saved to {filename}")
 
@@ -306,9 +553,46 @@ async def main():
     parser.add_argument("--iterations", type=int, default=10, help="Benchmark iterations")
     parser.add_argument("--db-path", default=":memory:", help="Database path (default: in-memory)")
     parser.add_argument("--output", default="query_benchmark_results.json", help="Output file")
+    parser.add_argument(
+        "--pragmas",
+        default=",".join(DEFAULT_PRAGMAS),
+        help="Comma-separated SQLite PRAGMAs to apply, e.g. 'synchronous=FULL,cache_size=-2000' "
+        "(pass '' to keep the storage defaults)",
+    )
+    parser.add_argument(
+        "--planner-stats",
+        choices=["optimize", "analyze", "none"],
+        default="optimize",
+        help="How to gather query-planner statistics after loading (compare runs to see the gain)",
+    )
+    parser.add_argument(
+        "--extra-indexes",
+        action="store_true",
+        help="Create (sort_key, id) indexes for the ORDER BY benchmarks to measure their effect",
+    )
+    parser.add_argument(
+        "--readers",
+        type=int,
+        default=0,
+        help="Run benchmarks concurrently over N read-only connections (file databases only)",
+    )
+    parser.add_argument(
+        "--page-size",
+        type=int,
+        default=8192,
+        help="SQLite page size in bytes; changes B-tree depth and therefore results (0 keeps the default)",
+    )
     args = parser.parse_args()
 
-    benchmark = QueryBenchmark(args.db_path)
+    pragmas = [p for p in args.pragmas.split(",") if p.strip()]
+    benchmark = QueryBenchmark(
+        args.db_path,
+        pragmas=pragmas,
+        planner_stats=args.planner_stats,
+        extra_indexes=args.extra_indexes,
+        readers=args.readers,
+        page_size=args.page_size,
+    )
 
     try:
         # Setup test data
@@ -11,19 +11,36 @@ Add to crontab:
 
 import asyncio
 import logging
+import logging.handlers
+import queue
 import sys
 from datetime import datetime
 
 from ragversion import AsyncVersionTracker
 
-# Configure logging
-logging.basicConfig(
-    level=logging.INFO,
-    format="%(asctime)s - %(name)s - %(levelname)s - %(message)s",
-)
 logger = logging.getLogger(__name__)
 
 
+def configure_logging() -> logging.handlers.QueueListener:
+    """Route log records through a queue so writes happen off the event loop.
+
+    Returns the started listener; call ``stop()`` on it to flush before exit.
+    """
+    handler = logging.StreamHandler()
+    handler.setFormatter(
+        logging.Formatter("%(asctime)s - %(name)s - %(levelname)s - %(message)s")
+    )
+
+    log_queue: queue.Queue = queue.Queue(-1)
+    root = logging.getLogger()
+    root.setLevel(logging.INFO)
+    root.addHandler(logging.handlers.QueueHandler(log_queue))
+
+    listener = logging.handlers.QueueListener(log_queue, handler)
+    listener.start()
+    return listener
+
+
 async def sync_documents():
     """Sync documents to RAG system."""
     logger.info("Starting document sync...")
@@ -51,13 +68,18 @@ async def sync_documents():
         logger.info(f"  Duration: {result.duration_seconds:.2f}s")
         logger.info(f"  Success rate: {result.success_rate:.1f}%")
 
-        # Log changes
-        for event in result.successful:
-            logger.info(f"  {event.change_type.value.upper()}: {event.file_name}")
+        # Log changes and errors as one record each rather than one per file
+        if result.successful:
+            logger.info("\n".join(
+                f"  {event.change_type.value.upper()}: {event.file_name}"
+                for event in result.successful
+            ))
 
-        # Log errors
-        for error in result.failed:
-            logger.error(f"  FAILED: {error.file_path} - {error.error}")
+        if result.failed:
+            logger.error("\n".join(
+                f"  FAILED: {error.file_path} - {error.error}"
+                for error in result.failed
+            ))
 
         await tracker.close()
 
@@ -71,11 +93,15 @@ async def sync_documents():
 
 def main():
     """Main entry point."""
-    logger.info(f"RAGVersion cron job started at {datetime.now()}")
+    listener = configure_logging()
+    try:
+        logger.info(f"RAGVersion cron job started at {datetime.now()}")
 
-    exit_code = asyncio.run(sync_documents())
+        exit_code = asyncio.run(sync_documents())
 
-    logger.info(f"RAGVersion cron job finished at {datetime.now()}")
+        logger.info(f"RAGVersion cron job finished at {datetime.now()}")
+    finally:
+        listener.stop()
 
     sys.exit(exit_code)
 
@@ -2,71 +2,99 @@ import httpx
 import asyncio
 import json
 from datetime import datetime
+from functools import lru_cache
+from urllib.parse import quote
+
+try:
+    import h2  # noqa: F401  (enables HTTP/2 in httpx)
+    HTTP2_AVAILABLE = True
+except ImportError:
+    HTTP2_AVAILABLE = False
+
+@lru_cache(maxsize=1024)
+def encode_path(file_path: str) -> str:
+    # Escape every reserved character (not just "/") so paths survive as one segment
+    return quote(file_path, safe="")
 
 class RAGVersionClient:
     def __init__(self, base_url: str = "http://localhost:8000"):
         self.base_url = base_url
-        self.client = httpx.AsyncClient(timeout=30.0)
+        # HTTP/2 lets the gathered requests below share one multiplexed connection;
+        # the transport owns pooling and retries failed connection attempts
+        transport = httpx.AsyncHTTPTransport(
+            http2=HTTP2_AVAILABLE,
+            limits=httpx.Limits(
+                max_keepalive_connections=32,
+                max_connections=64,
+                keepalive_expiry=30,
+            ),
+            retries=2,
+        )
+        self.client = httpx.AsyncClient(
+            base_url=base_url,
+            timeout=httpx.Timeout(30.0, connect=5.0),
+            transport=transport,
+        )
     
     async def close(self):
         await self.client.aclose()
     
     async def get_stats(self):
-        response = await self.client.get(f"{self.base_url}/api/stats")
+        response = await self.client.get("/api/stats")
         return response.json()
     
     async def get_changes(self, limit: int = 20, file_type: str = None):
         params = {"limit": limit}
         if file_type:
             params["file_type"] = file_type
-        response = await self.client.get(f"{self.base_url}/api/changes", params=params)
+        response = await self.client.get("/api/changes", params=params)
         return response.json()
     
     async def list_documents(self, limit: int = 50, file_type: str = None):
         params = {"limit": limit}
         if file_type:
             params["file_type"] = file_type
-        response = await self.client.get(f"{self.base_url}/api/documents", params=params)
+        response = await self.client.get("/api/documents", params=params)
         return response.json()
     
     async def get_document(self, file_path: str):
-        encoded_path = file_path.replace("/", "%2F")
-        response = await self.client.get(f"{self.base_url}/api/documents/{encoded_path}")
+        encoded_path = encode_path(file_path)
+        response = await self.client.get(f"/api/documents/{encoded_path}")
         return response.json()
     
     async def get_version(self, file_path: str, version_number: int):
-        encoded_path = file_path.replace("/", "%2F")
+        encoded_path = encode_path(file_path)
         response = await self.client.get(
-            f"{self.base_url}/api/documents/{encoded_path}/versions/{version_number}"
+            f"/api/documents/{encoded_path}/versions/{version_number}"
         )
         return response.json()
     
     async def get_chunks(self, file_path: str):
-        encoded_path = file_path.replace("/", "%2F")
-        response = await self.client.get(f"{self.base_url}/api/documents/{encoded_path}/chunks")
+        encoded_path = encode_path(file_path)
+        response = await self.client.get(f"/api/documents/{encoded_path}/chunks")
         return response.json()
     
     async def sync_all(self):
-        response = await self.client.post(f"{self.base_url}/api/sync")
+        response = await self.client.post("/api/sync")
         return response.json()
     
     async def sync_file(self, file_path: str):
-        encoded_path = file_path.replace("/", "%2F")
-        response = await self.client.post(f"{self.base_url}/api/sync/{encoded_path}")
+        encoded_path = encode_path(file_path)
+        response = await self.client.post(f"/api/sync/{encoded_path}")
         return response.json()
     
     async def compare_versions(self, file_path: str, v1: int, v2: int):
-        encoded_path = file_path.replace("/", "%2F")
+        encoded_path = encode_path(file_path)
         params = {"v1": v1, "v2": v2}
         response = await self.client.get(
-            f"{self.base_url}/api/compare/{encoded_path}",
+            f"/api/compare/{encoded_path}",
             params=params
         )
         return response.json()
     
     async def delete_document(self, file_path: str):
-        encoded_path = file_path.replace("/", "%2F")
-        response = await self.client.delete(f"{self.base_url}/api/documents/{encoded_path}")
+        encoded_path = encode_path(file_path)
+        response = await self.client.delete(f"/api/documents/{encoded_path}")
         return response.json()
 
 async def main():
@@ -77,16 +105,18 @@ async def main():
         print("RAGVersion API Client Example")
         print("=" * 60)
         
-        # Get statistics
-        print("\n1. Getting system statistics...")
-        stats = await client.get_stats()
+        # Independent calls go out together instead of one round trip each
+        print("\n1. Getting statistics, documents and recent changes...")
+        stats, documents, changes = await asyncio.gather(
+            client.get_stats(),
+            client.list_documents(),
+            client.get_changes(limit=5),
+        )
         print(f"   Total documents: {stats['total_documents']}")
         print(f"   Monitor active: {stats['monitor_active']}")
         print(f"   Monitor interval: {stats['monitor_interval_seconds']}s")
         
-        # List documents
         print("\n2. Listing all documents...")
-        documents = await client.list_documents()
         print(f"   Found {len(documents)} documents")
         
         if documents:
@@ -97,34 +127,31 @@ async def main():
             print(f"   Current version: {doc['current_version']}")
             print(f"   File size: {doc['file_size']} bytes")
             
-            # Get document details
-            print("\n3. Getting document details...")
-            details = await client.get_document(file_path)
+            # Details and chunks only depend on the file path
+            print("\n3. Getting document details and chunks...")
+            details, chunks = await asyncio.gather(
+                client.get_document(file_path),
+                client.get_chunks(file_path),
+            )
             print(f"   Total versions: {details['total_versions']}")
-            
-            # Get chunks
-            print("\n4. Getting document chunks...")
-            chunks = await client.get_chunks(file_path)
             print(f"   Total chunks: {chunks['total_chunks']}")
             print(f"   First chunk preview: {chunks['chunks'][0]['content_preview'][:100]}...")
             
             # Compare versions if multiple versions exist
             if details['total_versions'] >= 2:
-                print("\n5. Comparing versions...")
+                print("\n4. Comparing versions...")
                 comparison = await client.compare_versions(file_path, 1, 2)
                 print(f"   Content length diff: {comparison['difference']['content_length_diff']:+d}")
                 print(f"   New chunks: {comparison['difference']['new_chunks_count']}")
                 print(f"   Removed chunks: {comparison['difference']['removed_chunks_count']}")
         
-        # Get recent changes
-        print("\n6. Getting recent changes...")
-        changes = await client.get_changes(limit=5)
+        print("\n5. Recent changes...")
         print(f"   Recent changes: {len(changes)}")
         for change in changes:
             print(f"   - {change['file_path']}: {change['change_type']} (v{change['current_version']})")
         
         # Sync all documents
-        print("\n7. Syncing all documents...")
+        print("\n6. Syncing all documents...")
         sync_result = await client.sync_all()
         print(f"   Synced files: {sync_result['synced_files']}")
         print(f"   Duration: {sync_result['duration_ms']}ms")
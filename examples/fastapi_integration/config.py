@@ -1,17 +1,22 @@
-import os
-from dotenv import load_dotenv
-from pydantic_settings import BaseSettings
+from functools import lru_cache
 
-load_dotenv()
+from dotenv import load_dotenv
+from pydantic_settings import BaseSettings, SettingsConfigDict
 
 class Settings(BaseSettings):
+    model_config = SettingsConfigDict(env_file=".env", frozen=True)
+
     supabase_url: str
     supabase_key: str
     documents_directory: str = "./documents"
     monitor_interval: int = 30
     sync_on_startup: bool = True
-    
-    class Config:
-        env_file = ".env"
+    # Read /api/changes from the migration 003 materialized view; only enable
+    # when its refresh is scheduled (see 003_latest_version_view.sql)
+    use_latest_version_view: bool = False
 
-settings = Settings()
+@lru_cache(maxsize=1)
+def get_settings() -> Settings:
+    # Parse .env and validate once per process; usable as a FastAPI dependency
+    load_dotenv()
+    return Settings()
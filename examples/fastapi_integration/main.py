@@ -1,27 +1,33 @@
 import os
+import asyncio
 import hashlib
+import time
+from collections import Counter, OrderedDict
+from concurrent.futures import ProcessPoolExecutor
 from datetime import datetime
-from typing import List, Optional
+from typing import Dict, List, NamedTuple, Optional, Set, Tuple
 from pathlib import Path
 
+import orjson
 from fastapi import FastAPI, HTTPException, WebSocket, WebSocketDisconnect, BackgroundTasks
 from fastapi.middleware.cors import CORSMiddleware
+from fastapi.responses import ORJSONResponse
 from pydantic import BaseModel
-from dotenv import load_dotenv
 
 from ragversion import AsyncVersionTracker
-from ragversion.integrations.langchain import LangChainSync
-from langchain_text_splitters import RecursiveCharacterTextSplitter
+from ragversion.storage import SupabaseStorage
+from ragversion.integrations.langchain import LangChainSync, get_text_splitter
 
-from config import settings
+from config import get_settings
 from monitor import ChangeMonitor
 
-load_dotenv()
+settings = get_settings()
 
 app = FastAPI(
     title="RAGVersion API",
     description="FastAPI integration with RAGVersion for tracking document changes",
-    version="1.0.0"
+    version="1.0.0",
+    default_response_class=ORJSONResponse
 )
 
 app.add_middleware(
@@ -33,17 +39,72 @@ app.add_middleware(
 )
 
 tracker = AsyncVersionTracker(
-    supabase_url=settings.supabase_url,
-    supabase_key=settings.supabase_key
+    storage=SupabaseStorage(
+        url=settings.supabase_url,
+        key=settings.supabase_key,
+        latest_version_view=settings.use_latest_version_view
+    )
 )
 
-text_splitter = RecursiveCharacterTextSplitter(chunk_size=1000, chunk_overlap=200)
+# Uses the Rust semantic-text-splitter when installed
+text_splitter = get_text_splitter(chunk_size=1000, chunk_overlap=200)
+
+# Splitting and hashing are CPU-bound; a process pool keeps them off the event
+# loop and out of the GIL so Uvicorn keeps serving requests. Created on startup.
+split_pool: Optional[ProcessPoolExecutor] = None
 embeddings = None
 vectorstore = None
 
 monitor = ChangeMonitor(tracker, interval=settings.monitor_interval)
 
-active_websockets: List[WebSocket] = []
+def split_and_hash(splitter, content: str):
+    # Runs in a worker process; hashlib hands each buffer to OpenSSL, which uses
+    # SHA extensions when present
+    chunks = splitter.split_text(content)
+    return chunks, [hashlib.sha256(chunk.encode()).hexdigest() for chunk in chunks]
+
+class VersionChunks(NamedTuple):
+    content_length: int
+    chunks: List[str]
+    hashes: List[str]
+
+# Versions are immutable, so their split chunks and hashes can be cached by id
+CHUNK_CACHE_SIZE = 256
+chunk_cache: "OrderedDict[str, VersionChunks]" = OrderedDict()
+
+async def get_version_chunks(version) -> VersionChunks:
+    key = str(version.id)
+    cached = chunk_cache.get(key)
+    if cached is not None:
+        chunk_cache.move_to_end(key)
+        return cached
+    
+    content = await tracker.storage.get_content(version.id)
+    chunks, hashes = await asyncio.get_running_loop().run_in_executor(
+        split_pool, split_and_hash, text_splitter, content
+    )
+    
+    result = VersionChunks(len(content), chunks, hashes)
+    chunk_cache[key] = result
+    if len(chunk_cache) > CHUNK_CACHE_SIZE:
+        chunk_cache.popitem(last=False)
+    return result
+
+# Each client gets its own outbound queue drained by a writer task, so a slow
+# client never holds up the monitor's change callbacks
+active_queues: Dict[WebSocket, asyncio.Queue] = {}
+
+# Messages buffered per client before it's considered too slow and closed
+CLIENT_QUEUE_SIZE = 256
+
+# Strong references to pending close tasks so they aren't garbage-collected
+close_tasks: Set[asyncio.Task] = set()
+
+async def close_slow_client(ws: WebSocket):
+    try:
+        await ws.close(code=1013)
+    except Exception as e:
+        print(f"Error closing slow WebSocket client: {e}")
 
 class SyncResponse(BaseModel):
     synced_files: int
@@ -78,25 +139,44 @@ class ChangeSummary(BaseModel):
     current_version: int
     timestamp: datetime
 
+def unmatched_indices(hashes: List[str], other: List[str]) -> List[int]:
+    # Multiset difference: a chunk repeated more often than in `other` counts as new
+    available = Counter(other)
+    unmatched = []
+    for i, h in enumerate(hashes):
+        if available[h]:
+            available[h] -= 1
+        else:
+            unmatched.append(i)
+    return unmatched
+
 @app.on_event("startup")
 async def startup_event():
+    global split_pool, stats_lock
     os.makedirs(settings.documents_directory, exist_ok=True)
+    split_pool = ProcessPoolExecutor(max_workers=os.cpu_count())
+    # Created here so it binds to the server's loop (Python 3.9 binds on construction)
+    stats_lock = asyncio.Lock()
     
     async def log_change_to_db(file_path: str, *args):
         print(f"📝 Change logged: {file_path}")
     
     async def notify_websockets(file_path: str, change_type: str, *args):
-        message = {
+        # Encode once and share the text across every client
+        payload = orjson.dumps({
             "type": "change",
             "file_path": file_path,
             "change_type": change_type,
-            "timestamp": datetime.now().isoformat()
-        }
-        for ws in active_websockets:
+            "timestamp": datetime.now()
+        }).decode()
+        for ws, queue in list(active_queues.items()):
             try:
-                await ws.send_json(message)
-            except:
-                pass
+                queue.put_nowait(payload)
+            except asyncio.QueueFull:
+                active_queues.pop(ws, None)
+                task = asyncio.create_task(close_slow_client(ws))
+                close_tasks.add(task)
+                task.add_done_callback(close_tasks.discard)
     
     monitor.on('created', log_change_to_db)
     monitor.on('modified', log_change_to_db)
@@ -113,6 +193,8 @@ async def startup_event():
 @app.on_event("shutdown")
 async def shutdown_event():
     await monitor.stop()
+    if split_pool:
+        split_pool.shutdown(cancel_futures=True)
 
 @app.get("/")
 async def root():
@@ -128,13 +210,28 @@ async def root():
         }
     }
 
+# Dashboards poll /api/stats; concurrent pollers within the TTL share one result
+STATS_TTL_SECONDS = 1.0
+stats_cache: Optional[Tuple[float, dict]] = None
+stats_lock: Optional[asyncio.Lock] = None  # created on startup
+
 @app.get("/api/stats")
 async def get_stats():
-    total_docs = await tracker.storage.list_documents(limit=10000)
-    documents = await tracker.storage.list_documents(limit=10, order_by="updated_at", descending=True)
+    global stats_cache
+    async with stats_lock:
+        now = time.monotonic()
+        if stats_cache is None or now - stats_cache[0] >= STATS_TTL_SECONDS:
+            stats_cache = (now, await compute_stats())
+        return stats_cache[1]
+
+async def compute_stats() -> dict:
+    total_docs, documents = await asyncio.gather(
+        tracker.storage.count_documents(),
+        tracker.storage.list_documents(limit=10, order_by="updated_at"),
+    )
     
     return {
-        "total_documents": len(total_docs),
+        "total_documents": total_docs,
         "monitored_directory": settings.documents_directory,
         "monitor_interval_seconds": settings.monitor_interval,
         "monitor_active": monitor._running,
@@ -148,31 +245,26 @@ async def get_stats():
         ]
     }
 
-@app.get("/api/changes", response_model=List[ChangeSummary])
+# Listing endpoints return plain dicts built from storage records: re-validating
+# trusted rows through the response models costs more than encoding them. The
+# models stay in the OpenAPI schema via `responses`.
+@app.get("/api/changes", responses={200: {"model": List[ChangeSummary]}})
 async def get_changes(limit: int = 20, file_type: Optional[str] = None):
-    documents = await tracker.storage.list_documents(
-        limit=limit,
-        order_by="updated_at",
-        descending=True
-    )
-    
-    if file_type:
-        documents = [doc for doc in documents if doc.file_path.endswith(file_type)]
-    
-    changes = []
-    for doc in documents:
-        latest = await tracker.storage.get_latest_version(doc.id)
-        changes.append(ChangeSummary(
-            file_path=doc.file_path,
-            change_type=latest.change_type.value,
-            previous_version=latest.version_number - 1 if latest.version_number > 1 else None,
-            current_version=latest.version_number,
-            timestamp=latest.created_at
-        ))
-    
-    return changes
+    # One storage round trip for the latest versions; Supabase can read them from
+    # the document_latest_version view when USE_LATEST_VERSION_VIEW is set
+    rows = await tracker.storage.list_recent_changes(limit=limit, path_suffix=file_type)
+    return [
+        {
+            "file_path": row["file_path"],
+            "change_type": row["change_type"],
+            "previous_version": row["version_number"] - 1 if row["version_number"] > 1 else None,
+            "current_version": row["version_number"],
+            "timestamp": row["created_at"]
+        }
+        for row in rows
+    ]
 
-@app.get("/api/documents", response_model=List[DocumentInfo])
+@app.get("/api/documents", responses={200: {"model": List[DocumentInfo]}})
 async def list_documents(limit: int = 50, file_type: Optional[str] = None):
     documents = await tracker.storage.list_documents(limit=limit)
     
@@ -180,15 +272,15 @@ async def list_documents(limit: int = 50, file_type: Optional[str] = None):
         documents = [doc for doc in documents if doc.file_path.endswith(file_type)]
     
     return [
-        DocumentInfo(
-            file_path=doc.file_path,
-            current_version=doc.current_version,
-            content_hash=doc.content_hash,
-            file_size=doc.file_size,
-            file_type=Path(doc.file_path).suffix,
-            created_at=doc.created_at,
-            updated_at=doc.updated_at
-        )
+        {
+            "file_path": doc.file_path,
+            "current_version": doc.current_version,
+            "content_hash": doc.content_hash,
+            "file_size": doc.file_size,
+            "file_type": Path(doc.file_path).suffix,
+            "created_at": doc.created_at,
+            "updated_at": doc.updated_at
+        }
         for doc in documents
     ]
 
@@ -248,9 +340,7 @@ async def get_document_chunks(file_path: str):
         raise HTTPException(status_code=404, detail="Document not found")
     
     latest = await tracker.storage.get_latest_version(doc.id)
-    content = await tracker.storage.get_content(latest.id)
-    
-    chunks = text_splitter.split_text(content)
+    _, chunks, hashes = await get_version_chunks(latest)
     
     return {
         "file_path": file_path,
@@ -261,20 +351,20 @@ async def get_document_chunks(file_path: str):
                 "index": i,
                 "content_preview": chunk[:200] + "..." if len(chunk) > 200 else chunk,
                 "length": len(chunk),
-                "hash": hashlib.sha256(chunk.encode()).hexdigest()[:16]
+                "hash": chunk_hash[:16]
             }
-            for i, chunk in enumerate(chunks)
+            for i, (chunk, chunk_hash) in enumerate(zip(chunks, hashes))
         ]
     }
 
 @app.post("/api/sync", response_model=SyncResponse)
 async def sync_directory(background_tasks: BackgroundTasks):
-    start_time = datetime.now()
+    start = time.perf_counter_ns()
     
-    sync = LangChainSync(tracker, text_splitter, embeddings, vectorstore)
+    sync = LangChainSync(tracker, text_splitter, embeddings, vectorstore, executor=split_pool)
     events = await sync.sync_directory(settings.documents_directory)
     
-    duration_ms = int((datetime.now() - start_time).total_seconds() * 1000)
+    duration_ms = (time.perf_counter_ns() - start) // 1_000_000
     
     background_tasks.add_task(monitor.sync_now, settings.documents_directory)
     
@@ -299,12 +389,12 @@ async def sync_file(file_path: str, background_tasks: BackgroundTasks):
     if not os.path.exists(full_path):
         raise HTTPException(status_code=404, detail="File not found")
     
-    start_time = datetime.now()
+    start = time.perf_counter_ns()
     
-    sync = LangChainSync(tracker, text_splitter, embeddings, vectorstore)
+    sync = LangChainSync(tracker, text_splitter, embeddings, vectorstore, executor=split_pool)
     events = await sync.sync_file(full_path)
     
-    duration_ms = int((datetime.now() - start_time).total_seconds() * 1000)
+    duration_ms = (time.perf_counter_ns() - start) // 1_000_000
     
     return {
         "file_path": file_path,
@@ -332,32 +422,30 @@ async def compare_versions(file_path: str, v1: int, v2: int):
     if not version1 or not version2:
         raise HTTPException(status_code=404, detail="One or both versions not found")
     
-    content1 = await tracker.storage.get_content(version1.id)
-    content2 = await tracker.storage.get_content(version2.id)
-    
-    chunks1 = text_splitter.split_text(content1)
-    chunks2 = text_splitter.split_text(content2)
-    
-    hash1 = [hashlib.sha256(c.encode()).hexdigest() for c in chunks1]
-    hash2 = [hashlib.sha256(c.encode()).hexdigest() for c in chunks2]
-    
-    new_chunks = [i for i, h in enumerate(hash2) if h not in hash1]
-    removed_chunks = [i for i, h in enumerate(hash1) if h not in hash2]
+    length1, chunks1, hash1 = await get_version_chunks(version1)
+    if version1.content_hash == version2.content_hash:
+        # Identical content: reuse the first version's chunks and skip the diff
+        length2, chunks2 = length1, chunks1
+        new_chunks, removed_chunks = [], []
+    else:
+        length2, chunks2, hash2 = await get_version_chunks(version2)
+        new_chunks = unmatched_indices(hash2, hash1)
+        removed_chunks = unmatched_indices(hash1, hash2)
     
     return {
         "file_path": file_path,
         "version1": {
             "number": v1,
-            "content_length": len(content1),
+            "content_length": length1,
             "total_chunks": len(chunks1)
         },
         "version2": {
             "number": v2,
-            "content_length": len(content2),
+            "content_length": length2,
             "total_chunks": len(chunks2)
         },
         "difference": {
-            "content_length_diff": len(content2) - len(content1),
+            "content_length_diff": length2 - length1,
             "new_chunks_count": len(new_chunks),
             "removed_chunks_count": len(removed_chunks),
             "new_chunk_indices": new_chunks,
@@ -365,16 +453,29 @@ async def compare_versions(file_path: str, v1: int, v2: int):
         }
     }
 
+async def websocket_writer(websocket: WebSocket, queue: asyncio.Queue):
+    while True:
+        payload = await queue.get()
+        try:
+            await websocket.send_text(payload)
+        except Exception:
+            return
+
 @app.websocket("/ws/changes")
 async def websocket_changes(websocket: WebSocket):
     await websocket.accept()
-    active_websockets.append(websocket)
+    queue = asyncio.Queue(maxsize=CLIENT_QUEUE_SIZE)
+    active_queues[websocket] = queue
+    writer = asyncio.create_task(websocket_writer(websocket, queue))
     
     try:
         while True:
             await websocket.receive_text()
     except WebSocketDisconnect:
-        active_websockets.remove(websocket)
+        pass
+    finally:
+        active_queues.pop(websocket, None)
+        writer.cancel()
 
 @app.delete("/api/documents/{file_path:path}")
 async def delete_document(file_path: str):
@@ -1,9 +1,24 @@
 import asyncio
 import hashlib
 import os
-from typing import Callable, Dict, List, Optional
+from typing import Callable, Dict, Iterable, List, Optional, Set, Tuple
 from datetime import datetime
 from ragversion import AsyncVersionTracker, ChangeEvent
+from ragversion.models import Document
+
+try:
+    from watchfiles import awatch
+    WATCHFILES_AVAILABLE = True
+except ImportError:
+    WATCHFILES_AVAILABLE = False
+
+HASH_BUFFER_SIZE = 1 << 20
+
+# Files checked concurrently during a scan
+SCAN_CONCURRENCY = 32
+
+# Documents fetched per storage request when loading the tracked set
+DOCUMENT_PAGE_SIZE = 1000
 
 class ChangeMonitor:
     def __init__(self, tracker: AsyncVersionTracker, interval: int = 30):
@@ -17,7 +32,8 @@ class ChangeMonitor:
             'deleted': [],
             'restored': []
         }
-        self.known_files: Dict[str, str] = {}
+        # file path -> (mtime_ns, size, sha256) as of the last time it was hashed
+        self.known_files: Dict[str, Tuple[int, int, str]] = {}
     
     def on(self, event_type: str, callback: Callable):
         if event_type in self.callbacks:
@@ -38,42 +54,141 @@ class ChangeMonitor:
                 print(f"Error in callback: {e}")
     
     def _compute_file_hash(self, file_path: str) -> str:
+        # Stream through a reused 1 MiB buffer so memory stays flat for large files
         try:
-            with open(file_path, 'rb') as f:
-                return hashlib.sha256(f.read()).hexdigest()
+            digest = hashlib.sha256()
+            buffer = bytearray(HASH_BUFFER_SIZE)
+            view = memoryview(buffer)
+            with open(file_path, 'rb', buffering=0) as f:
+                while n := f.readinto(buffer):
+                    digest.update(view[:n])
+            return digest.hexdigest()
         except Exception:
             return ""
     
-    async def _check_file(self, file_path: str):
-        existing = await self.tracker.storage.get_document_by_path(file_path)
-        current_hash = self._compute_file_hash(file_path)
+    @staticmethod
+    def _list_files(directory: str) -> Dict[str, Tuple[int, int]]:
+        # Walk and stat in one blocking pass, meant to run in a worker thread
+        files = {}
+        for root, _, names in os.walk(directory):
+            for name in names:
+                file_path = os.path.abspath(os.path.join(root, name))
+                try:
+                    stat = os.stat(file_path)
+                except OSError:
+                    continue
+                files[file_path] = (stat.st_mtime_ns, stat.st_size)
+        return files
+
+    async def _load_documents(self) -> Dict[str, Document]:
+        # Keyset-paginate through every tracked document, keyed by path
+        documents: Dict[str, Document] = {}
+        after = None
+        while True:
+            page = await self.tracker.storage.list_documents(limit=DOCUMENT_PAGE_SIZE, after=after)
+            documents.update((doc.file_path, doc) for doc in page)
+            if len(page) < DOCUMENT_PAGE_SIZE:
+                return documents
+            last = page[-1]
+            after = (last.updated_at.isoformat(), str(last.id))
+
+    async def _check_file(
+        self,
+        file_path: str,
+        signature: Tuple[int, int],
+        existing: Optional[Document],
+    ):
+        known = self.known_files.get(file_path)
+        current_hash = await asyncio.to_thread(self._compute_file_hash, file_path)
+        if not current_hash:
+            return
         
         if not existing:
             await self._emit('created', file_path, current_hash)
-            self.known_files[file_path] = current_hash
-        elif current_hash and current_hash != self.known_files.get(file_path, ""):
-            latest = await self.tracker.storage.get_latest_version(existing.id)
-            if latest.content_hash != current_hash:
+        else:
+            # known_files is authoritative once seeded; the stored document hash
+            # (that of its latest version) covers files not seen since startup
+            previous_hash = known[2] if known else existing.content_hash
+            if current_hash != previous_hash:
                 await self._emit('modified', file_path, 
                                existing.current_version, 
                                existing.current_version + 1,
                                current_hash)
-                self.known_files[file_path] = current_hash
+        self.known_files[file_path] = (*signature, current_hash)
     
-    async def _scan_directory(self, directory: str):
-        current_files = set()
-        
-        for root, _, files in os.walk(directory):
-            for file in files:
-                file_path = os.path.abspath(os.path.join(root, file))
-                current_files.add(file_path)
-                await self._check_file(file_path)
-        
-        deleted_files = set(self.known_files.keys()) - current_files
+    @staticmethod
+    def _stat_paths(paths: Iterable[str]) -> Dict[str, Tuple[int, int]]:
+        # Stat only the given paths; missing files and directories are left out
+        files = {}
+        for file_path in paths:
+            try:
+                stat = os.stat(file_path)
+            except OSError:
+                continue
+            if os.path.isfile(file_path):
+                files[file_path] = (stat.st_mtime_ns, stat.st_size)
+        return files
+
+    async def _reconcile(
+        self,
+        current_files: Dict[str, Tuple[int, int]],
+        deleted_files: Set[str],
+        bulk_lookup: bool,
+    ):
+        # Unchanged files resolve from the cache without any storage or file access
+        changed = {
+            file_path: signature
+            for file_path, signature in current_files.items()
+            if self.known_files.get(file_path, ())[:2] != signature
+        }
+
+        if changed:
+            # A full scan loads the tracked set once; an event batch looks up only
+            # its own paths, so its storage work follows the events, not the table
+            by_path = await self._load_documents() if bulk_lookup else None
+            semaphore = asyncio.Semaphore(SCAN_CONCURRENCY)
+
+            async def bounded_check(file_path: str, signature: Tuple[int, int]):
+                async with semaphore:
+                    if by_path is not None:
+                        existing = by_path.get(file_path)
+                    else:
+                        existing = await self.tracker.storage.get_document_by_path(file_path)
+                    await self._check_file(file_path, signature, existing)
+
+            await asyncio.gather(*(
+                bounded_check(file_path, signature)
+                for file_path, signature in changed.items()
+            ))
+
         for file_path in deleted_files:
             await self._emit('deleted', file_path)
             del self.known_files[file_path]
     
+    async def _scan_directory(self, directory: str):
+        current_files = await asyncio.to_thread(self._list_files, directory)
+        deleted_files = set(self.known_files.keys()) - current_files.keys()
+        await self._reconcile(current_files, deleted_files, bulk_lookup=True)
+
+    async def _apply_events(self, changes: Set[Tuple[object, str]]):
+        paths = {os.path.abspath(path) for _, path in changes}
+        current_files = await asyncio.to_thread(self._stat_paths, paths)
+        # A removed directory only reports itself, so drop everything under it too
+        gone = paths - current_files.keys()
+        deleted_files = {
+            file_path
+            for file_path in self.known_files
+            if file_path not in current_files
+            and any(file_path == path or file_path.startswith(path + os.sep) for path in gone)
+        }
+        await self._reconcile(current_files, deleted_files, bulk_lookup=False)
+
+    async def _watch_directory(self, directory: str):
+        # Reconcile once, then do work only when the filesystem reports events
+        await self._scan_directory(directory)
+        async for changes in awatch(directory, recursive=True, watch_filter=None):
+            await self._apply_events(changes)
+
     async def start(self, directory: str):
         if self._running:
             return
@@ -85,7 +200,11 @@ class ChangeMonitor:
                 await self._scan_directory(directory)
                 await asyncio.sleep(self.interval)
         
-        self._task = asyncio.create_task(monitor_loop())
+        # Prefer OS file notifications (inotify, FSEvents, ...) over polling
+        if WATCHFILES_AVAILABLE:
+            self._task = asyncio.create_task(self._watch_directory(directory))
+        else:
+            self._task = asyncio.create_task(monitor_loop())
     
     async def stop(self):
         self._running = False
@@ -6,13 +6,12 @@ to automatically sync document changes to a vector store.
 """
 
 import asyncio
-from langchain.text_splitter import RecursiveCharacterTextSplitter
 from langchain_community.vectorstores import Qdrant
 from langchain_openai import OpenAIEmbeddings
 from qdrant_client import QdrantClient
 
 from ragversion import AsyncVersionTracker
-from ragversion.integrations.langchain import LangChainSync
+from ragversion.integrations.langchain import LangChainSync, get_text_splitter
 from ragversion.storage import SupabaseStorage
 
 
@@ -25,10 +24,8 @@ async def main():
     await tracker.initialize()
 
     # Initialize LangChain components
-    text_splitter = RecursiveCharacterTextSplitter(
-        chunk_size=1000,
-        chunk_overlap=200,
-    )
+    # Uses the Rust semantic-text-splitter when installed
+    text_splitter = get_text_splitter(chunk_size=1000, chunk_overlap=200)
 
     embeddings = OpenAIEmbeddings()
 
@@ -17,7 +17,6 @@ from dotenv import load_dotenv
 load_dotenv()
 
 from langchain_openai import ChatOpenAI, OpenAIEmbeddings
-from langchain_text_splitters import RecursiveCharacterTextSplitter
 from langchain_community.vectorstores import FAISS
 from langchain_core.prompts import ChatPromptTemplate
 from langchain_core.runnables import RunnablePassthrough
@@ -25,7 +24,7 @@ from langchain_core.output_parsers import StrOutputParser
 
 from ragversion import AsyncVersionTracker
 from ragversion.storage import SupabaseStorage
-from ragversion.integrations.langchain import LangChainSync
+from ragversion.integrations.langchain import LangChainSync, get_text_splitter
 
 
 async def setup_rag_system():
@@ -43,10 +42,8 @@ async def setup_rag_system():
 
     # Step 2: Set up LangChain components
     embeddings = OpenAIEmbeddings()
-    text_splitter = RecursiveCharacterTextSplitter(
-        chunk_size=1000,
-        chunk_overlap=200,
-    )
+    # Uses the Rust semantic-text-splitter when installed
+    text_splitter = get_text_splitter(chunk_size=1000, chunk_overlap=200)
 
     # Initialize FAISS vector store (or use Chroma, Pinecone, etc.)
     # Create from existing documents or initialize empty
@@ -208,7 +205,7 @@ async def main():
     # Sync again (only the changed document will be processed)
     sync = LangChainSync(
         tracker=tracker,
-        text_splitter=RecursiveCharacterTextSplitter(chunk_size=1000, chunk_overlap=200),
+        text_splitter=get_text_splitter(chunk_size=1000, chunk_overlap=200),
         embeddings=OpenAIEmbeddings(),
         vectorstore=vectorstore,
     )
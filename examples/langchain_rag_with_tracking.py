@@ -12,22 +12,108 @@ Key Features:
 """
 
 import asyncio
+import hashlib
+import json
 import os
+import sys
 from pathlib import Path
+from typing import Dict, List, NamedTuple, Optional, Tuple
 from dotenv import load_dotenv
 
 load_dotenv()
 
-from langchain_openai import ChatOpenAI, OpenAIEmbeddings
-from langchain_text_splitters import RecursiveCharacterTextSplitter
-from langchain_community.vectorstores import FAISS
-from langchain_core.prompts import ChatPromptTemplate
-from langchain_core.runnables import RunnablePassthrough
-from langchain_core.output_parsers import StrOutputParser
+# LangChain, OpenAI and FAISS are imported where they're used, so ChangeTracker
+# can be imported without loading them
 
 from ragversion import AsyncVersionTracker
 from ragversion.storage import SupabaseStorage
-from ragversion.integrations.langchain import LangChainSync
+
+try:
+    from blake3 import blake3
+    BLAKE3_AVAILABLE = True
+except ImportError:
+    BLAKE3_AVAILABLE = False
+
+# Copying an initialized context is cheaper than constructing a new one per chunk
+_SHA256_PROTOTYPE = hashlib.sha256()
+
+
+def hash_chunks(chunks: List[str]) -> List[int]:
+    """
+    Compute a 64-bit hash for each chunk.
+
+    Integer hashes make set comparisons between versions cheap; format them
+    with ``format_hash`` for display. All chunks are encoded into one
+    contiguous buffer and hashed as zero-copy slices of it. Uses BLAKE3 when
+    the ``blake3`` package is installed, reusing one hasher for every chunk;
+    otherwise SHA-256, copying one initialized context per chunk.
+    """
+    buffer = bytearray()
+    offsets = [0]
+    for chunk in chunks:
+        buffer += chunk.encode("utf-8", "surrogatepass")
+        offsets.append(len(buffer))
+    view = memoryview(buffer)
+    slices = [view[start:end] for start, end in zip(offsets, offsets[1:])]
+
+    if not BLAKE3_AVAILABLE:
+        # Bound once so the loop does a local lookup instead of a global plus attribute
+        new_context = _SHA256_PROTOTYPE.copy
+        hashes = []
+        for data in slices:
+            hasher = new_context()
+            hasher.update(data)
+            hashes.append(int.from_bytes(hasher.digest()[:8], "big"))
+        return hashes
+
+    hasher = blake3()
+    hashes = []
+    for data in slices:
+        hasher.update(data)
+        hashes.append(int.from_bytes(hasher.digest(length=8), "big"))
+        hasher.reset()
+    return hashes
+
+
+def format_hash(chunk_hash: int) -> str:
+    """Format a chunk hash as 16 hex characters."""
+    return f"{chunk_hash:016x}"
+
+
+def make_preview(chunk: str) -> str:
+    """Shorten a chunk to a 100 character preview."""
+    return chunk[:100] + "..." if len(chunk) > 100 else chunk
+
+
+# Chunk analyses persisted between runs, keyed by version content hash. This is
+# a side file rather than the library's chunks table, which belongs to the
+# tracker's own chunk tracking
+CHUNK_CACHE_PATH = ".ragversion_chunk_cache.json"
+# Least recently used analyses beyond this are dropped when the file is saved
+CHUNK_CACHE_MAX_ENTRIES = 1024
+
+
+def chunk_cache_fingerprint(text_splitter) -> str:
+    """
+    Describe everything a stored chunk analysis depends on.
+
+    Analyses only carry over between runs that split with the same splitter
+    class and settings and hash with the same algorithm.
+    """
+    splitter = type(text_splitter)
+    return ":".join([
+        "blake3" if BLAKE3_AVAILABLE else "sha256",
+        f"{splitter.__module__}.{splitter.__qualname__}",
+        str(getattr(text_splitter, "_chunk_size", None)),
+        str(getattr(text_splitter, "_chunk_overlap", None)),
+    ])
+
+
+class VersionChunks(NamedTuple):
+    content_length: int
+    sizes: List[int]
+    hashes: List[int]
+    previews: List[str]
 
 
 class ChangeTracker:
@@ -35,10 +121,116 @@ class ChangeTracker:
     Helper class to track and display document changes.
     """
     
-    def __init__(self, tracker, text_splitter):
+    def __init__(
+        self,
+        tracker,
+        text_splitter,
+        max_concurrency: int = 16,
+        cache_path: Optional[str] = CHUNK_CACHE_PATH,
+    ):
         self.tracker = tracker
         self.text_splitter = text_splitter
         self.changes_detected = []
+        # (document id, version number) -> chunk analysis of that version
+        self._chunk_cache: Dict[Tuple[str, int], VersionChunks] = {}
+        # file path -> ((mtime_ns, size), change info) as of the last tracked pass
+        self._file_cache: Dict[str, Tuple[Tuple[int, int], dict]] = {}
+        # Bounds concurrent lookups so gathered calls don't exhaust the storage pool
+        self._semaphore = asyncio.Semaphore(max_concurrency)
+        # content hash -> chunk analysis, loaded from and saved to cache_path;
+        # ordered from least to most recently used
+        self.cache_path = cache_path
+        self._cache_fingerprint = chunk_cache_fingerprint(text_splitter)
+        self._stored_chunks: Dict[str, dict] = self._read_chunk_cache()
+        self._stored_chunks_dirty = False
+
+    def reset(self):
+        """
+        Clear detected changes and cached chunks before a new sync.
+        """
+        self.changes_detected = []
+        self._chunk_cache.clear()
+
+    def _split_and_hash(self, content: str) -> VersionChunks:
+        chunks = self.text_splitter.split_text(content) if content else []
+        return VersionChunks(
+            content_length=len(content) if content else 0,
+            sizes=[len(chunk) for chunk in chunks],
+            hashes=hash_chunks(chunks),
+            previews=[make_preview(chunk) for chunk in chunks],
+        )
+
+    def _read_chunk_cache(self) -> Dict[str, dict]:
+        if not self.cache_path or not os.path.exists(self.cache_path):
+            return {}
+        try:
+            with open(self.cache_path, encoding="utf-8") as f:
+                data = json.load(f)
+        except (OSError, ValueError):
+            # A corrupt or unreadable cache only costs a recompute
+            return {}
+        # Analyses from another splitter or hash algorithm would not match fresh ones
+        if not isinstance(data, dict) or data.get("fingerprint") != self._cache_fingerprint:
+            return {}
+        return data.get("chunks", {})
+
+    def save_chunk_cache(self):
+        """
+        Write chunk analyses computed since the last save to the cache file.
+        """
+        if not self.cache_path or not self._stored_chunks_dirty:
+            return
+        for content_hash in list(self._stored_chunks)[:-CHUNK_CACHE_MAX_ENTRIES]:
+            del self._stored_chunks[content_hash]
+        with open(self.cache_path, "w", encoding="utf-8") as f:
+            json.dump({"fingerprint": self._cache_fingerprint, "chunks": self._stored_chunks}, f)
+        self._stored_chunks_dirty = False
+
+    def _load_stored_chunks(self, content_hash: str) -> Optional[VersionChunks]:
+        """
+        Rebuild a version's chunk analysis from the cache file.
+        """
+        stored = self._stored_chunks.pop(content_hash, None)
+        if stored is None:
+            return None
+        # Re-insert as most recently used so saving keeps it
+        self._stored_chunks[content_hash] = stored
+        self._stored_chunks_dirty = True
+        return VersionChunks(
+            content_length=stored["content_length"],
+            sizes=stored["sizes"],
+            hashes=stored["hashes"],
+            previews=stored["previews"],
+        )
+
+    def _store_chunks(self, content_hash: str, analysis: VersionChunks):
+        """
+        Remember a version's chunk analysis so later runs skip fetching and splitting.
+        """
+        self._stored_chunks[content_hash] = analysis._asdict()
+        self._stored_chunks_dirty = True
+
+    async def _get_version_chunks(self, doc_id, version_number: int, version=None) -> VersionChunks:
+        """
+        Analyze a version's chunks, reusing earlier results.
+
+        Looks in the in-memory cache, then in the cache file written by an
+        earlier run, and only then fetches, splits and hashes the content.
+        """
+        key = (str(doc_id), version_number)
+        cached = self._chunk_cache.get(key)
+        if cached is None:
+            if version is None:
+                version = await self.tracker.storage.get_version_by_number(doc_id, version_number)
+            cached = self._load_stored_chunks(version.content_hash)
+            if cached is None:
+                content = await self.tracker.storage.get_content(version.id)
+                # Split and hash in a worker thread so concurrent files keep their
+                # storage requests moving; hashlib releases the GIL on large buffers
+                cached = await asyncio.to_thread(self._split_and_hash, content)
+                self._store_chunks(version.content_hash, cached)
+            self._chunk_cache[key] = cached
+        return cached
     
     async def track_changes(self, file_path):
         """
@@ -47,8 +239,22 @@ class ChangeTracker:
         Returns:
             dict: Detailed change information including chunks
         """
+        async with self._semaphore:
+            return await self._track_changes(file_path)
+
+    async def _track_changes(self, file_path):
         normalized_path = str(Path(file_path).absolute())
         
+        # A file whose mtime and size haven't moved needs no storage access at all
+        try:
+            stat = os.stat(normalized_path)
+            signature = (stat.st_mtime_ns, stat.st_size)
+        except OSError:
+            signature = None
+        cached = self._file_cache.get(normalized_path)
+        if signature is not None and cached and cached[0] == signature:
+            return {**cached[1], "status": "UNCHANGED"}
+
         # Get document info
         doc = await self.tracker.storage.get_document_by_path(normalized_path)
         
@@ -62,23 +268,16 @@ class ChangeTracker:
         # Get latest version
         latest_version = await self.tracker.storage.get_latest_version(doc.id)
         
-        # Get content
-        content = await self.tracker.storage.get_content(latest_version.id)
-        
-        # Analyze chunks
-        chunks = self.text_splitter.split_text(content) if content else []
+        # Analyze chunks (cached for compare_with_previous)
+        analysis = await self._get_version_chunks(
+            doc.id, latest_version.version_number, latest_version
+        )
         
-        # Calculate chunk hashes
-        import hashlib
-        chunk_info = []
-        for idx, chunk in enumerate(chunks, 1):
-            chunk_hash = hashlib.sha256(chunk.encode()).hexdigest()[:16]
-            chunk_info.append({
-                "index": idx,
-                "size": len(chunk),
-                "hash": chunk_hash,
-                "preview": chunk[:100] + "..." if len(chunk) > 100 else chunk
-            })
+        # Previews stay in the shared analysis and are looked up when printed
+        chunk_info = [
+            {"index": idx, "size": size, "hash": format_hash(chunk_hash)}
+            for idx, (size, chunk_hash) in enumerate(zip(analysis.sizes, analysis.hashes), 1)
+        ]
         
         change_info = {
             "file_path": file_path,
@@ -86,15 +285,19 @@ class ChangeTracker:
             "file_name": doc.file_name,
             "status": latest_version.change_type.value.upper(),
             "version_number": latest_version.version_number,
-            "content_length": len(content) if content else 0,
+            "content_length": analysis.content_length,
             "file_size": doc.file_size,
-            "total_chunks": len(chunks),
+            "total_chunks": len(analysis.hashes),
             "chunks": chunk_info,
+            "previews": analysis.previews,
             "created_at": latest_version.created_at,
             "content_hash": latest_version.content_hash
         }
         
         self.changes_detected.append(change_info)
+        # Only trust the signature once storage has caught up with the file on disk
+        if signature is not None and doc.file_size == signature[1]:
+            self._file_cache[normalized_path] = (signature, change_info)
         return change_info
     
     async def compare_with_previous(self, file_path):
@@ -104,6 +307,10 @@ class ChangeTracker:
         Returns:
             dict: Comparison information
         """
+        async with self._semaphore:
+            return await self._compare_with_previous(file_path)
+
+    async def _compare_with_previous(self, file_path):
         normalized_path = str(Path(file_path).absolute())
         doc = await self.tracker.storage.get_document_by_path(normalized_path)
         
@@ -113,47 +320,33 @@ class ChangeTracker:
                 "message": "No previous version to compare"
             }
         
-        # Get current and previous versions
-        current_version = await self.tracker.storage.get_version_by_number(
-            doc.id, doc.current_version
+        # Load both versions concurrently; the current one is usually cached by
+        # track_changes already
+        current_number = doc.current_version
+        previous_number = doc.current_version - 1
+        current, previous = await asyncio.gather(
+            self._get_version_chunks(doc.id, current_number),
+            self._get_version_chunks(doc.id, previous_number),
         )
-        previous_version = await self.tracker.storage.get_version_by_number(
-            doc.id, doc.current_version - 1
-        )
-        
-        # Get content
-        current_content = await self.tracker.storage.get_content(current_version.id)
-        previous_content = await self.tracker.storage.get_content(previous_version.id)
-        
-        # Analyze chunks
-        current_chunks = self.text_splitter.split_text(current_content) if current_content else []
-        previous_chunks = self.text_splitter.split_text(previous_content) if previous_content else []
         
         # Calculate chunk differences
-        import hashlib
-        current_hashes = {
-            hashlib.sha256(chunk.encode()).hexdigest()[:16]: chunk 
-            for chunk in current_chunks
-        }
-        previous_hashes = {
-            hashlib.sha256(chunk.encode()).hexdigest()[:16]: chunk 
-            for chunk in previous_chunks
-        }
+        current_hashes = set(current.hashes)
+        previous_hashes = set(previous.hashes)
         
-        new_chunks = set(current_hashes.keys()) - set(previous_hashes.keys())
-        removed_chunks = set(previous_hashes.keys()) - set(current_hashes.keys())
+        new_chunks = current_hashes - previous_hashes
+        removed_chunks = previous_hashes - current_hashes
         
         return {
             "file_path": file_path,
-            "current_version": current_version.version_number,
-            "previous_version": previous_version.version_number,
-            "total_current_chunks": len(current_chunks),
-            "total_previous_chunks": len(previous_chunks),
+            "current_version": current_number,
+            "previous_version": previous_number,
+            "total_current_chunks": len(current.hashes),
+            "total_previous_chunks": len(previous.hashes),
             "new_chunks": len(new_chunks),
             "removed_chunks": len(removed_chunks),
-            "new_chunk_hashes": list(new_chunks),
-            "removed_chunk_hashes": list(removed_chunks),
-            "content_length_diff": len(current_content or "") - len(previous_content or "")
+            "new_chunk_hashes": [format_hash(h) for h in new_chunks],
+            "removed_chunk_hashes": [format_hash(h) for h in removed_chunks],
+            "content_length_diff": current.content_length - previous.content_length
         }
     
     def print_change_summary(self):
@@ -190,31 +383,52 @@ class ChangeTracker:
         """
         Print detailed information about chunks for a specific change.
         """
-        print(f"\n{'='*70}")
-        print(f"CHUNK DETAILS: {change_info['file_name']}")
-        print(f"Status: {change_info['status']} | Version: {change_info.get('version_number', 'N/A')}")
-        print(f"{'='*70}")
+        # Build the whole report and write it once instead of one print per line
+        lines = [
+            f"\n{'='*70}",
+            f"CHUNK DETAILS: {change_info['file_name']}",
+            f"Status: {change_info['status']} | Version: {change_info.get('version_number', 'N/A')}",
+            f"{'='*70}",
+        ]
         
         if not change_info.get('chunks'):
-            print("No chunks created")
+            lines.append("No chunks created")
+            sys.stdout.write("\n".join(lines) + "\n")
             return
         
-        print(f"\nTotal Chunks: {change_info['total_chunks']}")
-        print(f"Total Content: {change_info['content_length']} characters")
-        print(f"Average Chunk Size: {change_info['content_length'] // change_info['total_chunks']} chars\n")
+        lines.append(f"\nTotal Chunks: {change_info['total_chunks']}")
+        lines.append(f"Total Content: {change_info['content_length']} characters")
+        lines.append(f"Average Chunk Size: {change_info['content_length'] // change_info['total_chunks']} chars\n")
         
+        previews = change_info['previews']
         for chunk in change_info['chunks']:
-            print(f"📦 Chunk {chunk['index']}:")
-            print(f"   ├─ Size: {chunk['size']} characters")
-            print(f"   ├─ Hash: {chunk['hash']}")
-            print(f"   └─ Preview: {chunk['preview']}")
-            print()
+            lines.append(
+                f"📦 Chunk {chunk['index']}:\n"
+                f"   ├─ Size: {chunk['size']} characters\n"
+                f"   ├─ Hash: {chunk['hash']}\n"
+                f"   └─ Preview: {previews[chunk['index'] - 1]}\n"
+            )
+
+        sys.stdout.write("\n".join(lines) + "\n")
+
+
+# Vector sizes of OpenAI embedding models, so an empty index can be built offline
+EMBEDDING_DIMENSIONS = {
+    "text-embedding-ada-002": 1536,
+    "text-embedding-3-small": 1536,
+    "text-embedding-3-large": 3072,
+}
 
 
 async def setup_rag_system_with_tracking():
     """
     Set up RAG system with change tracking enabled.
     """
+    import faiss
+    from langchain_openai import OpenAIEmbeddings
+    from langchain_community.docstore.in_memory import InMemoryDocstore
+    from langchain_community.vectorstores import FAISS
+    from ragversion.integrations.langchain import LangChainSync, get_text_splitter
     
     # Initialize tracker
     tracker = AsyncVersionTracker(
@@ -226,10 +440,8 @@ async def setup_rag_system_with_tracking():
     
     # Setup LangChain components
     embeddings = OpenAIEmbeddings()
-    text_splitter = RecursiveCharacterTextSplitter(
-        chunk_size=1000,
-        chunk_overlap=200,
-    )
+    # Uses the Rust semantic-text-splitter when installed
+    text_splitter = get_text_splitter(chunk_size=1000, chunk_overlap=200)
     
     # Initialize change tracker
     change_tracker = ChangeTracker(tracker, text_splitter)
@@ -244,7 +456,17 @@ async def setup_rag_system_with_tracking():
             allow_dangerous_deserialization=True
         )
     else:
-        vectorstore = FAISS.from_texts(["Initial placeholder"], embeddings)
+        # Start from an empty index: no embedding call, and no placeholder text
+        # showing up in retrieval results
+        dimensions = embeddings.dimensions or EMBEDDING_DIMENSIONS.get(embeddings.model)
+        if dimensions is None:
+            dimensions = len(embeddings.embed_query("dimension probe"))
+        vectorstore = FAISS(
+            embedding_function=embeddings,
+            index=faiss.IndexFlatL2(dimensions),
+            docstore=InMemoryDocstore({}),
+            index_to_docstore_id={},
+        )
     
     # Setup LangChain sync
     sync = LangChainSync(
@@ -259,6 +481,11 @@ async def setup_rag_system_with_tracking():
 
 def create_rag_chain(vectorstore):
     """Create RAG chain."""
+    from langchain_openai import ChatOpenAI
+    from langchain_core.prompts import ChatPromptTemplate
+    from langchain_core.runnables import RunnablePassthrough
+    from langchain_core.output_parsers import StrOutputParser
+
     retriever = vectorstore.as_retriever(search_kwargs={"k": 3})
     
     template = """
@@ -305,6 +532,20 @@ async def main():
     # Setup
     tracker, vectorstore, sync, change_tracker = await setup_rag_system_with_tracking()
     
+    # LangChainSync already adds and deletes vectors for changed documents only;
+    # rewrite the saved index only when a sync actually changed something
+    pending_changes = []
+
+    async def record_change(event):
+        pending_changes.append(event)
+
+    tracker.on_change(record_change)
+
+    def save_vectorstore():
+        if pending_changes:
+            vectorstore.save_local("./vectorstore_index")
+            pending_changes.clear()
+
     # Create documents directory
     documents_dir = Path("./documents")
     documents_dir.mkdir(exist_ok=True)
@@ -326,14 +567,18 @@ async def main():
         
         await sync.sync_directory("./documents", patterns=["*.txt"])
         
-        # Track changes for all documents
-        for txt_file in documents_dir.glob("*.txt"):
-            change_info = await change_tracker.track_changes(str(txt_file))
+        # Track changes for all documents concurrently, then print in order
+        txt_files = list(documents_dir.glob("*.txt"))
+        change_infos = await asyncio.gather(*(
+            change_tracker.track_changes(str(txt_file)) for txt_file in txt_files
+        ))
+        for change_info in change_infos:
             if change_info.get('total_chunks', 0) > 0:
                 change_tracker.print_chunk_details(change_info)
         
-        # Save vector store
-        vectorstore.save_local("./vectorstore_index")
+        # Save vector store and chunk analyses
+        save_vectorstore()
+        change_tracker.save_chunk_cache()
         
         # Print summary
         change_tracker.print_change_summary()
@@ -370,18 +615,22 @@ async def main():
         """)
         
         # Reset change tracker
-        change_tracker.changes_detected = []
+        change_tracker.reset()
         
         # Sync again
         await sync.sync_directory("./documents", patterns=["*.txt"])
         
-        # Track changes
-        for txt_file in documents_dir.glob("*.txt"):
+        # Track changes and compare with the previous version, files concurrently;
+        # compare_with_previous reuses the chunks track_changes just cached
+        async def track_and_compare(txt_file):
             change_info = await change_tracker.track_changes(str(txt_file))
-            
-            # Compare with previous version
             comparison = await change_tracker.compare_with_previous(str(txt_file))
-            
+            return change_info, comparison
+
+        txt_files = list(documents_dir.glob("*.txt"))
+        results = await asyncio.gather(*(track_and_compare(txt_file) for txt_file in txt_files))
+
+        for txt_file, (change_info, comparison) in zip(txt_files, results):
             if comparison.get('new_chunks', 0) > 0:
                 print(f"\n📊 Version Comparison for {txt_file.name}:")
                 print(f"   Previous: {comparison['previous_version']} chunks ({comparison['total_previous_chunks']})")
@@ -393,8 +642,9 @@ async def main():
             if change_info.get('total_chunks', 0) > 0:
                 change_tracker.print_chunk_details(change_info)
         
-        # Save updated vector store
-        vectorstore.save_local("./vectorstore_index")
+        # Save updated vector store and chunk analyses
+        save_vectorstore()
+        change_tracker.save_chunk_cache()
         
         # Print final summary
         change_tracker.print_change_summary()
@@ -6,17 +6,18 @@ to automatically sync document changes to an index.
 """
 
 import asyncio
-from llama_index.core import VectorStoreIndex, StorageContext
-from llama_index.core.node_parser import SentenceSplitter
-from llama_index.embeddings.openai import OpenAIEmbedding
 
 from ragversion import AsyncVersionTracker
-from ragversion.integrations.llamaindex import LlamaIndexSync
 from ragversion.storage import SupabaseStorage
 
 
 async def main():
     """LlamaIndex integration example."""
+    # Imported here so loading this module doesn't pull in LlamaIndex and OpenAI
+    from llama_index.core import VectorStoreIndex
+    from llama_index.core.node_parser import SentenceSplitter
+    from llama_index.embeddings.openai import OpenAIEmbedding
+    from ragversion.integrations.llamaindex import LlamaIndexSync
 
     # Initialize RAGVersion
     storage = SupabaseStorage.from_env()
@@ -1,38 +1,68 @@
 """FastAPI application factory."""
 
+import asyncio
 from contextlib import asynccontextmanager
 from datetime import datetime
 import json
-from typing import Set
+import time
+from typing import Dict, Set, Tuple
 
 from fastapi import FastAPI, Request, WebSocket, WebSocketDisconnect, status
 from fastapi.middleware.cors import CORSMiddleware
-from fastapi.responses import JSONResponse
+from fastapi.middleware.gzip import GZipMiddleware
+from fastapi.responses import JSONResponse, ORJSONResponse
 
 from ragversion import AsyncVersionTracker, __version__
 from ragversion.api.config import APIConfig
-from ragversion.api.dependencies import set_tracker
-from ragversion.api.models import HealthCheckResponse, ErrorResponse
+from ragversion.api.models import HealthCheckResponse
 from ragversion.api.routes import documents, versions, tracking, statistics
 from ragversion.web import routes as web_routes
 from ragversion.models import ChangeEvent
 
+try:
+    import orjson  # noqa: F401
+
+    ORJSON_AVAILABLE = True
+except ImportError:
+    ORJSON_AVAILABLE = False
+
+# Newer FastAPI releases serialize response models straight to JSON bytes and
+# deprecate ORJSONResponse; only swap it in where it still beats the default
+if ORJSON_AVAILABLE and not hasattr(ORJSONResponse, "__deprecated__"):
+    RESPONSE_CLASS = ORJSONResponse
+else:
+    RESPONSE_CLASS = JSONResponse
+
+# How long a storage health probe result is reused by /api/health
+HEALTH_CHECK_TTL_SECONDS = 1.0
+
 
 @asynccontextmanager
 async def lifespan(app: FastAPI):
     """Lifespan context manager for startup/shutdown events."""
+    # Run new tasks eagerly so coroutines that finish without suspending
+    # (cache hits, quick storage calls) never get scheduled on the loop (3.12+)
+    loop = asyncio.get_running_loop()
+    previous_task_factory = loop.get_task_factory()
+    if hasattr(asyncio, "eager_task_factory"):
+        loop.set_task_factory(asyncio.eager_task_factory)
+
     # Startup: Initialize tracker
     tracker = app.state.tracker
     if tracker:
         await tracker.initialize()
-        set_tracker(tracker)
+        # One callback feeds every WebSocket client
+        tracker.on_change(app.state.connection_manager.broadcast_event)
 
     yield
 
     # Shutdown: Close tracker
     if tracker:
+        tracker.remove_callback(app.state.connection_manager.broadcast_event)
         await tracker.close()
 
+    loop.set_task_factory(previous_task_factory)
+
 
 def create_app(
     tracker: AsyncVersionTracker,
@@ -58,6 +88,7 @@ def create_app(
         redoc_url="/api/redoc",
         openapi_url="/api/openapi.json",
         lifespan=lifespan,
+        default_response_class=RESPONSE_CLASS,
     )
 
     # Store tracker and config in app state
@@ -66,28 +97,39 @@ def create_app(
 
     # Add CORS middleware
     if config.cors_enabled:
+        # A wildcard origin can't carry credentials anyway, and without them the
+        # middleware sends a fixed "*" instead of echoing each request's Origin
+        allow_all_origins = "*" in config.cors_origins
         app.add_middleware(
             CORSMiddleware,
-            allow_origins=config.cors_origins,
-            allow_credentials=True,
+            allow_origins=["*"] if allow_all_origins else frozenset(config.cors_origins),
+            allow_credentials=not allow_all_origins,
             allow_methods=["*"],
             allow_headers=["*"],
         )
 
+    # Compress large JSON / content responses when the client sends Accept-Encoding: gzip
+    if config.gzip_enabled:
+        app.add_middleware(GZipMiddleware, minimum_size=config.gzip_minimum_size)
+
     # Exception handlers
     @app.exception_handler(Exception)
     async def global_exception_handler(request: Request, exc: Exception):
         """Handle uncaught exceptions."""
-        return JSONResponse(
+        return RESPONSE_CLASS(
             status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
-            content=ErrorResponse(
-                error="Internal server error",
-                detail=str(exc),
-                timestamp=datetime.utcnow(),
-            ).model_dump(),
+            # Same shape as ErrorResponse, built directly instead of via the model
+            content={
+                "error": "Internal server error",
+                "detail": str(exc),
+                "timestamp": datetime.utcnow().isoformat(),
+            },
         )
 
     # Health check endpoint
+    storage_checked_at = float("-inf")
+    storage_healthy = False
+
     @app.get(
         "/api/health",
         response_model=HealthCheckResponse,
@@ -97,12 +139,15 @@ def create_app(
     )
     async def health_check():
         """Health check endpoint."""
-        try:
-            # Test storage backend by attempting to get statistics
-            await tracker.get_statistics(days=1)
-            storage_healthy = True
-        except Exception:
-            storage_healthy = False
+        nonlocal storage_checked_at, storage_healthy
+        # Probes arrive every few seconds; hit the backend at most once per TTL
+        now = time.monotonic()
+        if now - storage_checked_at >= HEALTH_CHECK_TTL_SECONDS:
+            try:
+                storage_healthy = await tracker.health_check()
+            except Exception:
+                storage_healthy = False
+            storage_checked_at = now
 
         return HealthCheckResponse(
             status="healthy" if storage_healthy else "degraded",
@@ -114,45 +159,90 @@ def create_app(
 
     # WebSocket connection manager for live activity feed
     class ConnectionManager:
-        """Manages WebSocket connections for real-time updates."""
+        """Manages WebSocket connections for real-time updates.
+
+        Each client has a bounded outbound queue drained by its own writer task,
+        so a slow client never delays the others. Messages are encoded once per
+        broadcast; a client whose queue fills up is disconnected. An isolated
+        message is sent at once; during a burst (a message arriving within
+        ``batch_window`` seconds of the previous frame) messages are collected
+        for ``batch_window`` seconds and sent as one ``{"events": [...]}`` frame
+        of at most ``max_batch_size`` messages.
+        """
 
-        def __init__(self):
-            self.active_connections: Set[WebSocket] = set()
+        def __init__(
+            self,
+            queue_size: int = 1024,
+            batch_window: float = 0.02,
+            max_batch_size: int = 100,
+        ):
+            self.queue_size = queue_size
+            self.batch_window = batch_window
+            self.max_batch_size = max_batch_size
+            self.clients: Dict[WebSocket, Tuple[asyncio.Queue, asyncio.Task]] = {}
+            # Strong references so pending close tasks aren't garbage-collected
+            self._close_tasks: Set[asyncio.Task] = set()
 
         async def connect(self, websocket: WebSocket):
             await websocket.accept()
-            self.active_connections.add(websocket)
+            queue: asyncio.Queue = asyncio.Queue(maxsize=self.queue_size)
+            writer = asyncio.create_task(self._pump(websocket, queue))
+            self.clients[websocket] = (queue, writer)
 
         def disconnect(self, websocket: WebSocket):
-            self.active_connections.discard(websocket)
+            client = self.clients.pop(websocket, None)
+            if client:
+                client[1].cancel()
 
-        async def broadcast(self, message: dict):
-            """Broadcast message to all connected clients."""
-            disconnected = set()
-            for connection in self.active_connections:
+        async def _pump(self, websocket: WebSocket, queue: asyncio.Queue):
+            """Send queued messages to one client until it goes away."""
+            last_sent = float("-inf")
+            while True:
+                batch = [await queue.get()]
+                if queue.empty() and time.monotonic() - last_sent < self.batch_window:
+                    # A burst (e.g. a directory scan) is under way: let it queue up
+                    await asyncio.sleep(self.batch_window)
+                while len(batch) < self.max_batch_size and not queue.empty():
+                    batch.append(queue.get_nowait())
+
+                if len(batch) == 1:
+                    data = batch[0]
+                else:
+                    data = '{"events": [' + ", ".join(batch) + "]}"
                 try:
-                    await connection.send_json(message)
+                    await websocket.send_text(data)
                 except Exception:
-                    disconnected.add(connection)
+                    self.clients.pop(websocket, None)
+                    return
+                last_sent = time.monotonic()
 
-            # Clean up disconnected clients
-            for connection in disconnected:
-                self.active_connections.discard(connection)
-
-    # Create connection manager
-    connection_manager = ConnectionManager()
+        async def broadcast(self, message: dict):
+            """Broadcast message to all connected clients."""
+            data = json.dumps(message)
+            for websocket, (queue, _) in list(self.clients.items()):
+                try:
+                    queue.put_nowait(data)
+                except asyncio.QueueFull:
+                    # Too slow to keep up: drop it rather than buffer without bound
+                    self.disconnect(websocket)
+                    task = asyncio.create_task(self._close(websocket))
+                    self._close_tasks.add(task)
+                    task.add_done_callback(self._close_tasks.discard)
 
-    # WebSocket endpoint for live activity feed
-    @app.websocket("/ws/changes")
-    async def websocket_changes(websocket: WebSocket):
-        """WebSocket endpoint for real-time change notifications."""
-        await connection_manager.connect(websocket)
+        async def _close(self, websocket: WebSocket):
+            """Close a dropped client, telling it to retry later."""
+            try:
+                await websocket.close(code=status.WS_1013_TRY_AGAIN_LATER)
+            except Exception as e:
+                # The client may already be gone; there is nothing left to clean up
+                print(f"Error closing slow WebSocket client: {e}")
 
-        # Callback to broadcast changes via WebSocket
-        async def broadcast_change(event: ChangeEvent):
-            """Broadcast change event to all connected clients."""
+        async def broadcast_event(self, event: ChangeEvent):
+            """Broadcast a tracker change event to all connected clients."""
+            if not self.clients:
+                return
             try:
-                await connection_manager.broadcast({
+                await self.broadcast({
                     "document_id": str(event.document_id),
                     "file_name": event.file_name,
                     "file_path": event.file_path,
@@ -163,8 +253,15 @@ def create_app(
             except Exception as e:
                 print(f"Error broadcasting change: {e}")
 
-        # Register callback with tracker
-        tracker.on_change(broadcast_change)
+    # Create connection manager (registered with the tracker in lifespan)
+    connection_manager = ConnectionManager()
+    app.state.connection_manager = connection_manager
+
+    # WebSocket endpoint for live activity feed
+    @app.websocket("/ws/changes")
+    async def websocket_changes(websocket: WebSocket):
+        """WebSocket endpoint for real-time change notifications."""
+        await connection_manager.connect(websocket)
 
         try:
             # Keep connection alive and listen for messages
@@ -1,5 +1,6 @@
 """API configuration."""
 
+from functools import cached_property
 from typing import Optional
 from pydantic import Field
 from pydantic_settings import BaseSettings, SettingsConfigDict
@@ -20,6 +21,13 @@ class APIConfig(BaseSettings):
         description="Allowed CORS origins"
     )
 
+    # Response compression
+    gzip_enabled: bool = Field(default=True, description="Gzip responses for clients that accept it")
+    gzip_minimum_size: int = Field(
+        default=1024,
+        description="Smallest response body (bytes) worth compressing"
+    )
+
     # Authentication (optional)
     auth_enabled: bool = Field(default=False, description="Enable API key authentication")
     api_keys: list[str] = Field(
@@ -46,3 +54,8 @@ class APIConfig(BaseSettings):
         env_file_encoding="utf-8",
         extra="ignore",
     )
+
+    @cached_property
+    def api_key_set(self) -> frozenset[str]:
+        """Valid API keys as a set for constant-time lookup."""
+        return frozenset(self.api_keys)
@@ -1,35 +1,25 @@
 """FastAPI dependencies for dependency injection."""
 
 from typing import Optional
-from fastapi import Depends, HTTPException, Header, status
+from fastapi import Depends, HTTPException, Header, Request, status
 
 from ragversion import AsyncVersionTracker
 from ragversion.api.config import APIConfig
 
 
-# Global tracker instance (set during app initialization)
-_tracker: Optional[AsyncVersionTracker] = None
+def get_tracker(request: Request) -> AsyncVersionTracker:
+    """Get the tracker the app was created with."""
+    return request.app.state.tracker
 
 
-def set_tracker(tracker: AsyncVersionTracker) -> None:
-    """Set the global tracker instance."""
-    global _tracker
-    _tracker = tracker
-
-
-def get_tracker() -> AsyncVersionTracker:
-    """Get the tracker instance."""
-    if _tracker is None:
-        raise HTTPException(
-            status_code=status.HTTP_503_SERVICE_UNAVAILABLE,
-            detail="Tracker not initialized"
-        )
-    return _tracker
+def get_api_config(request: Request) -> APIConfig:
+    """Get the configuration the app was created with."""
+    return request.app.state.config
 
 
 async def verify_api_key(
     x_api_key: Optional[str] = Header(None),
-    config: APIConfig = Depends(lambda: APIConfig())
+    config: APIConfig = Depends(get_api_config)
 ) -> None:
     """Verify API key if authentication is enabled."""
     if not config.auth_enabled:
@@ -42,7 +32,7 @@ async def verify_api_key(
             headers={"WWW-Authenticate": "ApiKey"},
         )
 
-    if x_api_key not in config.api_keys:
+    if x_api_key not in config.api_key_set:
         raise HTTPException(
             status_code=status.HTTP_403_FORBIDDEN,
             detail="Invalid API key"
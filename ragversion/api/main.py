@@ -42,8 +42,9 @@ tracker = AsyncVersionTracker(
     max_file_size_mb=int(os.getenv("RAGVERSION_TRACKING_MAX_FILE_SIZE_MB", "50")),
 )
 
-# Create API config
+# Create API config (.env was already loaded into the environment above)
 api_config = APIConfig(
+    _env_file=None,
     host=os.getenv("RAGVERSION_API_HOST", "0.0.0.0"),
     port=int(os.getenv("RAGVERSION_API_PORT", "6699")),
     cors_enabled=os.getenv("RAGVERSION_API_CORS_ENABLED", "true").lower() == "true",
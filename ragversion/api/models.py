@@ -26,6 +26,13 @@ class TrackDirectoryRequest(BaseModel):
     metadata: Optional[Dict[str, Any]] = Field(None, description="Optional metadata")
 
 
+class TrackFilesRequest(BaseModel):
+    """Request to track several files in one round-trip."""
+
+    items: List[TrackFileRequest] = Field(..., description="Files to track")
+    max_workers: int = Field(4, description="Parallel workers")
+
+
 class RestoreVersionRequest(BaseModel):
     """Request to restore a version."""
 
@@ -79,6 +86,24 @@ class VersionResponse(BaseModel):
         from_attributes = True
 
 
+class DocumentPageResponse(BaseModel):
+    """One page of documents with a cursor for the next page."""
+
+    items: List[DocumentResponse]
+    next_cursor: Optional[str] = Field(
+        None, description="Opaque cursor for the next page, null on the last page"
+    )
+
+
+class VersionPageResponse(BaseModel):
+    """One page of versions with a cursor for the next page."""
+
+    items: List[VersionResponse]
+    next_cursor: Optional[str] = Field(
+        None, description="Opaque cursor for the next page, null on the last page"
+    )
+
+
 class ChangeEventResponse(BaseModel):
     """Change event response."""
 
@@ -97,6 +122,15 @@ class ChangeEventResponse(BaseModel):
         from_attributes = True
 
 
+class TrackFileResultResponse(BaseModel):
+    """Per-item result of a batched track request."""
+
+    file_path: str
+    status: int = Field(..., description="HTTP-style status code for this item")
+    event: Optional[ChangeEventResponse] = None
+    error: Optional[str] = None
+
+
 class FileProcessingErrorResponse(BaseModel):
     """File processing error response."""
 
@@ -125,9 +159,20 @@ class DiffResultResponse(BaseModel):
     to_version: int
     additions: int
     deletions: int
-    changes: int
+    changes: Optional[int] = None
     diff_text: Optional[str]
-    similarity: float
+    similarity: Optional[float] = None
+
+    class Config:
+        from_attributes = True
+
+
+class DocumentDetailResponse(BaseModel):
+    """Document with optional related data, fetched in one request."""
+
+    document: DocumentResponse
+    versions: Optional[List[VersionResponse]] = None
+    latest_diff: Optional[DiffResultResponse] = None
 
 
 class StorageStatisticsResponse(BaseModel):
@@ -1,39 +1,93 @@
 """Document management endpoints."""
 
-from typing import List, Optional
+import asyncio
+from datetime import datetime
+from typing import Any, List, Optional, Tuple
 from uuid import UUID
 
 from fastapi import APIRouter, Depends, HTTPException, Query, status
+from pydantic import TypeAdapter
 
 from ragversion import AsyncVersionTracker
 from ragversion.api.dependencies import get_tracker, verify_api_key
+from ragversion.api.pagination import decode_cursor, encode_cursor
 from ragversion.api.models import (
+    DiffResultResponse,
+    DocumentDetailResponse,
+    DocumentPageResponse,
     DocumentResponse,
     SearchDocumentsRequest,
     ErrorResponse,
+    VersionResponse,
 )
 from ragversion.exceptions import DocumentNotFoundError
 
 router = APIRouter(prefix="/documents", tags=["documents"])
 
+# Validate whole result lists in one call instead of one model_validate per row
+_DOCUMENTS_ADAPTER = TypeAdapter(List[DocumentResponse])
+_VERSIONS_ADAPTER = TypeAdapter(List[VersionResponse])
+
+SORTABLE_FIELDS = ("updated_at", "created_at", "file_name", "file_size", "version_count")
+
+
+def _decode_document_cursor(cursor: str, order_by: str) -> Tuple[Any, str]:
+    """Decode a list_documents cursor and check its values match ``order_by``.
+
+    Raises:
+        HTTPException: 400 if the cursor is malformed or of the wrong shape
+    """
+    value, last_id = decode_cursor(cursor, 2)
+    try:
+        if not isinstance(last_id, str):
+            raise TypeError(last_id)
+        UUID(last_id)
+        if order_by in ("updated_at", "created_at"):
+            datetime.fromisoformat(value)
+        elif order_by in ("file_size", "version_count"):
+            if not isinstance(value, int) or isinstance(value, bool):
+                raise TypeError(value)
+        elif not isinstance(value, str):
+            raise TypeError(value)
+    except (TypeError, ValueError):
+        raise HTTPException(
+            status_code=status.HTTP_400_BAD_REQUEST,
+            detail="Invalid pagination cursor",
+        )
+    return value, last_id
+
 
 @router.get(
     "",
-    response_model=List[DocumentResponse],
+    response_model=DocumentPageResponse,
     summary="List documents",
-    description="List all documents with pagination and sorting",
+    description="List all documents with cursor pagination and sorting",
+    responses={400: {"model": ErrorResponse}},
 )
 async def list_documents(
     limit: int = Query(100, ge=1, le=1000, description="Number of results"),
-    offset: int = Query(0, ge=0, description="Offset for pagination"),
+    cursor: Optional[str] = Query(None, description="Cursor from a previous page's next_cursor"),
+    offset: int = Query(
+        0, ge=0, deprecated=True, description="Offset for pagination (use cursor instead)"
+    ),
     order_by: str = Query("updated_at", description="Sort by field"),
     tracker: AsyncVersionTracker = Depends(get_tracker),
     _: None = Depends(verify_api_key),
 ):
-    """List documents with pagination."""
+    """List documents with keyset pagination."""
+    if order_by not in SORTABLE_FIELDS:
+        order_by = "updated_at"
+    after = _decode_document_cursor(cursor, order_by) if cursor else None
     try:
-        documents = await tracker.list_documents(limit, offset, order_by)
-        return [DocumentResponse.model_validate(doc) for doc in documents]
+        documents = await tracker.list_documents(limit, offset, order_by, after=after)
+        next_cursor = None
+        if len(documents) == limit:
+            last = documents[-1]
+            next_cursor = encode_cursor(getattr(last, order_by), last.id)
+        return DocumentPageResponse(
+            items=_DOCUMENTS_ADAPTER.validate_python(documents, from_attributes=True),
+            next_cursor=next_cursor,
+        )
     except Exception as e:
         raise HTTPException(
             status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
@@ -118,7 +172,7 @@ async def search_documents(
             metadata_filter=request.metadata_filter,
             file_type=request.file_type,
         )
-        return [DocumentResponse.model_validate(doc) for doc in documents]
+        return _DOCUMENTS_ADAPTER.validate_python(documents, from_attributes=True)
     except Exception as e:
         raise HTTPException(
             status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
@@ -168,7 +222,64 @@ async def get_top_documents(
     """Get top documents."""
     try:
         documents = await tracker.get_top_documents(limit, order_by)
-        return [DocumentResponse.model_validate(doc) for doc in documents]
+        return _DOCUMENTS_ADAPTER.validate_python(documents, from_attributes=True)
+    except Exception as e:
+        raise HTTPException(
+            status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
+            detail=str(e)
+        )
+
+
+@router.get(
+    "/{document_id}/detail",
+    response_model=DocumentDetailResponse,
+    summary="Get document with related data",
+    description="Retrieve a document plus its recent versions and latest diff in one request",
+    responses={404: {"model": ErrorResponse}},
+)
+async def get_document_detail(
+    document_id: UUID,
+    include: str = Query(
+        "versions,latest_diff",
+        description="Comma-separated extras to include: versions, latest_diff",
+    ),
+    version_limit: int = Query(10, ge=1, le=1000, description="Number of versions to include"),
+    tracker: AsyncVersionTracker = Depends(get_tracker),
+    _: None = Depends(verify_api_key),
+):
+    """Get a document together with its versions and latest diff."""
+    extras = {part.strip() for part in include.split(",") if part.strip()}
+    try:
+        # The diff needs the two newest versions, so fetch them even if not returned
+        want_versions = bool(extras & {"versions", "latest_diff"})
+        if want_versions:
+            document, versions = await asyncio.gather(
+                tracker.get_document(document_id),
+                tracker.list_versions(document_id, limit=max(version_limit, 2)),
+            )
+        else:
+            document, versions = await tracker.get_document(document_id), []
+
+        if not document:
+            raise HTTPException(
+                status_code=status.HTTP_404_NOT_FOUND,
+                detail=f"Document {document_id} not found"
+            )
+
+        response = DocumentDetailResponse(document=DocumentResponse.model_validate(document))
+        if "versions" in extras:
+            response.versions = _VERSIONS_ADAPTER.validate_python(
+                versions[:version_limit], from_attributes=True
+            )
+        if "latest_diff" in extras and len(versions) >= 2:
+            diff = await tracker.get_diff(
+                document_id, versions[1].version_number, versions[0].version_number
+            )
+            if diff:
+                response.latest_diff = DiffResultResponse.model_validate(diff)
+        return response
+    except HTTPException:
+        raise
     except Exception as e:
         raise HTTPException(
             status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
@@ -1,13 +1,22 @@
 """Tracking endpoints."""
 
+import asyncio
+import json
+import time
+from typing import Any, AsyncIterator, Dict, List
+
 from fastapi import APIRouter, Depends, HTTPException, status
+from fastapi.responses import StreamingResponse
 
 from ragversion import AsyncVersionTracker
 from ragversion.api.dependencies import get_tracker, verify_api_key
+from ragversion.models import FileProcessingError
 from ragversion.api.models import (
     TrackFileRequest,
     TrackDirectoryRequest,
+    TrackFilesRequest,
     ChangeEventResponse,
+    TrackFileResultResponse,
     BatchResultResponse,
     ErrorResponse,
 )
@@ -51,6 +60,50 @@ async def track_file(
         )
 
 
+@router.post(
+    "/files",
+    response_model=List[TrackFileResultResponse],
+    summary="Track multiple files",
+    description="Track a batch of files in one request; each item reports its own status",
+)
+async def track_files(
+    request: TrackFilesRequest,
+    tracker: AsyncVersionTracker = Depends(get_tracker),
+    _: None = Depends(verify_api_key),
+):
+    """Track a batch of files, isolating per-item failures."""
+    semaphore = asyncio.Semaphore(max(1, request.max_workers))
+
+    async def track_one(item) -> TrackFileResultResponse:
+        async with semaphore:
+            try:
+                result = await tracker.track(item.file_path, metadata=item.metadata)
+                if not result.changed or not result.event:
+                    return TrackFileResultResponse(
+                        file_path=item.file_path,
+                        status=status.HTTP_204_NO_CONTENT,
+                    )
+                return TrackFileResultResponse(
+                    file_path=item.file_path,
+                    status=status.HTTP_200_OK,
+                    event=ChangeEventResponse.model_validate(result.event),
+                )
+            except FileNotFoundError:
+                return TrackFileResultResponse(
+                    file_path=item.file_path,
+                    status=status.HTTP_404_NOT_FOUND,
+                    error=f"File not found: {item.file_path}",
+                )
+            except Exception as e:
+                return TrackFileResultResponse(
+                    file_path=item.file_path,
+                    status=status.HTTP_500_INTERNAL_SERVER_ERROR,
+                    error=str(e),
+                )
+
+    return await asyncio.gather(*(track_one(item) for item in request.items))
+
+
 @router.post(
     "/directory",
     response_model=BatchResultResponse,
@@ -90,3 +143,83 @@ async def track_directory(
             status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
             detail=str(e)
         )
+
+
+@router.post(
+    "/directory/stream",
+    summary="Track directory (streaming)",
+    description=(
+        "Track all files in a directory and stream one NDJSON line per changed or "
+        "failed file, followed by a summary line"
+    ),
+    response_class=StreamingResponse,
+    responses={
+        200: {"content": {"application/x-ndjson": {}}},
+        404: {"model": ErrorResponse},
+    },
+)
+async def track_directory_stream(
+    request: TrackDirectoryRequest,
+    tracker: AsyncVersionTracker = Depends(get_tracker),
+    _: None = Depends(verify_api_key),
+):
+    """Track a directory, streaming results as each file completes."""
+    results = tracker.track_directory_stream(
+        request.dir_path,
+        patterns=request.patterns,
+        recursive=request.recursive,
+        max_workers=request.max_workers,
+        metadata=request.metadata,
+    )
+
+    # Pull the first result eagerly so a bad directory is still a plain 404/400
+    started = time.perf_counter()
+    try:
+        first = await results.__anext__()
+    except StopAsyncIteration:
+        first = None
+    except FileNotFoundError:
+        raise HTTPException(
+            status_code=status.HTTP_404_NOT_FOUND,
+            detail=f"Directory not found: {request.dir_path}"
+        )
+    except ValueError as e:
+        raise HTTPException(status_code=status.HTTP_400_BAD_REQUEST, detail=str(e))
+
+    async def ndjson() -> AsyncIterator[bytes]:
+        total = changed = failed = 0
+
+        async def items():
+            if first is not None:
+                yield first
+                async for item in results:
+                    yield item
+
+        try:
+            async for item in items():
+                total += 1
+                line: Dict[str, Any]
+                if isinstance(item, FileProcessingError):
+                    failed += 1
+                    line = {"_type": "error", **item.model_dump(mode="json")}
+                elif item.changed and item.event:
+                    changed += 1
+                    event = ChangeEventResponse.model_validate(item.event)
+                    line = {"_type": "event", **event.model_dump(mode="json")}
+                else:
+                    continue
+                yield json.dumps(line).encode("utf-8") + b"\n"
+        finally:
+            # Stops the tracking workers if the client disconnects mid-stream
+            await results.aclose()
+
+        summary = {
+            "_type": "summary",
+            "total_files": total,
+            "changed": changed,
+            "failed": failed,
+            "duration_seconds": time.perf_counter() - started,
+        }
+        yield json.dumps(summary).encode("utf-8") + b"\n"
+
+    return StreamingResponse(ndjson(), media_type="application/x-ndjson")
@@ -4,10 +4,13 @@ from typing import List, Optional
 from uuid import UUID
 
 from fastapi import APIRouter, Depends, HTTPException, Query, status
+from pydantic import TypeAdapter
 
 from ragversion import AsyncVersionTracker
 from ragversion.api.dependencies import get_tracker, verify_api_key
+from ragversion.api.pagination import decode_cursor, encode_cursor
 from ragversion.api.models import (
+    VersionPageResponse,
     VersionResponse,
     ChangeEventResponse,
     RestoreVersionRequest,
@@ -18,6 +21,9 @@ from ragversion.exceptions import VersionNotFoundError, DocumentNotFoundError
 
 router = APIRouter(prefix="/versions", tags=["versions"])
 
+# Validate whole result lists in one call instead of one model_validate per row
+_VERSIONS_ADAPTER = TypeAdapter(List[VersionResponse])
+
 
 @router.get(
     "/{version_id}",
@@ -51,22 +57,39 @@ async def get_version(
 
 @router.get(
     "/document/{document_id}",
-    response_model=List[VersionResponse],
+    response_model=VersionPageResponse,
     summary="List versions for document",
-    description="Get version history for a specific document",
-    responses={404: {"model": ErrorResponse}},
+    description="Get version history for a specific document, newest first",
+    responses={400: {"model": ErrorResponse}, 404: {"model": ErrorResponse}},
 )
 async def list_versions(
     document_id: UUID,
     limit: int = Query(100, ge=1, le=1000, description="Number of results"),
-    offset: int = Query(0, ge=0, description="Offset for pagination"),
+    cursor: Optional[str] = Query(None, description="Cursor from a previous page's next_cursor"),
+    offset: int = Query(
+        0, ge=0, deprecated=True, description="Offset for pagination (use cursor instead)"
+    ),
     tracker: AsyncVersionTracker = Depends(get_tracker),
     _: None = Depends(verify_api_key),
 ):
-    """List versions for a document."""
+    """List versions for a document with keyset pagination."""
+    after = None
+    if cursor:
+        (after,) = decode_cursor(cursor, 1)
+        if not isinstance(after, int):
+            raise HTTPException(
+                status_code=status.HTTP_400_BAD_REQUEST,
+                detail="Invalid pagination cursor",
+            )
     try:
-        versions = await tracker.list_versions(document_id, limit, offset)
-        return [VersionResponse.model_validate(ver) for ver in versions]
+        versions = await tracker.list_versions(document_id, limit, offset, after=after)
+        next_cursor = None
+        if len(versions) == limit:
+            next_cursor = encode_cursor(versions[-1].version_number)
+        return VersionPageResponse(
+            items=_VERSIONS_ADAPTER.validate_python(versions, from_attributes=True),
+            next_cursor=next_cursor,
+        )
     except Exception as e:
         raise HTTPException(
             status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
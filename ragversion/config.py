@@ -71,7 +71,7 @@ class TrackingConfig(BaseSettings):
 
     store_content: bool = Field(default=True, description="Store full content")
     max_file_size_mb: int = Field(default=50, description="Max file size in MB")
-    hash_algorithm: str = Field(default="sha256", description="Hash algorithm")
+    hash_algorithm: str = Field(default="sha256", description="Hash algorithm (sha256, sha1, md5, blake3)")
 
     model_config = SettingsConfigDict(env_prefix="RAGVERSION_TRACKING_")
 
@@ -14,6 +14,16 @@ from ragversion.models import ChangeEvent, ChangeType, Document, Version
 from ragversion.parsers import ParserRegistry
 from ragversion.storage.base import BaseStorage
 
+try:
+    from blake3 import blake3
+
+    BLAKE3_AVAILABLE = True
+except ImportError:
+    BLAKE3_AVAILABLE = False
+
+# Content at least this large is hashed by BLAKE3 on all cores
+BLAKE3_PARALLEL_THRESHOLD = 1024 * 1024
+
 
 class ChangeDetector:
     """Async change detector for document tracking."""
@@ -32,8 +42,16 @@ class ChangeDetector:
             storage: Storage backend
             store_content: Whether to store full content
             max_file_size_mb: Maximum file size to process
-            hash_algorithm: Hash algorithm to use (sha256, sha1, md5)
+            hash_algorithm: Hash algorithm to use (sha256, sha1, md5, or blake3).
+                blake3 is much faster on large files but requires the ``blake3``
+                package; switching algorithms makes every tracked document
+                register as modified once, since stored hashes no longer match.
         """
+        if hash_algorithm == "blake3" and not BLAKE3_AVAILABLE:
+            raise ImportError(
+                "blake3 is not installed. Install with: pip install ragversion[fast-hash]"
+            )
+
         self.storage = storage
         self.store_content = store_content
         self.max_file_size_bytes = max_file_size_mb * 1024 * 1024
@@ -114,8 +132,13 @@ class ChangeDetector:
 
     def _compute_hash(self, content: str) -> str:
         """Compute hash of content."""
+        data = content.encode("utf-8")
+        if self.hash_algorithm == "blake3":
+            max_threads = blake3.AUTO if len(data) >= BLAKE3_PARALLEL_THRESHOLD else 1
+            return blake3(data, max_threads=max_threads).hexdigest()
+
         hash_func = hashlib.new(self.hash_algorithm)
-        hash_func.update(content.encode("utf-8"))
+        hash_func.update(data)
         return hash_func.hexdigest()
 
     async def _handle_creation(
@@ -7,5 +7,6 @@ including automatic synchronization and quick-start utilities.
 from ragversion.integrations.langchain.sync import LangChainSync
 from ragversion.integrations.langchain.loader import LangChainLoader
 from ragversion.integrations.langchain.quick_start import quick_start
+from ragversion.integrations.langchain.splitters import get_text_splitter
 
-__all__ = ["LangChainSync", "LangChainLoader", "quick_start"]
+__all__ = ["LangChainSync", "LangChainLoader", "quick_start", "get_text_splitter"]
@@ -0,0 +1,87 @@
+"""Text splitter selection for the LangChain integration."""
+
+from typing import Any, List
+
+try:
+    from langchain_text_splitters import RecursiveCharacterTextSplitter, TextSplitter
+
+    LANGCHAIN_AVAILABLE = True
+except ImportError:
+    LANGCHAIN_AVAILABLE = False
+    RecursiveCharacterTextSplitter = Any
+    TextSplitter = object
+
+try:
+    import semantic_text_splitter
+
+    SEMANTIC_SPLITTER_AVAILABLE = True
+except ImportError:
+    SEMANTIC_SPLITTER_AVAILABLE = False
+
+
+class SmallTextSplitter(RecursiveCharacterTextSplitter if LANGCHAIN_AVAILABLE else object):
+    """``RecursiveCharacterTextSplitter`` with a fast path for short texts.
+
+    Text that already fits in one chunk is returned as-is instead of being
+    split on every separator and merged back together.
+    """
+
+    def split_text(self, text: str) -> List[str]:
+        """Split text into chunks."""
+        if self._length_function(text) <= self._chunk_size:
+            chunk = text.strip() if self._strip_whitespace else text
+            return [chunk] if chunk else []
+        return super().split_text(text)
+
+
+class RustTextSplitter(TextSplitter):
+    """LangChain ``TextSplitter`` backed by the Rust ``semantic-text-splitter``.
+
+    Splits on the same semantic levels as ``RecursiveCharacterTextSplitter``
+    (paragraphs, sentences, words, characters) with ``chunk_size`` and
+    ``chunk_overlap`` measured in characters, but does the work natively.
+    """
+
+    def __init__(self, chunk_size: int = 1000, chunk_overlap: int = 200, **kwargs: Any):
+        super().__init__(chunk_size=chunk_size, chunk_overlap=chunk_overlap, **kwargs)
+        self._splitter = None
+
+    def split_text(self, text: str) -> List[str]:
+        """Split text into chunks."""
+        if self._splitter is None:
+            self._splitter = semantic_text_splitter.TextSplitter(
+                self._chunk_size, overlap=self._chunk_overlap
+            )
+        return self._splitter.chunks(text)
+
+    def __getstate__(self) -> dict:
+        # The native splitter can't be pickled; rebuild it lazily in the worker
+        state = self.__dict__.copy()
+        state["_splitter"] = None
+        return state
+
+
+def get_text_splitter(chunk_size: int = 1000, chunk_overlap: int = 200) -> TextSplitter:
+    """
+    Get the fastest available LangChain-compatible text splitter.
+
+    Returns a :class:`RustTextSplitter` when ``semantic-text-splitter`` is
+    installed (``pip install semantic-text-splitter``), otherwise a
+    :class:`SmallTextSplitter` (LangChain's ``RecursiveCharacterTextSplitter``
+    plus a single-chunk fast path) with the same settings.
+
+    Args:
+        chunk_size: Maximum chunk size in characters
+        chunk_overlap: Characters of overlap between consecutive chunks
+
+    Returns:
+        A text splitter exposing ``split_text``
+    """
+    if not LANGCHAIN_AVAILABLE:
+        raise ImportError(
+            "LangChain is not installed. Install with: pip install ragversion[langchain]"
+        )
+
+    if SEMANTIC_SPLITTER_AVAILABLE:
+        return RustTextSplitter(chunk_size=chunk_size, chunk_overlap=chunk_overlap)
+    return SmallTextSplitter(chunk_size=chunk_size, chunk_overlap=chunk_overlap)
@@ -1,6 +1,9 @@
 """LangChain sync integration for RAGVersion."""
 
+import asyncio
 import logging
+from concurrent.futures import Executor
+from contextvars import ContextVar
 from typing import Any, List, Optional
 
 try:
@@ -38,6 +41,8 @@ class LangChainSync:
         vectorstore: VectorStore,
         metadata_extractor: Optional[callable] = None,
         enable_chunk_tracking: bool = False,
+        executor: Optional[Executor] = None,
+        embedding_batch_size: int = 2048,
     ):
         """
         Initialize LangChain sync.
@@ -49,6 +54,11 @@ class LangChainSync:
             vectorstore: LangChain vector store
             metadata_extractor: Optional function to extract metadata from file path
             enable_chunk_tracking: Enable smart chunk-level updates (v0.10.0)
+            executor: Optional executor to run text splitting in, keeping the event
+                loop responsive. A ProcessPoolExecutor also avoids the GIL, but then
+                the text splitter must be picklable.
+            embedding_batch_size: Maximum chunks per vector store add when
+                sync_directory flushes the chunks it collected across files
         """
         if not LANGCHAIN_AVAILABLE:
             raise ImportError(
@@ -92,6 +102,14 @@ class LangChainSync:
         self.vectorstore = vectorstore
         self.metadata_extractor = metadata_extractor
         self.enable_chunk_tracking = enable_chunk_tracking
+        self.executor = executor
+        self.embedding_batch_size = embedding_batch_size
+        # Collects chunks during sync_directory so they're embedded in large batches.
+        # A context variable scopes the queue to the sync_directory call (and the
+        # tasks it spawns), so overlapping syncs and unrelated events stay separate.
+        self._pending_documents: ContextVar[Optional[List[LCDocument]]] = ContextVar(
+            f"ragversion_langchain_pending_{id(self)}", default=None
+        )
 
         # Verify chunk tracking compatibility
         if self.enable_chunk_tracking and not self.tracker.chunk_tracking_enabled:
@@ -119,6 +137,13 @@ class LangChainSync:
         except Exception as e:
             logger.error(f"Failed to sync change to LangChain: {e}")
 
+    async def _split_text(self, content: str) -> List[str]:
+        """Split content, in the configured executor when one is set."""
+        if self.executor is None:
+            return self.text_splitter.split_text(content)
+        loop = asyncio.get_running_loop()
+        return await loop.run_in_executor(self.executor, self.text_splitter.split_text, content)
+
     async def _handle_creation(self, event: ChangeEvent) -> None:
         """Handle document creation."""
         try:
@@ -129,7 +154,7 @@ class LangChainSync:
                 return
 
             # Split text
-            texts = self.text_splitter.split_text(content)
+            texts = await self._split_text(content)
 
             # Create metadata
             metadata = {
@@ -152,9 +177,12 @@ class LangChainSync:
             ]
 
             # Add to vector store
-            await self.vectorstore.aadd_documents(documents)
+            queued = await self._add_documents(documents)
 
-            logger.info(f"Added {len(documents)} chunks to vector store for {event.file_name}")
+            if queued:
+                logger.debug(f"Queued {len(documents)} chunks for {event.file_name}")
+            else:
+                logger.info(f"Added {len(documents)} chunks to vector store for {event.file_name}")
         except Exception as e:
             # Provide context-specific error
             raise RuntimeError(
@@ -240,8 +268,9 @@ class LangChainSync:
                     chunks_to_embed.append(LCDocument(page_content=content, metadata=metadata))
 
             # Add to vector store
+            queued = False
             if chunks_to_embed:
-                await self.vectorstore.aadd_documents(chunks_to_embed)
+                queued = await self._add_documents(chunks_to_embed)
 
             # Log savings
             savings_pct = chunk_diff.savings_percentage
@@ -250,7 +279,7 @@ class LangChainSync:
 
             logger.info(
                 f"Smart update for {event.file_name}: "
-                f"Embedded {embedded_count}/{total_chunks} chunks "
+                f"{'Queued' if queued else 'Embedded'} {embedded_count}/{total_chunks} chunks "
                 f"(saved {savings_pct:.1f}% embedding cost)"
             )
 
@@ -270,6 +299,52 @@ class LangChainSync:
         # Same as modification
         await self._handle_modification(event)
 
+    async def _add_documents(self, documents: List[LCDocument]) -> bool:
+        """
+        Add documents to the vector store, or queue them during a directory sync.
+
+        Returns:
+            True if the documents were queued rather than added
+        """
+        pending = self._pending_documents.get()
+        if pending is not None:
+            pending.extend(documents)
+            return True
+        await self.vectorstore.aadd_documents(documents)
+        return False
+
+    async def _flush_documents(self, documents: List[LCDocument]) -> None:
+        """Add queued documents in batches of embedding_batch_size.
+
+        A failed batch doesn't stop the later ones; all failures are raised
+        together once every batch has been attempted.
+        """
+        failures = []
+        added = 0
+        for start in range(0, len(documents), self.embedding_batch_size):
+            batch = documents[start:start + self.embedding_batch_size]
+            try:
+                await self.vectorstore.aadd_documents(batch)
+                added += len(batch)
+            except Exception as e:
+                logger.error(f"Failed to add {len(batch)} chunks to vector store: {e}")
+                failures.append((batch, e))
+        if added:
+            logger.info(f"Added {added} chunks to vector store")
+        if failures:
+            failed_files = sorted({
+                doc.metadata.get("file_path", "<unknown>")
+                for batch, _ in failures
+                for doc in batch
+            })
+            raise RuntimeError(
+                f"Failed to add {sum(len(batch) for batch, _ in failures)} of "
+                f"{len(documents)} chunks to vector store in {len(failures)} batches.\n"
+                f"Vector store: {type(self.vectorstore).__name__}\n"
+                f"Affected files: {', '.join(failed_files)}\n"
+                "Errors:\n" + "\n".join(f"  - {e}" for _, e in failures)
+            ) from failures[0][1]
+
     async def _delete_document(self, document_id: str) -> None:
         """Delete document from vector store."""
         # Note: This requires vector store to support deletion by metadata
@@ -296,12 +371,31 @@ class LangChainSync:
             recursive: Whether to search recursively
             max_workers: Number of parallel workers
         """
-        result = await self.tracker.track_directory(
-            dir_path,
-            patterns=patterns,
-            recursive=recursive,
-            max_workers=max_workers,
-        )
+        # Change handlers queue their chunks; embed them all together afterwards
+        # so the embeddings API sees a few large requests instead of one per file
+        pending: List[LCDocument] = []
+        token = self._pending_documents.set(pending)
+        try:
+            try:
+                result = await self.tracker.track_directory(
+                    dir_path,
+                    patterns=patterns,
+                    recursive=recursive,
+                    max_workers=max_workers,
+                )
+            finally:
+                self._pending_documents.reset(token)
+        except Exception:
+            # The tracker already committed the versions behind these chunks (and
+            # their old vectors may be deleted), so embed them before failing
+            if pending:
+                try:
+                    await self._flush_documents(pending)
+                except Exception as e:
+                    logger.error(f"Failed to add queued chunks after failed directory sync: {e}")
+            raise
+
+        await self._flush_documents(pending)
 
         logger.info(
             f"Synced {result.success_count}/{result.total_files} documents to LangChain"
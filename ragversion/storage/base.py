@@ -1,7 +1,7 @@
 """Abstract base class for storage backends."""
 
 from abc import ABC, abstractmethod
-from typing import List, Optional
+from typing import Any, Dict, List, Optional, Tuple
 from uuid import UUID
 
 from ragversion.models import Document, Version, DiffResult, StorageStatistics, DocumentStatistics, Chunk
@@ -69,8 +69,17 @@ class BaseStorage(ABC):
         limit: int = 100,
         offset: int = 0,
         order_by: str = "updated_at",
+        after: Optional[Tuple[Any, str]] = None,
     ) -> List[Document]:
-        """List documents with pagination."""
+        """List documents with pagination.
+
+        Args:
+            limit: Maximum number of documents to return
+            offset: Number of documents to skip (ignored when ``after`` is given)
+            order_by: Field to order by (descending, ties broken by id)
+            after: Keyset position ``(order_by value, document id)`` of the last row
+                of the previous page; rows strictly after it are returned
+        """
         pass
 
     @abstractmethod
@@ -118,8 +127,16 @@ class BaseStorage(ABC):
         document_id: UUID,
         limit: int = 100,
         offset: int = 0,
+        after: Optional[int] = None,
     ) -> List[Version]:
-        """List all versions of a document."""
+        """List all versions of a document, newest first.
+
+        Args:
+            document_id: ID of the document
+            limit: Maximum number of versions to return
+            offset: Number of versions to skip (ignored when ``after`` is given)
+            after: Return only versions numbered below this one (keyset pagination)
+        """
         pass
 
     @abstractmethod
@@ -132,6 +149,57 @@ class BaseStorage(ABC):
         """Get the latest version of a document."""
         pass
 
+    async def get_latest_versions(self, document_ids: List[UUID]) -> Dict[UUID, Version]:
+        """Get the latest version of several documents (optimized in subclasses).
+
+        Documents without versions are absent from the result. Default
+        implementation calls get_latest_version for each document.
+        """
+        results = {}
+        for document_id in document_ids:
+            version = await self.get_latest_version(document_id)
+            if version:
+                results[document_id] = version
+        return results
+
+    async def list_recent_changes(
+        self, limit: int = 20, path_suffix: Optional[str] = None
+    ) -> List[Dict[str, Any]]:
+        """List the latest version of the most recently updated documents (optimized in subclasses).
+
+        Each row carries the document columns (document_id, file_path, file_type,
+        updated_at) alongside its latest version (version_id, version_number,
+        change_type, content_hash, created_at). Default implementation lists
+        documents and resolves their versions with get_latest_versions.
+
+        Args:
+            limit: Maximum number of documents to consider
+            path_suffix: Only include documents whose path ends with this suffix
+        """
+        documents = await self.list_documents(limit=limit, order_by="updated_at")
+        if path_suffix:
+            documents = [doc for doc in documents if doc.file_path.endswith(path_suffix)]
+
+        latest_versions = await self.get_latest_versions([doc.id for doc in documents])
+
+        rows = []
+        for doc in documents:
+            latest = latest_versions.get(doc.id)
+            if latest is None:
+                continue
+            rows.append({
+                "document_id": doc.id,
+                "file_path": doc.file_path,
+                "file_type": doc.file_type,
+                "updated_at": doc.updated_at,
+                "version_id": latest.id,
+                "version_number": latest.version_number,
+                "change_type": latest.change_type.value,
+                "content_hash": latest.content_hash,
+                "created_at": latest.created_at,
+            })
+        return rows
+
     # Content operations
 
     @abstractmethod
@@ -284,6 +352,13 @@ class BaseStorage(ABC):
         """Get overall storage statistics."""
         pass
 
+    async def count_documents(self) -> int:
+        """Count tracked documents (optimized in subclasses).
+
+        Default implementation reads the count from get_statistics.
+        """
+        return (await self.get_statistics()).total_documents
+
     @abstractmethod
     async def get_document_statistics(self, document_id: UUID) -> DocumentStatistics:
         """Get statistics for a specific document."""
@@ -0,0 +1,73 @@
+-- RAGVersion Latest-Version Materialized View Migration
+-- Precomputes the latest version of every document so "recent changes" style
+-- listings read one indexed relation instead of resolving versions per document
+
+-- =============================================================================
+-- SUPABASE / POSTGRESQL VERSION
+-- =============================================================================
+-- Run this section in your Supabase SQL Editor
+
+-- One row per document: its newest version plus the document columns listings need
+CREATE MATERIALIZED VIEW IF NOT EXISTS document_latest_version AS
+SELECT DISTINCT ON (v.document_id)
+    v.document_id,
+    d.file_path,
+    d.file_type,
+    d.updated_at,
+    v.id AS version_id,
+    v.version_number,
+    v.change_type,
+    v.content_hash,
+    v.created_at
+FROM versions v
+JOIN documents d ON d.id = v.document_id
+ORDER BY v.document_id, v.version_number DESC;
+
+-- Unique index is required for REFRESH ... CONCURRENTLY
+CREATE UNIQUE INDEX IF NOT EXISTS idx_document_latest_version_document_id
+    ON document_latest_version(document_id);
+CREATE INDEX IF NOT EXISTS idx_document_latest_version_updated_at
+    ON document_latest_version(updated_at DESC);
+
+-- Refresh without blocking readers
+CREATE OR REPLACE FUNCTION refresh_document_latest_version()
+RETURNS void AS $$
+BEGIN
+    REFRESH MATERIALIZED VIEW CONCURRENTLY document_latest_version;
+END;
+$$ language 'plpgsql';
+
+-- SupabaseStorage only reads this view when created with
+-- latest_version_view=True; schedule a refresh before enabling that, or
+-- listings will not show changes recorded since the last refresh.
+-- Schedule a refresh every minute (requires the pg_cron extension)
+-- CREATE EXTENSION IF NOT EXISTS pg_cron;
+-- SELECT cron.schedule(
+--     'refresh-document-latest-version',
+--     '* * * * *',
+--     'SELECT refresh_document_latest_version()'
+-- );
+
+COMMENT ON MATERIALIZED VIEW document_latest_version IS 'Latest version per document; as fresh as the last refresh';
+
+
+-- =============================================================================
+-- SQLITE VERSION
+-- =============================================================================
+-- SQLite has no materialized views. SQLiteStorage.get_latest_versions() resolves
+-- latest versions with a single grouped query over idx_versions_version_number,
+-- so no migration is needed there.
+
+
+-- =============================================================================
+-- MIGRATION VERIFICATION QUERIES
+-- =============================================================================
+
+-- Check the view exists and is populated
+-- SELECT COUNT(*) FROM document_latest_version;
+
+-- Sample query: 20 most recently changed documents
+-- SELECT file_path, change_type, version_number, created_at
+-- FROM document_latest_version
+-- ORDER BY updated_at DESC
+-- LIMIT 20;
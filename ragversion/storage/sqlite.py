@@ -1,11 +1,12 @@
 """SQLite storage backend implementation."""
 
+import asyncio
 import gzip
 import json
 import sqlite3
 from datetime import datetime, timedelta
 from pathlib import Path
-from typing import List, Optional
+from typing import Any, Dict, Iterable, List, Optional, Tuple
 from uuid import UUID
 
 import aiosqlite
@@ -34,6 +35,7 @@ class SQLiteStorage(BaseStorage):
         db_path: str = "ragversion.db",
         content_compression: bool = True,
         timeout: int = 30,
+        cached_statements: int = 256,
     ):
         """
         Initialize SQLite storage.
@@ -42,10 +44,13 @@ class SQLiteStorage(BaseStorage):
             db_path: Path to SQLite database file (default: ragversion.db in current directory)
             content_compression: Whether to compress content with gzip
             timeout: Database timeout in seconds
+            cached_statements: Number of prepared statements kept per connection, so
+                repeated queries skip SQLite's parse/plan step
         """
         self.db_path = db_path
         self.content_compression = content_compression
         self.timeout = timeout
+        self.cached_statements = cached_statements
         self.db: Optional[aiosqlite.Connection] = None
 
     @classmethod
@@ -66,6 +71,7 @@ class SQLiteStorage(BaseStorage):
             self.db = await aiosqlite.connect(
                 self.db_path,
                 timeout=self.timeout,
+                cached_statements=self.cached_statements,
             )
 
             # Enable foreign keys
@@ -87,6 +93,38 @@ class SQLiteStorage(BaseStorage):
         except Exception as e:
             raise StorageError(f"Failed to initialize SQLite storage at {self.db_path}", e)
 
+    async def open_reader(self) -> "SQLiteStorage":
+        """Open an additional read-only connection to the same database.
+
+        In WAL mode readers don't block each other or the writer, so several
+        readers can serve queries in parallel. The returned storage shares this
+        instance's settings and must be closed separately. Not available for
+        ``:memory:`` databases, which are private to their connection.
+        """
+        if self.db_path == ":memory:":
+            raise StorageError("Cannot open a reader on an in-memory database")
+        reader = SQLiteStorage(
+            db_path=self.db_path,
+            content_compression=self.content_compression,
+            timeout=self.timeout,
+            cached_statements=self.cached_statements,
+        )
+        try:
+            reader.db = await aiosqlite.connect(
+                f"{Path(self.db_path).resolve().as_uri()}?mode=ro",
+                timeout=self.timeout,
+                cached_statements=self.cached_statements,
+                uri=True,
+            )
+            await reader.db.execute("PRAGMA query_only = ON")
+            await reader.db.execute("PRAGMA cache_size = -64000")
+            await reader.db.execute("PRAGMA temp_store = MEMORY")
+            await reader.db.execute("PRAGMA mmap_size = 268435456")
+        except Exception as e:
+            await reader.close()
+            raise StorageError(f"Failed to open reader on {self.db_path}", e)
+        return reader
+
     async def close(self) -> None:
         """Close database connection."""
         if self.db:
@@ -233,8 +271,14 @@ class SQLiteStorage(BaseStorage):
 
     # Document operations
 
-    async def batch_create_documents(self, documents: List[Document]) -> List[Document]:
-        """Create multiple document records in a single transaction (optimized)."""
+    async def batch_create_documents(
+        self, documents: List[Document], commit: bool = True
+    ) -> List[Document]:
+        """Create multiple document records in a single transaction (optimized).
+
+        Pass ``commit=False`` to leave the transaction open so several batches
+        can share one commit; the caller is then responsible for committing.
+        """
         if not documents:
             return []
 
@@ -269,12 +313,39 @@ class SQLiteStorage(BaseStorage):
                 """,
                 batch_data,
             )
-            await db.commit()
+            if commit:
+                await db.commit()
 
             return documents
         except Exception as e:
             raise StorageError(f"Failed to batch create {len(documents)} documents", e)
 
+    async def batch_create_documents_raw(
+        self, rows: Iterable[Tuple[Any, ...]], commit: bool = True
+    ) -> None:
+        """Insert pre-built ``documents`` rows without model validation.
+
+        Meant for bulk loading trusted data (benchmarks, migrations). Each row holds
+        ``(id, file_path, file_name, file_type, file_size, content_hash, created_at,
+        updated_at, version_count, current_version, metadata_json)`` with
+        timestamps as ISO strings.
+        """
+        try:
+            db = self._ensure_connection()
+            await db.executemany(
+                """
+                INSERT INTO documents (
+                    id, file_path, file_name, file_type, file_size, content_hash,
+                    created_at, updated_at, version_count, current_version, metadata
+                ) VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?)
+                """,
+                rows,
+            )
+            if commit:
+                await db.commit()
+        except Exception as e:
+            raise StorageError("Failed to bulk insert document rows", e)
+
     async def create_document(self, document: Document) -> Document:
         """Create a new document record."""
         try:
@@ -388,8 +459,9 @@ class SQLiteStorage(BaseStorage):
         limit: int = 100,
         offset: int = 0,
         order_by: str = "updated_at",
+        after: Optional[Tuple[Any, str]] = None,
     ) -> List[Document]:
-        """List documents with pagination."""
+        """List documents with offset or keyset pagination."""
         try:
             db = self._ensure_connection()
 
@@ -398,9 +470,18 @@ class SQLiteStorage(BaseStorage):
             if order_by not in valid_order_fields:
                 order_by = "updated_at"
 
-            query = f"SELECT * FROM documents ORDER BY {order_by} DESC LIMIT ? OFFSET ?"
+            if after is not None:
+                # Keyset pagination: seek straight to the cursor instead of skipping rows
+                query = (
+                    f"SELECT * FROM documents WHERE ({order_by}, id) < (?, ?) "
+                    f"ORDER BY {order_by} DESC, id DESC LIMIT ?"
+                )
+                params: tuple = (after[0], after[1], limit)
+            else:
+                query = f"SELECT * FROM documents ORDER BY {order_by} DESC, id DESC LIMIT ? OFFSET ?"
+                params = (limit, offset)
 
-            async with db.execute(query, (limit, offset)) as cursor:
+            async with db.execute(query, params) as cursor:
                 rows = await cursor.fetchall()
 
             return [self._row_to_document(row) for row in rows]
@@ -471,8 +552,14 @@ class SQLiteStorage(BaseStorage):
 
     # Version operations
 
-    async def batch_create_versions(self, versions: List[Version]) -> List[Version]:
-        """Create multiple version records in a single transaction (optimized)."""
+    async def batch_create_versions(
+        self, versions: List[Version], commit: bool = True
+    ) -> List[Version]:
+        """Create multiple version records in a single transaction (optimized).
+
+        Pass ``commit=False`` to leave the transaction open so several batches
+        can share one commit; the caller is then responsible for committing.
+        """
         if not versions:
             return []
 
@@ -539,11 +626,37 @@ class SQLiteStorage(BaseStorage):
                     content_batch,
                 )
 
-            await db.commit()
+            if commit:
+                await db.commit()
             return versions
         except Exception as e:
             raise StorageError(f"Failed to batch create {len(versions)} versions", e)
 
+    async def batch_create_versions_raw(
+        self, rows: Iterable[Tuple[Any, ...]], commit: bool = True
+    ) -> None:
+        """Insert pre-built ``versions`` rows without model validation.
+
+        Each row holds ``(id, document_id, version_number, content_hash, file_size,
+        change_type, created_at, created_by, metadata_json)``. Content snapshots
+        are not written.
+        """
+        try:
+            db = self._ensure_connection()
+            await db.executemany(
+                """
+                INSERT INTO versions (
+                    id, document_id, version_number, content_hash, file_size,
+                    change_type, created_at, created_by, metadata
+                ) VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?)
+                """,
+                rows,
+            )
+            if commit:
+                await db.commit()
+        except Exception as e:
+            raise StorageError("Failed to bulk insert version rows", e)
+
     async def create_version(self, version: Version) -> Version:
         """Create a new version record."""
         try:
@@ -621,19 +734,29 @@ class SQLiteStorage(BaseStorage):
         document_id: UUID,
         limit: int = 100,
         offset: int = 0,
+        after: Optional[int] = None,
     ) -> List[Version]:
         """List all versions of a document."""
         try:
             db = self._ensure_connection()
-            async with db.execute(
+            if after is not None:
+                query = """
+                    SELECT * FROM versions
+                    WHERE document_id = ? AND version_number < ?
+                    ORDER BY version_number DESC
+                    LIMIT ?
                 """
-                SELECT * FROM versions
-                WHERE document_id = ?
-                ORDER BY version_number DESC
-                LIMIT ? OFFSET ?
-                """,
-                (str(document_id), limit, offset),
-            ) as cursor:
+                params: tuple = (str(document_id), after, limit)
+            else:
+                query = """
+                    SELECT * FROM versions
+                    WHERE document_id = ?
+                    ORDER BY version_number DESC
+                    LIMIT ? OFFSET ?
+                """
+                params = (str(document_id), limit, offset)
+
+            async with db.execute(query, params) as cursor:
                 rows = await cursor.fetchall()
 
             return [self._row_to_version(row) for row in rows]
@@ -671,6 +794,34 @@ class SQLiteStorage(BaseStorage):
         except Exception as e:
             raise StorageError(f"Failed to get latest version for document {document_id}", e)
 
+    async def get_latest_versions(self, document_ids: List[UUID]) -> Dict[UUID, Version]:
+        """Get the latest version of several documents in one query."""
+        if not document_ids:
+            return {}
+        try:
+            db = self._ensure_connection()
+            placeholders = ", ".join("?" for _ in document_ids)
+            async with db.execute(
+                f"""
+                SELECT v.* FROM versions v
+                JOIN (
+                    SELECT document_id, MAX(version_number) AS version_number
+                    FROM versions
+                    WHERE document_id IN ({placeholders})
+                    GROUP BY document_id
+                ) latest
+                ON v.document_id = latest.document_id
+                AND v.version_number = latest.version_number
+                """,
+                [str(document_id) for document_id in document_ids],
+            ) as cursor:
+                rows = await cursor.fetchall()
+
+            versions = (self._row_to_version(row) for row in rows)
+            return {version.document_id: version for version in versions}
+        except Exception as e:
+            raise StorageError("Failed to get latest versions", e)
+
     # Content operations
 
     async def store_content(
@@ -726,14 +877,21 @@ class SQLiteStorage(BaseStorage):
             content_data = row[0]
             compressed = bool(row[1])
 
-            # Decompress if needed
+            # Decompress if needed, in the executor so large snapshots don't
+            # stall the event loop
             if compressed:
-                content_data = gzip.decompress(content_data)
+                loop = asyncio.get_running_loop()
+                return await loop.run_in_executor(None, self._decompress_content, content_data)
 
             return content_data.decode("utf-8")
         except Exception as e:
             raise StorageError(f"Failed to get content for version {version_id}", e)
 
+    @staticmethod
+    def _decompress_content(content_data: bytes) -> str:
+        """Decompress and decode stored content."""
+        return gzip.decompress(content_data).decode("utf-8")
+
     async def delete_content(self, version_id: UUID) -> None:
         """Delete stored content for a version."""
         try:
@@ -1077,6 +1235,16 @@ class SQLiteStorage(BaseStorage):
 
     # Statistics operations
 
+    async def count_documents(self) -> int:
+        """Count tracked documents."""
+        try:
+            db = self._ensure_connection()
+            async with db.execute("SELECT COUNT(*) FROM documents") as cursor:
+                row = await cursor.fetchone()
+            return row[0]
+        except Exception as e:
+            raise StorageError("Failed to count documents", e)
+
     async def get_statistics(self) -> StorageStatistics:
         """Get overall storage statistics."""
         try:
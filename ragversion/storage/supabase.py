@@ -1,17 +1,26 @@
 """Supabase storage backend implementation."""
 
+import asyncio
 import gzip
 import json
 import os
 from datetime import datetime, timedelta
-from typing import List, Optional
+from typing import Any, Dict, List, Optional, Tuple
 from uuid import UUID
 
-from supabase import create_client, Client
+import httpx
+from supabase import create_client, Client, ClientOptions
 from ragversion.exceptions import StorageError, DocumentNotFoundError, VersionNotFoundError
 from ragversion.models import Document, Version, DiffResult, StorageStatistics, DocumentStatistics, Chunk
 from ragversion.storage.base import BaseStorage
 
+try:
+    import h2  # noqa: F401
+
+    HTTP2_AVAILABLE = True
+except ImportError:
+    HTTP2_AVAILABLE = False
+
 
 class SupabaseStorage(BaseStorage):
     """Supabase storage backend with async support."""
@@ -22,6 +31,8 @@ class SupabaseStorage(BaseStorage):
         key: str,
         content_compression: bool = True,
         timeout: int = 30,
+        pool_size: int = 10,
+        latest_version_view: bool = False,
     ):
         """
         Initialize Supabase storage.
@@ -31,12 +42,19 @@ class SupabaseStorage(BaseStorage):
             key: Supabase service key
             content_compression: Whether to compress content with gzip
             timeout: Request timeout in seconds
+            pool_size: Maximum pooled HTTP connections kept open to Supabase
+            latest_version_view: Serve list_recent_changes from the
+                document_latest_version materialized view (migration 003). Only
+                enable this when the view is refreshed on a schedule.
         """
         self.url = url
         self.key = key
         self.content_compression = content_compression
         self.timeout = timeout
+        self.pool_size = pool_size
+        self.latest_version_view = latest_version_view
         self.client: Optional[Client] = None
+        self._http_client: Optional[httpx.Client] = None
 
     @classmethod
     def from_env(cls) -> "SupabaseStorage":
@@ -54,7 +72,25 @@ class SupabaseStorage(BaseStorage):
     async def initialize(self) -> None:
         """Initialize the Supabase client and ensure tables exist."""
         try:
-            self.client = create_client(self.url, self.key)
+            # One long-lived pooled client (HTTP/2 when h2 is installed) so every
+            # query reuses warm connections instead of paying TCP/TLS setup
+            self._http_client = httpx.Client(
+                timeout=self.timeout,
+                limits=httpx.Limits(
+                    max_connections=self.pool_size,
+                    max_keepalive_connections=self.pool_size,
+                ),
+                http2=HTTP2_AVAILABLE,
+                follow_redirects=True,
+            )
+            try:
+                options = ClientOptions(httpx_client=self._http_client)
+            except TypeError:
+                # supabase < 2.10 can't take a custom client; it pools internally
+                self._http_client.close()
+                self._http_client = None
+                options = ClientOptions(postgrest_client_timeout=self.timeout)
+            self.client = create_client(self.url, self.key, options=options)
             # Run migrations to ensure tables exist
             await self._ensure_tables()
         except Exception as e:
@@ -62,7 +98,9 @@ class SupabaseStorage(BaseStorage):
 
     async def close(self) -> None:
         """Close Supabase client connections."""
-        # Supabase Python client doesn't require explicit closing
+        if self._http_client:
+            self._http_client.close()
+            self._http_client = None
         self.client = None
 
     async def health_check(self) -> bool:
@@ -70,18 +108,24 @@ class SupabaseStorage(BaseStorage):
         try:
             if not self.client:
                 return False
-            # Try a simple query
-            self.client.table("documents").select("id").limit(1).execute()
+            # Try a simple query without blocking the event loop
+            loop = asyncio.get_running_loop()
+            await loop.run_in_executor(None, self._health_check_sync)
             return True
         except Exception:
             return False
 
+    def _health_check_sync(self) -> None:
+        """Run the cheapest possible query (synchronous)."""
+        self.client.table("documents").select("id").limit(1).execute()
+
     async def _ensure_tables(self) -> None:
         """Ensure required tables exist. Note: This assumes tables are created via Supabase migrations."""
         # In production, tables should be created via Supabase migrations
         # Required migrations:
         #   - 001_initial_schema.sql: Core documents, versions, and content_snapshots tables
         #   - 002_chunk_versioning.sql: Chunk-level versioning (v0.10.0+)
+        #   - 003_latest_version_view.sql: Latest-version materialized view (optional)
         # This is a placeholder for checking table existence
         pass
 
@@ -244,22 +288,56 @@ class SupabaseStorage(BaseStorage):
         except Exception as e:
             raise StorageError(f"Failed to delete document: {document_id}", e)
 
+    @staticmethod
+    def _quote_filter_value(value: Any) -> str:
+        """Quote a value for a PostgREST logic filter such as ``or_``.
+
+        Integers are used as-is; anything else is wrapped in double quotes with
+        ``\\`` and ``"`` backslash-escaped, so reserved characters like ``,``
+        ``.`` ``(`` and ``)`` cannot end the value early.
+        """
+        if isinstance(value, int) and not isinstance(value, bool):
+            return str(value)
+        if isinstance(value, datetime):
+            value = value.isoformat()
+        if not isinstance(value, str):
+            raise ValueError(f"Unsupported filter value: {value!r}")
+        escaped = value.replace("\\", "\\\\").replace('"', '\\"')
+        return f'"{escaped}"'
+
     async def list_documents(
         self,
         limit: int = 100,
         offset: int = 0,
         order_by: str = "updated_at",
+        after: Optional[Tuple[Any, str]] = None,
     ) -> List[Document]:
-        """List documents with pagination."""
+        """List documents with offset or keyset pagination."""
         try:
             client = self._ensure_client()
-            result = (
-                client.table("documents")
-                .select("*")
-                .order(order_by, desc=True)
-                .range(offset, offset + limit - 1)
-                .execute()
-            )
+            query = client.table("documents").select("*")
+
+            # order_by is interpolated into the keyset filter, so only allow known columns
+            valid_order_fields = ["updated_at", "created_at", "file_name", "file_size", "version_count"]
+            if order_by not in valid_order_fields:
+                order_by = "updated_at"
+
+            if after is not None:
+                value, last_id = after
+                value = self._quote_filter_value(value)
+                last_id = UUID(str(last_id))
+                query = query.or_(
+                    f"{order_by}.lt.{value},and({order_by}.eq.{value},id.lt.{last_id})"
+                )
+                query = query.order(order_by, desc=True).order("id", desc=True).limit(limit)
+            else:
+                query = (
+                    query.order(order_by, desc=True)
+                    .order("id", desc=True)
+                    .range(offset, offset + limit - 1)
+                )
+
+            result = query.execute()
 
             documents = []
             for data in result.data:
@@ -478,18 +556,23 @@ class SupabaseStorage(BaseStorage):
         document_id: UUID,
         limit: int = 100,
         offset: int = 0,
+        after: Optional[int] = None,
     ) -> List[Version]:
         """List all versions of a document."""
         try:
             client = self._ensure_client()
-            result = (
+            query = (
                 client.table("versions")
                 .select("*")
                 .eq("document_id", str(document_id))
                 .order("version_number", desc=True)
-                .range(offset, offset + limit - 1)
-                .execute()
             )
+            if after is not None:
+                query = query.lt("version_number", after).limit(limit)
+            else:
+                query = query.range(offset, offset + limit - 1)
+
+            result = query.execute()
 
             versions = []
             for data in result.data:
@@ -552,6 +635,95 @@ class SupabaseStorage(BaseStorage):
         except Exception as e:
             raise StorageError(f"Failed to get latest version for document {document_id}", e)
 
+    async def get_latest_versions(self, document_ids: List[UUID]) -> Dict[UUID, Version]:
+        """Get the latest version of several documents, one row per document.
+
+        Resolves each document's ``current_version`` first and then fetches
+        exactly those versions, so the transfer stays proportional to the number
+        of documents rather than their history and never hits the max-rows cap.
+        """
+        if not document_ids:
+            return {}
+        try:
+            client = self._ensure_client()
+            latest = {}
+            # Batches keep the filter URLs short and each response well under max-rows
+            batch_size = 100
+            for start in range(0, len(document_ids), batch_size):
+                batch = [str(document_id) for document_id in document_ids[start:start + batch_size]]
+                docs = (
+                    client.table("documents")
+                    .select("id,current_version")
+                    .in_("id", batch)
+                    .execute()
+                )
+                if not docs.data:
+                    continue
+
+                pairs = ",".join(
+                    f"and(document_id.eq.{doc['id']},version_number.eq.{int(doc['current_version'])})"
+                    for doc in docs.data
+                )
+                result = client.table("versions").select("*").or_(pairs).execute()
+
+                for data in result.data:
+                    document_id = UUID(data["document_id"])
+                    latest[document_id] = Version(
+                        id=UUID(data["id"]),
+                        document_id=document_id,
+                        version_number=data["version_number"],
+                        content_hash=data["content_hash"],
+                        file_size=data["file_size"],
+                        change_type=data["change_type"],
+                        created_at=datetime.fromisoformat(data["created_at"]),
+                        created_by=data.get("created_by"),
+                        metadata=json.loads(data["metadata"]) if data.get("metadata") else {},
+                    )
+            return latest
+        except Exception as e:
+            raise StorageError("Failed to get latest versions", e)
+
+    async def list_recent_changes(
+        self, limit: int = 20, path_suffix: Optional[str] = None
+    ) -> List[Dict[str, Any]]:
+        """List the latest version of the most recently updated documents.
+
+        With ``latest_version_view`` enabled this reads the
+        ``document_latest_version`` materialized view from migration
+        ``003_latest_version_view.sql`` in a single request, so results are as
+        fresh as the view's last refresh. Otherwise, or if the view cannot be
+        read, versions are resolved from the base tables.
+        """
+        if not self.latest_version_view:
+            return await super().list_recent_changes(limit=limit, path_suffix=path_suffix)
+
+        try:
+            client = self._ensure_client()
+            query = client.table("document_latest_version").select("*")
+            if path_suffix:
+                # Match the suffix literally: LIKE treats % and _ as wildcards
+                escaped = (
+                    path_suffix.replace("\\", "\\\\")
+                    .replace("%", "\\%")
+                    .replace("_", "\\_")
+                )
+                query = query.like("file_path", f"%{escaped}")
+            result = query.order("updated_at", desc=True).limit(limit).execute()
+        except Exception:
+            # View missing (migration not applied) or unreadable
+            return await super().list_recent_changes(limit=limit, path_suffix=path_suffix)
+
+        return [
+            {
+                **data,
+                "document_id": UUID(data["document_id"]),
+                "version_id": UUID(data["version_id"]),
+                "updated_at": datetime.fromisoformat(data["updated_at"]),
+                "created_at": datetime.fromisoformat(data["created_at"]),
+            }
+            for data in result.data
+        ]
+
     # Content operations
 
     async def store_content(
@@ -583,27 +755,34 @@ class SupabaseStorage(BaseStorage):
     async def get_content(self, version_id: UUID) -> Optional[str]:
         """Retrieve version content (automatically decompressed)."""
         try:
-            client = self._ensure_client()
-            result = (
-                client.table("content_snapshots")
-                .select("*")
-                .eq("version_id", str(version_id))
-                .execute()
-            )
+            # The client is synchronous: fetch and decode large snapshots in the
+            # executor so concurrent work on the event loop can proceed
+            loop = asyncio.get_running_loop()
+            return await loop.run_in_executor(None, self._get_content_sync, version_id)
+        except Exception as e:
+            raise StorageError(f"Failed to get content for version {version_id}", e)
 
-            if not result.data:
-                return None
+    def _get_content_sync(self, version_id: UUID) -> Optional[str]:
+        """Synchronous content fetch and decode."""
+        client = self._ensure_client()
+        result = (
+            client.table("content_snapshots")
+            .select("*")
+            .eq("version_id", str(version_id))
+            .execute()
+        )
 
-            data = result.data[0]
-            content_data = bytes.fromhex(data["content"])
+        if not result.data:
+            return None
 
-            # Decompress if needed
-            if data.get("compressed", False):
-                content_data = gzip.decompress(content_data)
+        data = result.data[0]
+        content_data = bytes.fromhex(data["content"])
 
-            return content_data.decode("utf-8")
-        except Exception as e:
-            raise StorageError(f"Failed to get content for version {version_id}", e)
+        # Decompress if needed
+        if data.get("compressed", False):
+            content_data = gzip.decompress(content_data)
+
+        return content_data.decode("utf-8")
 
     async def delete_content(self, version_id: UUID) -> None:
         """Delete stored content for a version."""
@@ -930,6 +1109,15 @@ class SupabaseStorage(BaseStorage):
 
     # Statistics operations
 
+    async def count_documents(self) -> int:
+        """Count tracked documents without fetching them."""
+        try:
+            client = self._ensure_client()
+            result = client.table("documents").select("id", count="exact").limit(1).execute()
+            return result.count or 0
+        except Exception as e:
+            raise StorageError("Failed to count documents", e)
+
     async def get_statistics(self) -> StorageStatistics:
         """Get overall storage statistics."""
         try:
@@ -1,7 +1,7 @@
 """Mock storage backend for testing."""
 
 from datetime import datetime, timedelta
-from typing import Dict, List, Optional
+from typing import Any, Dict, List, Optional, Tuple
 from uuid import UUID
 
 from ragversion.exceptions import DocumentNotFoundError, VersionNotFoundError
@@ -73,17 +73,24 @@ class MockStorage(BaseStorage):
         limit: int = 100,
         offset: int = 0,
         order_by: str = "updated_at",
+        after: Optional[Tuple[Any, str]] = None,
     ) -> List[Document]:
         """List documents."""
         docs = list(self.documents.values())
 
         # Sort
-        if order_by == "updated_at":
-            docs.sort(key=lambda d: d.updated_at, reverse=True)
-        elif order_by == "created_at":
-            docs.sort(key=lambda d: d.created_at, reverse=True)
+        if order_by not in ("updated_at", "created_at", "file_name", "file_size", "version_count"):
+            order_by = "updated_at"
+
+        def sort_key(d: Document) -> tuple:
+            value = getattr(d, order_by)
+            return (value.isoformat() if isinstance(value, datetime) else value, str(d.id))
+
+        docs.sort(key=sort_key, reverse=True)
 
         # Paginate
+        if after is not None:
+            return [d for d in docs if sort_key(d) < tuple(after)][:limit]
         return docs[offset : offset + limit]
 
     async def search_documents(
@@ -139,10 +146,13 @@ class MockStorage(BaseStorage):
         document_id: UUID,
         limit: int = 100,
         offset: int = 0,
+        after: Optional[int] = None,
     ) -> List[Version]:
         """List versions."""
         versions = [v for v in self.versions.values() if v.document_id == document_id]
         versions.sort(key=lambda v: v.version_number, reverse=True)
+        if after is not None:
+            return [v for v in versions if v.version_number < after][:limit]
         return versions[offset : offset + limit]
 
     async def delete_version(self, version_id: UUID) -> None:
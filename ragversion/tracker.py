@@ -1,11 +1,13 @@
 """Core AsyncVersionTracker implementation."""
 
 import asyncio
+import fnmatch
 import inspect
 import logging
+import re
 from datetime import datetime
 from pathlib import Path
-from typing import Any, Awaitable, Callable, Dict, List, Optional, Union, TYPE_CHECKING
+from typing import Any, AsyncIterator, Awaitable, Callable, Dict, List, Optional, Tuple, Union, TYPE_CHECKING
 from uuid import UUID
 
 from ragversion.detector import ChangeDetector
@@ -57,7 +59,7 @@ class AsyncVersionTracker:
             storage: Storage backend
             store_content: Whether to store full content
             max_file_size_mb: Maximum file size to process
-            hash_algorithm: Hash algorithm to use
+            hash_algorithm: Hash algorithm to use (sha256, sha1, md5, or blake3)
             callback_timeout: Timeout for callbacks in seconds
             notification_manager: Optional notification manager
             chunk_tracking_enabled: Enable chunk-level tracking (v0.10.0)
@@ -409,28 +411,7 @@ class AsyncVersionTracker:
             >>> result = await tracker.track_directory("./data")
         """
         self._ensure_initialized()
-
-        # Validate directory path
-        dir_path_obj = Path(dir_path)
-        if not dir_path_obj.exists():
-            raise FileNotFoundError(
-                f"Directory not found: {dir_path}\n\n"
-                f"Troubleshooting:\n"
-                f"  • Check path is correct: {dir_path_obj.absolute()}\n"
-                f"  • Create directory: mkdir -p {dir_path}"
-            )
-
-        if not dir_path_obj.is_dir():
-            raise ValueError(
-                f"Path is not a directory: {dir_path}\n\n"
-                f"Use tracker.track() for single files"
-            )
-
-        # Validate patterns syntax
-        if patterns:
-            for pattern in patterns:
-                if not pattern:
-                    raise ValueError("Empty pattern in list")
+        self._validate_directory(dir_path, patterns)
 
         started_at = datetime.utcnow()
         successful: List[ChangeEvent] = []
@@ -449,40 +430,8 @@ class AsyncVersionTracker:
                     result = await self.track(file_path, metadata)
                     if result.changed and result.event:
                         successful.append(result.event)
-                except ParsingError as e:
-                    error = FileProcessingError(
-                        file_path=file_path,
-                        error=str(e),
-                        error_type="parsing",
-                        exception_type=type(e.original_error).__name__,
-                    )
-                    failed.append(error)
-                    logger.error(f"Parsing error for {file_path}: {e}")
-
-                    if on_error == "stop":
-                        raise
-                except StorageError as e:
-                    error = FileProcessingError(
-                        file_path=file_path,
-                        error=str(e),
-                        error_type="storage",
-                        exception_type=type(e.original_error).__name__ if e.original_error else "StorageError",
-                    )
-                    failed.append(error)
-                    logger.error(f"Storage error for {file_path}: {e}")
-
-                    if on_error == "stop":
-                        raise
                 except Exception as e:
-                    error = FileProcessingError(
-                        file_path=file_path,
-                        error=str(e),
-                        error_type="unknown",
-                        exception_type=type(e).__name__,
-                    )
-                    failed.append(error)
-                    logger.error(f"Unknown error for {file_path}: {e}")
-
+                    failed.append(self._processing_error(file_path, e))
                     if on_error == "stop":
                         raise
 
@@ -507,6 +456,117 @@ class AsyncVersionTracker:
             completed_at=completed_at,
         )
 
+    async def track_directory_stream(
+        self,
+        dir_path: str,
+        patterns: Optional[List[str]] = None,
+        recursive: bool = True,
+        max_workers: int = 4,
+        metadata: Optional[Dict[str, Any]] = None,
+    ) -> AsyncIterator[Union[TrackResult, FileProcessingError]]:
+        """
+        Track all files in a directory, yielding each result as it completes.
+
+        Streaming counterpart of :meth:`track_directory`: instead of collecting
+        every event into one BatchResult, results are yielded as soon as each
+        file finishes, so memory stays bounded by ``max_workers`` rather than
+        the number of files.
+
+        Args:
+            dir_path: Path to directory to track
+            patterns: Glob patterns for files to include (default: all files)
+            recursive: Whether to search subdirectories
+            max_workers: Number of parallel workers (default: 4)
+            metadata: Optional metadata to attach to all files
+
+        Yields:
+            A TrackResult for every file (changed or not), or a
+            FileProcessingError for files that failed
+
+        Examples:
+            >>> async for item in tracker.track_directory_stream("./docs", patterns=["*.md"]):
+            ...     if isinstance(item, FileProcessingError):
+            ...         print(f"Failed: {item.file_path}")
+            ...     elif item.changed:
+            ...         print(f"Changed: {item.file_path}")
+        """
+        self._ensure_initialized()
+        self._validate_directory(dir_path, patterns)
+
+        files = iter(self._find_files(dir_path, patterns, recursive))
+        results: asyncio.Queue = asyncio.Queue(maxsize=max_workers)
+        done = object()
+
+        async def worker() -> None:
+            # Workers share one iterator, so each file is picked up exactly once
+            for file_path in files:
+                try:
+                    item = await self.track(file_path, metadata)
+                except Exception as e:
+                    item = self._processing_error(file_path, e)
+                await results.put(item)
+            await results.put(done)
+
+        workers = [asyncio.create_task(worker()) for _ in range(max(1, max_workers))]
+        try:
+            remaining = len(workers)
+            while remaining:
+                item = await results.get()
+                if item is done:
+                    remaining -= 1
+                else:
+                    yield item
+        finally:
+            for task in workers:
+                task.cancel()
+
+    def _validate_directory(self, dir_path: str, patterns: Optional[List[str]]) -> None:
+        """Raise if ``dir_path`` is not an existing directory or a pattern is empty."""
+        dir_path_obj = Path(dir_path)
+        if not dir_path_obj.exists():
+            raise FileNotFoundError(
+                f"Directory not found: {dir_path}\n\n"
+                f"Troubleshooting:\n"
+                f"  • Check path is correct: {dir_path_obj.absolute()}\n"
+                f"  • Create directory: mkdir -p {dir_path}"
+            )
+
+        if not dir_path_obj.is_dir():
+            raise ValueError(
+                f"Path is not a directory: {dir_path}\n\n"
+                f"Use tracker.track() for single files"
+            )
+
+        # Validate patterns syntax
+        if patterns:
+            for pattern in patterns:
+                if not pattern:
+                    raise ValueError("Empty pattern in list")
+
+    def _processing_error(self, file_path: str, error: Exception) -> FileProcessingError:
+        """Describe a failed file, classifying the error and logging it."""
+        if isinstance(error, ParsingError):
+            error_type = "parsing"
+            exception_type = type(error.original_error).__name__
+        elif isinstance(error, StorageError):
+            error_type = "storage"
+            exception_type = (
+                type(error.original_error).__name__ if error.original_error else "StorageError"
+            )
+        else:
+            error_type = "unknown"
+            exception_type = type(error).__name__
+
+        label = "Unknown" if error_type == "unknown" else error_type.capitalize()
+        logger.error(f"{label} error for {file_path}: {error}")
+
+        return FileProcessingError(
+            file_path=file_path,
+            error=str(error),
+            error_type=error_type,
+            exception_type=exception_type,
+        )
+
     def _find_files(
         self,
         dir_path: str,
@@ -519,16 +579,22 @@ class AsyncVersionTracker:
         if not path.exists() or not path.is_dir():
             return []
 
-        files = []
+        patterns = patterns or ["*"]
+        walk = path.rglob if recursive else path.glob
 
-        if recursive:
-            for pattern in patterns or ["*"]:
-                files.extend([str(p) for p in path.rglob(pattern) if p.is_file()])
-        else:
-            for pattern in patterns or ["*"]:
-                files.extend([str(p) for p in path.glob(pattern) if p.is_file()])
+        # Plain file-name patterns: walk the tree once and test each name against
+        # one precompiled regex, instead of one full walk per pattern
+        if not any("/" in pattern for pattern in patterns):
+            name_regex = re.compile("|".join(fnmatch.translate(p) for p in patterns))
+            return [str(p) for p in walk("*") if name_regex.match(p.name) and p.is_file()]
 
-        return files
+        # Path patterns (e.g. "data/*.json", "**/*.py") keep pathlib's glob semantics
+        files: Dict[str, None] = {}
+        for pattern in patterns:
+            for p in walk(pattern):
+                if p.is_file():
+                    files[str(p)] = None
+        return list(files)
 
     # Document queries
 
@@ -547,10 +613,11 @@ class AsyncVersionTracker:
         limit: int = 100,
         offset: int = 0,
         order_by: str = "updated_at",
+        after: Optional[Tuple[Any, str]] = None,
     ) -> List[Document]:
-        """List documents with pagination."""
+        """List documents with offset or keyset (``after``) pagination."""
         self._ensure_initialized()
-        return await self.storage.list_documents(limit, offset, order_by)
+        return await self.storage.list_documents(limit, offset, order_by, after=after)
 
     async def search_documents(
         self,
@@ -585,10 +652,11 @@ class AsyncVersionTracker:
         document_id: UUID,
         limit: int = 100,
         offset: int = 0,
+        after: Optional[int] = None,
     ) -> List[Version]:
-        """List all versions of a document."""
+        """List all versions of a document with offset or keyset (``after``) pagination."""
         self._ensure_initialized()
-        return await self.storage.list_versions(document_id, limit, offset)
+        return await self.storage.list_versions(document_id, limit, offset, after=after)
 
     async def get_latest_version(self, document_id: UUID) -> Optional[Version]:
         """Get the latest version of a document."""
@@ -0,0 +1,280 @@
+"""Unit tests for REST API endpoints, using a mocked tracker."""
+
+import json
+import pytest
+from uuid import uuid4
+from unittest.mock import AsyncMock, MagicMock
+
+from fastapi.testclient import TestClient
+
+from ragversion.api.app import create_app
+from ragversion.api.config import APIConfig
+from ragversion.api.pagination import encode_cursor
+from ragversion.models import (
+    ChangeEvent,
+    ChangeType,
+    DiffResult,
+    Document,
+    FileProcessingError,
+    TrackResult,
+    Version,
+)
+
+
+def make_document(**overrides) -> Document:
+    """Build a document with sensible defaults."""
+    fields = dict(
+        file_path="/docs/guide.md",
+        file_name="guide.md",
+        file_type="md",
+        file_size=120,
+        content_hash="abc",
+        version_count=3,
+        current_version=3,
+    )
+    fields.update(overrides)
+    return Document(**fields)
+
+
+def make_version(document_id, number: int) -> Version:
+    """Build version ``number`` of a document."""
+    return Version(
+        document_id=document_id,
+        version_number=number,
+        content_hash=f"hash{number}",
+        file_size=100 + number,
+        change_type=ChangeType.MODIFIED,
+    )
+
+
+def make_event(file_path: str) -> ChangeEvent:
+    """Build a created event for ``file_path``."""
+    return ChangeEvent(
+        document_id=uuid4(),
+        version_id=uuid4(),
+        file_path=file_path,
+        file_name=file_path.rsplit("/", 1)[-1],
+        change_type=ChangeType.CREATED,
+        version_number=1,
+        content_hash="abc",
+        file_size=10,
+    )
+
+
+@pytest.fixture
+def tracker():
+    """Tracker double with the lifecycle hooks the app calls."""
+    tracker = MagicMock()
+    tracker.initialize = AsyncMock()
+    tracker.close = AsyncMock()
+    return tracker
+
+
+@pytest.fixture
+def client(tracker):
+    """Test client for an app wired to the mocked tracker."""
+    app = create_app(tracker, APIConfig(_env_file=None))
+    with TestClient(app) as client:
+        yield client
+
+
+# ============================================================================
+# Document Pagination Tests
+# ============================================================================
+
+
+def test_list_documents_returns_cursor_for_full_page(client, tracker):
+    """Test a full page carries a cursor and the last page does not."""
+    docs = [make_document(file_path=f"/docs/{i}.md") for i in range(2)]
+    tracker.list_documents = AsyncMock(return_value=docs)
+
+    first = client.get("/api/documents", params={"limit": 2})
+    assert first.status_code == 200
+    cursor = first.json()["next_cursor"]
+    assert cursor == encode_cursor(docs[-1].updated_at, docs[-1].id)
+
+    tracker.list_documents = AsyncMock(return_value=docs[:1])
+    last = client.get("/api/documents", params={"limit": 2, "cursor": cursor})
+    assert last.status_code == 200
+    assert last.json()["next_cursor"] is None
+    args, kwargs = tracker.list_documents.call_args
+    assert kwargs["after"] == (docs[-1].updated_at.isoformat(), str(docs[-1].id))
+
+
+@pytest.mark.parametrize(
+    "order_by,cursor",
+    [
+        ("updated_at", "not-a-cursor"),
+        ("updated_at", encode_cursor("not-a-date", uuid4())),
+        ("updated_at", encode_cursor("2026-01-01T00:00:00", 'x",id.gt.0')),
+        ("file_size", encode_cursor("100", uuid4())),
+        ("file_name", encode_cursor(5, uuid4())),
+    ],
+)
+def test_list_documents_rejects_bad_cursor(client, tracker, order_by, cursor):
+    """Test malformed or mistyped cursors return 400 without touching storage."""
+    tracker.list_documents = AsyncMock(return_value=[])
+
+    response = client.get("/api/documents", params={"cursor": cursor, "order_by": order_by})
+
+    assert response.status_code == 400
+    tracker.list_documents.assert_not_called()
+
+
+def test_list_versions_rejects_bad_cursor(client, tracker):
+    """Test a non-integer version cursor returns 400."""
+    tracker.list_versions = AsyncMock(return_value=[])
+
+    response = client.get(
+        f"/api/versions/document/{uuid4()}", params={"cursor": encode_cursor("3")}
+    )
+
+    assert response.status_code == 400
+    tracker.list_versions.assert_not_called()
+
+
+# ============================================================================
+# Document Detail Tests
+# ============================================================================
+
+
+def test_document_detail_includes_versions_and_diff(client, tracker):
+    """Test /detail returns versions and the diff between the newest two."""
+    doc = make_document()
+    versions = [make_version(doc.id, n) for n in (3, 2, 1)]
+    tracker.get_document = AsyncMock(return_value=doc)
+    tracker.list_versions = AsyncMock(return_value=versions)
+    tracker.get_diff = AsyncMock(
+        return_value=DiffResult(
+            document_id=doc.id,
+            from_version=2,
+            to_version=3,
+            diff_text="-a\n+b",
+            additions=1,
+            deletions=1,
+            from_hash="hash2",
+            to_hash="hash3",
+        )
+    )
+
+    response = client.get(f"/api/documents/{doc.id}/detail", params={"version_limit": 2})
+
+    assert response.status_code == 200
+    body = response.json()
+    assert body["document"]["id"] == str(doc.id)
+    assert [v["version_number"] for v in body["versions"]] == [3, 2]
+    assert body["latest_diff"]["from_version"] == 2
+    assert body["latest_diff"]["to_version"] == 3
+    tracker.get_diff.assert_awaited_once_with(doc.id, 2, 3)
+
+
+def test_document_detail_without_extras(client, tracker):
+    """Test include= with no extras skips the version and diff lookups."""
+    doc = make_document()
+    tracker.get_document = AsyncMock(return_value=doc)
+    tracker.list_versions = AsyncMock()
+
+    response = client.get(f"/api/documents/{doc.id}/detail", params={"include": ""})
+
+    assert response.status_code == 200
+    assert response.json()["versions"] is None
+    tracker.list_versions.assert_not_called()
+
+
+def test_document_detail_not_found(client, tracker):
+    """Test /detail returns 404 for an unknown document."""
+    tracker.get_document = AsyncMock(return_value=None)
+    tracker.list_versions = AsyncMock(return_value=[])
+
+    response = client.get(f"/api/documents/{uuid4()}/detail")
+
+    assert response.status_code == 404
+
+
+# ============================================================================
+# Batch Tracking Tests
+# ============================================================================
+
+
+def test_track_files_reports_status_per_item(client, tracker):
+    """Test /track/files isolates per-item outcomes."""
+    event = make_event("/docs/new.md")
+
+    async def track(file_path, metadata=None):
+        if file_path == "/docs/new.md":
+            return TrackResult(
+                changed=True, event=event, file_path=file_path, was_tracked=False, version_number=1
+            )
+        if file_path == "/docs/same.md":
+            return TrackResult(
+                changed=False, file_path=file_path, was_tracked=True, version_number=2
+            )
+        if file_path == "/docs/missing.md":
+            raise FileNotFoundError(file_path)
+        raise RuntimeError("boom")
+
+    tracker.track = AsyncMock(side_effect=track)
+
+    paths = ["/docs/new.md", "/docs/same.md", "/docs/missing.md", "/docs/broken.md"]
+    response = client.post(
+        "/api/track/files", json={"items": [{"file_path": p} for p in paths]}
+    )
+
+    assert response.status_code == 200
+    results = response.json()
+    assert [r["file_path"] for r in results] == paths
+    assert [r["status"] for r in results] == [200, 204, 404, 500]
+    assert results[0]["event"]["document_id"] == str(event.document_id)
+    assert results[3]["error"] == "boom"
+
+
+# ============================================================================
+# Streaming Directory Tracking Tests
+# ============================================================================
+
+
+def test_track_directory_stream_emits_ndjson(client, tracker):
+    """Test /track/directory/stream emits events, errors and a summary line."""
+    event = make_event("/docs/a.md")
+
+    async def stream(dir_path, **kwargs):
+        yield TrackResult(
+            changed=True, event=event, file_path="/docs/a.md", was_tracked=False, version_number=1
+        )
+        yield TrackResult(
+            changed=False, file_path="/docs/b.md", was_tracked=True, version_number=1
+        )
+        yield FileProcessingError(
+            file_path="/docs/c.md",
+            error="bad",
+            error_type="parsing",
+            exception_type="ParsingError",
+        )
+
+    tracker.track_directory_stream = stream
+
+    response = client.post("/api/track/directory/stream", json={"dir_path": "/docs"})
+
+    assert response.status_code == 200
+    assert response.headers["content-type"].startswith("application/x-ndjson")
+    lines = [json.loads(line) for line in response.text.splitlines()]
+    assert [line["_type"] for line in lines] == ["event", "error", "summary"]
+    assert lines[0]["file_path"] == "/docs/a.md"
+    assert lines[1]["file_path"] == "/docs/c.md"
+    assert lines[2]["total_files"] == 3
+    assert lines[2]["changed"] == 1
+    assert lines[2]["failed"] == 1
+
+
+def test_track_directory_stream_missing_directory(client, tracker):
+    """Test a missing directory is a plain 404 rather than a broken stream."""
+
+    async def stream(dir_path, **kwargs):
+        raise FileNotFoundError(dir_path)
+        yield  # pragma: no cover
+
+    tracker.track_directory_stream = stream
+
+    response = client.post("/api/track/directory/stream", json={"dir_path": "/nope"})
+
+    assert response.status_code == 404
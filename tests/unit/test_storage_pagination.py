@@ -0,0 +1,220 @@
+"""Unit tests for keyset pagination and batched lookups in the storage API."""
+
+import pytest
+from datetime import datetime, timedelta
+from uuid import uuid4
+
+from fastapi import HTTPException
+
+from ragversion.api.pagination import decode_cursor, encode_cursor
+from ragversion.models import ChangeType, Document, Version
+from ragversion.storage.sqlite import SQLiteStorage
+from ragversion.storage.supabase import SupabaseStorage
+
+
+SORTABLE_FIELDS = ("updated_at", "created_at", "file_name", "file_size", "version_count")
+
+
+@pytest.fixture
+async def storage(tmp_path):
+    """SQLite storage backed by a temporary database."""
+    storage = SQLiteStorage(db_path=str(tmp_path / "test.db"))
+    await storage.initialize()
+    yield storage
+    await storage.close()
+
+
+@pytest.fixture
+async def documents(storage):
+    """Seven documents whose sort columns tie in pairs and triples."""
+    base = datetime(2026, 1, 1, 12, 0, 0)
+    docs = []
+    for i in range(7):
+        # i // 3 gives groups of three rows sharing every sortable value
+        group = i // 3
+        doc = Document(
+            file_path=f"/docs/file_{i}.txt",
+            file_name=f"file_{group}.txt",
+            file_type="txt",
+            file_size=100 * group,
+            content_hash=f"hash{i}",
+            created_at=base + timedelta(minutes=group),
+            updated_at=base + timedelta(minutes=group),
+            version_count=group + 1,
+            current_version=group + 1,
+        )
+        docs.append(await storage.create_document(doc))
+    return docs
+
+
+async def _page_through(storage, order_by, limit):
+    """Walk list_documents with API-style cursors, returning each page."""
+    pages = []
+    after = None
+    while True:
+        page = await storage.list_documents(limit=limit, order_by=order_by, after=after)
+        pages.append(page)
+        if len(page) < limit:
+            return pages
+        last = page[-1]
+        # Round-trip through the opaque cursor exactly as the API does
+        cursor = encode_cursor(getattr(last, order_by), last.id)
+        after = tuple(decode_cursor(cursor, 2))
+
+
+# ============================================================================
+# Cursor Tests
+# ============================================================================
+
+
+def test_cursor_round_trip():
+    """Test encode_cursor/decode_cursor preserve the keyset values."""
+    doc_id = uuid4()
+    timestamp = datetime(2026, 1, 1, 12, 30, 15, 123456)
+
+    values = decode_cursor(encode_cursor(timestamp, doc_id), 2)
+
+    assert values == [timestamp.isoformat(), str(doc_id)]
+    assert decode_cursor(encode_cursor(42), 1) == [42]
+    assert decode_cursor(encode_cursor("a,b\"c)"), 1) == ["a,b\"c)"]
+
+
+@pytest.mark.parametrize("cursor", ["not-base64!", "bm90IGpzb24", encode_cursor(1, 2, 3)])
+def test_decode_cursor_rejects_malformed(cursor):
+    """Test malformed cursors raise a 400."""
+    with pytest.raises(HTTPException) as exc_info:
+        decode_cursor(cursor, 2)
+
+    assert exc_info.value.status_code == 400
+
+
+def test_quote_filter_value_escapes_reserved_characters():
+    """Test PostgREST filter values can't break out of their quotes."""
+    quote = SupabaseStorage._quote_filter_value
+
+    assert quote(5) == "5"
+    assert quote("2026-01-01T00:00:00") == '"2026-01-01T00:00:00"'
+    assert quote('a",id.gt.0)') == '"a\\",id.gt.0)"'
+    assert quote("back\\slash") == '"back\\\\slash"'
+    with pytest.raises(ValueError):
+        quote(["not", "scalar"])
+
+
+# ============================================================================
+# list_documents / list_versions Tests
+# ============================================================================
+
+
+@pytest.mark.asyncio
+@pytest.mark.parametrize("order_by", SORTABLE_FIELDS)
+async def test_list_documents_keyset_across_ties(storage, documents, order_by):
+    """Test keyset pages match offset order without skipping tied rows."""
+    expected = await storage.list_documents(limit=100, order_by=order_by)
+
+    pages = await _page_through(storage, order_by, limit=2)
+
+    seen = [doc.id for page in pages for doc in page]
+    assert seen == [doc.id for doc in expected]
+    assert len(set(seen)) == len(documents)
+
+
+@pytest.mark.asyncio
+async def test_list_documents_last_page(storage, documents):
+    """Test the page after the last row is empty and the last page is short."""
+    pages = await _page_through(storage, "updated_at", limit=3)
+
+    assert [len(page) for page in pages] == [3, 3, 1]
+
+    last = pages[-1][-1]
+    after = (last.updated_at.isoformat(), str(last.id))
+    assert await storage.list_documents(limit=3, after=after) == []
+
+
+@pytest.mark.asyncio
+async def test_list_versions_keyset(storage, documents):
+    """Test list_versions pages newest first with after=version_number."""
+    doc = documents[0]
+    for number in range(1, 6):
+        await storage.create_version(
+            Version(
+                document_id=doc.id,
+                version_number=number,
+                content_hash=f"v{number}",
+                file_size=number,
+                change_type=ChangeType.MODIFIED,
+            )
+        )
+
+    first = await storage.list_versions(doc.id, limit=2)
+    second = await storage.list_versions(doc.id, limit=2, after=first[-1].version_number)
+    last = await storage.list_versions(doc.id, limit=2, after=second[-1].version_number)
+
+    assert [v.version_number for v in first] == [5, 4]
+    assert [v.version_number for v in second] == [3, 2]
+    assert [v.version_number for v in last] == [1]
+
+
+# ============================================================================
+# get_latest_versions / count_documents Tests
+# ============================================================================
+
+
+@pytest.mark.asyncio
+async def test_get_latest_versions(storage, documents):
+    """Test one latest version per document, skipping unversioned documents."""
+    versioned = documents[:3]
+    for count, doc in enumerate(versioned, start=1):
+        for number in range(1, count + 1):
+            await storage.create_version(
+                Version(
+                    document_id=doc.id,
+                    version_number=number,
+                    content_hash=f"{doc.id}-{number}",
+                    file_size=number,
+                    change_type=ChangeType.MODIFIED,
+                )
+            )
+
+    latest = await storage.get_latest_versions([doc.id for doc in documents])
+
+    assert set(latest) == {doc.id for doc in versioned}
+    for count, doc in enumerate(versioned, start=1):
+        assert latest[doc.id].version_number == count
+    assert await storage.get_latest_versions([]) == {}
+
+
+@pytest.mark.asyncio
+async def test_list_recent_changes(storage, documents):
+    """Test recent changes pair each versioned document with its latest version."""
+    versioned = documents[:2]
+    for doc in versioned:
+        await storage.create_version(
+            Version(
+                document_id=doc.id,
+                version_number=1,
+                content_hash=f"{doc.id}-1",
+                file_size=1,
+                change_type=ChangeType.CREATED,
+            )
+        )
+
+    rows = await storage.list_recent_changes(limit=len(documents))
+
+    assert {row["document_id"] for row in rows} == {doc.id for doc in versioned}
+    for row in rows:
+        assert row["version_number"] == 1
+        assert row["change_type"] == ChangeType.CREATED.value
+
+    assert await storage.list_recent_changes(path_suffix="_0.txt") == [
+        row for row in rows if row["file_path"].endswith("_0.txt")
+    ]
+
+
+@pytest.mark.asyncio
+async def test_count_documents(storage, documents):
+    """Test count_documents matches the number of stored documents."""
+    assert await storage.count_documents() == len(documents)
+
+    await storage.delete_document(documents[0].id)
+
+    assert await storage.count_documents() == len(documents) - 1